@@ -12,10 +12,10 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Iterator, Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdapterResult:
     """Minimal adapter output container.
 
@@ -37,11 +37,23 @@ class TedEformsAdapter:
         """Transform source records into CEP/CEE artifacts.
 
         This method must be deterministic for a given input set and configuration.
+        It materializes iter_envelopes(); streaming callers should use that directly.
         """
-        envelopes: list[Mapping[str, Any]] = []
+        envelopes: list[Mapping[str, Any]] = list(self.iter_envelopes(records))
         observations: list[Mapping[str, Any]] = []
         explanations: list[Mapping[str, Any]] = []
 
+        return AdapterResult(
+            envelopes=envelopes, observations=observations, explanations=explanations
+        )
+
+    def iter_envelopes(self, records: Iterable[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+        """Lazily transform source records into envelopes, one record at a time.
+
+        Memory use is independent of input size, so dumps larger than RAM can be
+        streamed to writers or hashers.
+        """
+        adapter_id = self.adapter_id
         for record in records:
             # 1) Parse raw record -> internal fields (keep raw values for provenance)
             parsed = record
@@ -50,16 +62,8 @@ class TedEformsAdapter:
             normalized = parsed
 
             # 3) Identify (call core SNFEI/identity service when wired)
-            identity = {"adapterId": self.adapter_id}
+            # A fresh dict per envelope, so callers may mutate one without the others.
+            identity = {"adapterId": adapter_id}
 
             # 4) Map to CEP/CEE shapes (use mapping helpers)
-            envelope = {
-                "adapterId": self.adapter_id,
-                "identity": identity,
-                "payload": normalized,
-            }
-            envelopes.append(envelope)
-
-        return AdapterResult(
-            envelopes=envelopes, observations=observations, explanations=explanations
-        )
+            yield {"adapterId": adapter_id, "identity": identity, "payload": normalized}
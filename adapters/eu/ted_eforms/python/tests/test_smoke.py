@@ -10,3 +10,21 @@ def test_smoke_adapt_records_returns_result():
     assert isinstance(result.envelopes, list)
     assert len(result.envelopes) == 1
     assert result.envelopes[0]["adapterId"] == "eu/ted_eforms"
+
+
+def test_iter_envelopes_is_lazy_and_matches_adapt_records():
+    """iter_envelopes streams the same envelopes adapt_records returns."""
+    adapter = TedEformsAdapter()
+    records = [{"notice_id": "N1"}, {"notice_id": "N2"}]
+    it = adapter.iter_envelopes(iter(records))
+    assert next(it)["payload"] == {"notice_id": "N1"}
+    assert list(adapter.iter_envelopes(records)) == adapter.adapt_records(records).envelopes
+
+
+def test_envelopes_do_not_share_identity_dicts():
+    """Mutating one envelope's identity leaves the others (and later runs) alone."""
+    adapter = TedEformsAdapter()
+    first, second = adapter.iter_envelopes([{"notice_id": "N1"}, {"notice_id": "N2"}])
+    first["identity"]["snfei"] = "x"
+    assert "snfei" not in second["identity"]
+    assert next(adapter.iter_envelopes([{}]))["identity"] == {"adapterId": "eu/ted_eforms"}
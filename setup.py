@@ -0,0 +1,39 @@
+# setup.py
+"""Optional build hook: mypyc-compile hot pure-Python modules.
+
+All project metadata lives in pyproject.toml. This file only adds native
+extensions when explicitly requested; default builds stay pure Python.
+
+To build compiled modules (requires mypy in the build environment):
+
+    pip install mypy
+    CEP_MYPYC=1 pip install --no-build-isolation -e .
+
+When the extensions are not built, the .py modules are imported as usual.
+"""
+
+import os
+
+from setuptools import setup
+
+# Pure, I/O-free dict-shuffling modules that benefit from AOT compilation.
+_PROCUREMENT = "src/python/src/civic_interconnect/cep/adapters/procurement"
+
+MYPYC_MODULES = [
+    f"{_PROCUREMENT}/it_anac/source_ocds.py",
+    f"{_PROCUREMENT}/spine/_identifiers.py",
+    f"{_PROCUREMENT}/spine/_types.py",
+    f"{_PROCUREMENT}/spine/_util.py",
+    f"{_PROCUREMENT}/spine/award_contract.py",
+    f"{_PROCUREMENT}/spine/buyer.py",
+    f"{_PROCUREMENT}/spine/supplier.py",
+    f"{_PROCUREMENT}/spine/tender.py",
+]
+
+ext_modules = []
+if os.environ.get("CEP_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_MODULES)
+
+setup(ext_modules=ext_modules)
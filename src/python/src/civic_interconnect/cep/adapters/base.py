@@ -6,20 +6,41 @@ Key design points:
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 import hashlib
 import json
 from typing import TYPE_CHECKING, Any
 
+try:
+    # Optional accelerator for canonical JSON (sorted keys, compact separators).
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 JsonDict = dict[str, Any]
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=1)
+def _probe_cep_py() -> tuple[Any, Exception | None]:
+    """Import cep_py once per process; returns (module or None, import error).
+
+    A failed import is not cached by the import system, so without this every
+    localization call would re-scan sys.path when the extension is missing.
+    """
+    try:
+        import cep_py  # type: ignore
+    except Exception as e:
+        return None, e
+    return cep_py, None
+
+
+@dataclass(frozen=True, slots=True)
 class AdapterKey:
     """Uniquely identifies an adapter implementation."""
 
@@ -55,6 +76,8 @@ class Adapter(ABC):
     def __init__(self, context: AdapterContext | None = None) -> None:
         """Initialize adapter with optional context (uses defaults if None)."""
         self.context = context or AdapterContext()
+        self._now = self.context.now
+        self._static_attestation = self._build_static_attestation()
 
     # High-level pipeline -------------------------------------------------
 
@@ -65,6 +88,19 @@ class Adapter(ABC):
         with_identity = self.compute_identity(aligned)
         return self.attach_attestation(with_identity)
 
+    def run_many(self, raws: Iterable[Any]) -> list[JsonDict]:
+        """Run the pipeline over many raw inputs; same result as [run(r) for r in raws].
+
+        The step methods are bound once per batch rather than looked up per record.
+        """
+        canonicalize = self.canonicalize
+        align_schema = self.align_schema
+        compute_identity = self.compute_identity
+        attach_attestation = self.attach_attestation
+        return [
+            attach_attestation(compute_identity(align_schema(canonicalize(raw)))) for raw in raws
+        ]
+
     # Steps in the pipeline ----------------------------------------------
 
     @abstractmethod
@@ -82,10 +118,9 @@ class Adapter(ABC):
         """Compute SNFEI (and any other identity hashes) on the aligned record."""
         raise NotImplementedError
 
-    def attach_attestation(self, record: JsonDict) -> JsonDict:
-        """Attach an attestation block using the adapter's key and context."""
-        attestation: JsonDict = {
-            "attestationTimestamp": self.context.now().isoformat().replace("+00:00", "Z"),
+    def _build_static_attestation(self) -> JsonDict:
+        """Build the attestation fields that do not change between records."""
+        static: JsonDict = {
             "attestorId": self.context.attestor_id,
             "verificationMethodUri": self.context.verification_method_uri,
             "proofType": self.context.proof_type,
@@ -98,21 +133,33 @@ class Adapter(ABC):
         }
 
         # Drop None values so we don't emit anchorUri when not provided.
-        attestation = {k: v for k, v in attestation.items() if v is not None}
+        return {k: v for k, v in static.items() if v is not None}
 
-        updated = dict(record)
+    def attach_attestation(self, record: JsonDict, *, inplace: bool = False) -> JsonDict:
+        """Attach an attestation block using the adapter's key and context.
+
+        By default a new dict is returned and record is left untouched. Pass
+        inplace=True when the caller owns record (e.g. a fresh dict returned by
+        compute_identity) to skip the copy; record is then updated and returned.
+        """
+        # CanonicalTimestamp form; astimezone also covers naive and non-UTC clocks.
+        timestamp = self._now().astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        attestation: JsonDict = {"attestationTimestamp": timestamp, **self._static_attestation}
 
-        existing = updated.get("attestations")
+        existing = record.get("attestations")
         attestations: list[JsonDict] = []
         if isinstance(existing, list):
             attestations = [a for a in existing if isinstance(a, dict)]
-
         attestations.append(attestation)
-        updated["attestations"] = attestations
+
+        if inplace:
+            updated = record
+            updated["attestations"] = attestations
+        else:
+            updated = {**record, "attestations": attestations}
 
         # IMPORTANT: remove any legacy singular key if present
-        if "attestation" in updated:
-            updated.pop("attestation", None)
+        updated.pop("attestation", None)
 
         return updated
 
@@ -120,13 +167,12 @@ class Adapter(ABC):
 
     @staticmethod
     def _require_cep_py() -> Any:
-        try:
-            import cep_py  # type: ignore
-        except Exception as e:
+        cep_py, error = _probe_cep_py()
+        if cep_py is None:
             raise RuntimeError(
                 "cep_py is required for localization (Rust FFI). "
                 "Build/install it (e.g., uv run maturin develop --release)."
-            ) from e
+            ) from error
         return cep_py
 
     def apply_localization_name(self, name: str, jurisdiction: str | None = None) -> str:
@@ -143,6 +189,24 @@ class Adapter(ABC):
 
         return fn(name, j)
 
+    def apply_localization_names(
+        self, names: Sequence[str], jurisdiction: str | None = None
+    ) -> list[str]:
+        """Batch form of apply_localization_name: one FFI call for all names.
+
+        Rust-only. Raises RuntimeError if cep_py is missing or does not expose the function.
+        """
+        j = (jurisdiction or self.key.jurisdiction).strip() or self.key.jurisdiction
+        cep_py = self._require_cep_py()
+
+        fn: Callable[[Sequence[str], str], list[str]] | None = getattr(
+            cep_py, "apply_localization_names", None
+        )
+        if fn is None:
+            raise RuntimeError("cep_py.apply_localization_names is missing (FFI not exposed).")
+
+        return fn(names, j)
+
     def apply_localization_name_detailed_json(
         self, name: str, jurisdiction: str | None = None
     ) -> str:
@@ -192,6 +256,13 @@ class AdapterRegistry:
         """Look up an adapter class by (domain, jurisdiction, source_system)."""
         return self._registry.get((domain, jurisdiction, source_system))
 
+    def get_by_key(self, key: tuple[str, str, str]) -> type[Adapter] | None:
+        """Look up an adapter class by a prebuilt (domain, jurisdiction, source_system) tuple.
+
+        For per-record dispatch loops: build the key once outside the loop.
+        """
+        return self._registry.get(key)
+
 
 registry = AdapterRegistry()
 
@@ -219,18 +290,101 @@ class SimpleEntityAdapter(Adapter, ABC):
         projection = {key: aligned[key] for key in self.identity_projection_keys}
         snfei_value = self._compute_snfei_from_projection(projection)
 
-        updated = dict(aligned)
-        updated_ident = dict(updated.get("identifiers") or {})
-        updated_ident["snfei"] = {"value": snfei_value}
-        updated["identifiers"] = updated_ident
-        return updated
+        # Copy-on-write in one pass each: the record, then its identifiers block.
+        identifiers = aligned.get("identifiers") or {}
+        return {**aligned, "identifiers": {**identifiers, "snfei": {"value": snfei_value}}}
 
     @staticmethod
     def _compute_snfei_from_projection(projection: Mapping[str, Any]) -> str:
-        canonical_json = json.dumps(
-            projection,
-            sort_keys=True,
-            separators=(",", ":"),
-        ).encode("utf-8")
+        # Projections repeat heavily (one buyer across many tenders), so cache by
+        # the sorted items. Unhashable values skip the cache.
+        try:
+            return _snfei_from_items(tuple(sorted(projection.items())))
+        except TypeError:
+            return hashlib.sha256(_canonical_projection_json(projection)).hexdigest()
+
+    @staticmethod
+    def compute_snfei_batch(projections: Iterable[Mapping[str, Any]]) -> list[str]:
+        """Compute SNFEI values for many projections, hashing each distinct one once.
 
-        return hashlib.sha256(canonical_json).hexdigest()
+        Procurement feeds repeat the same buyer across many records, so
+        identical projections are coalesced before serialization and hashing.
+        Output order matches input order.
+        """
+        cache: dict[tuple[tuple[str, Any], ...], str] = {}
+        out: list[str] = []
+        for projection in projections:
+            key = tuple(sorted(projection.items()))
+            value = cache.get(key)
+            if value is None:
+                payload = _canonical_projection_json(projection)
+                value = cache[key] = hashlib.sha256(payload).hexdigest()
+            out.append(value)
+        return out
+
+
+def compute_snfei_for_names(pairs: Iterable[tuple[str, str]]) -> list[str]:
+    """Compute SNFEI values for (legalNameNormalized, jurisdictionIso) pairs.
+
+    Same values as SimpleEntityAdapter.compute_identity with the default
+    identity_projection_keys, without building a projection dict per record.
+    The canonical JSON is {"jurisdictionIso":<iso>,"legalNameNormalized":<name>},
+    so each jurisdiction's constant prefix is hashed once into a prototype state
+    that is copied per record. Repeated pairs are hashed once. Output order
+    matches input order.
+    """
+    cache: dict[tuple[str, str], str] = {}
+    out: list[str] = []
+    for pair in pairs:
+        value = cache.get(pair)
+        if value is None:
+            name, iso = pair
+            h = _snfei_name_prototype(iso).copy()
+            # json.dumps(str) escapes to pure ASCII, matching the sorted-dict form.
+            h.update(json.dumps(name).encode("ascii") + b"}")
+            value = cache[pair] = h.hexdigest()
+        out.append(value)
+    return out
+
+
+@lru_cache(maxsize=64)
+def _snfei_name_prototype(jurisdiction_iso: str) -> Any:
+    """SHA-256 state fed with the constant projection JSON prefix for a jurisdiction.
+
+    Cached across batches (bulk loads run one state at a time). Callers must
+    .copy() the result and never update it directly.
+    """
+    prefix = b'{"jurisdictionIso":' + json.dumps(jurisdiction_iso).encode("ascii")
+    return hashlib.sha256(prefix + b',"legalNameNormalized":')
+
+
+@lru_cache(maxsize=65536)
+def _snfei_from_items(items: tuple[tuple[str, Any], ...]) -> str:
+    """SHA-256 of the canonical JSON for a sorted projection (memoized)."""
+    return hashlib.sha256(_canonical_projection_json(dict(items))).hexdigest()
+
+
+def _canonical_projection_json(projection: Mapping[str, Any]) -> bytes:
+    """Serialize a projection as sorted, compact JSON bytes.
+
+    The output is always byte-identical to json.dumps(sort_keys=True,
+    separators=(",", ":")), so SNFEI values do not depend on whether orjson is
+    installed. orjson is only tried for all-str values: it formats floats
+    differently, writes NaN/inf as null and rejects big ints and lone
+    surrogates. json.dumps escapes non-ASCII and DEL (0x7f) to ASCII while
+    orjson emits them raw, so those payloads also use stdlib.
+    """
+    if (
+        orjson is not None
+        and type(projection) is dict
+        and all(type(v) is str for v in projection.values())
+    ):
+        try:
+            payload = orjson.dumps(projection, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. a lone surrogate or a non-str key).
+            pass
+        else:
+            if payload.isascii() and b"\x7f" not in payload:
+                return payload
+    return json.dumps(projection, sort_keys=True, separators=(",", ":")).encode("utf-8")
@@ -66,7 +66,7 @@ def load_raw_source(slice_dir: Path) -> dict[str, Any]:
         raise ValueError(f"Raw source {raw_path} is not valid JSON: {exc}") from exc
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExampleEntityInputs:
     """Minimal inputs needed to drive the Entity pipeline for examples."""
 
@@ -46,17 +46,30 @@ Each of buyer/supplier/tender/award/contract objects is a "normalized payload"
 dict intended for the corresponding spine adapter (buyer.py, supplier.py, etc).
 """
 
-from collections.abc import Iterator, Sequence
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+_loads: Callable[[bytes], Any]
+
+try:
+    # Optional accelerator: orjson decodes bytes directly and is much faster.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _loads = json.loads
 
 JsonObj = dict[str, Any]
 
 
-@dataclass(frozen=True)
-class OcdsRef:
+class OcdsRef(NamedTuple):
     """Extracted OCDS reference fields from a release."""
 
     ocid: str | None
@@ -65,31 +78,59 @@ class OcdsRef:
     tags: list[str]
 
 
+# Field accessors: one dict lookup + one type check per field.
+
+
+def _str(obj: JsonObj, key: str) -> str | None:
+    v = obj.get(key)
+    return v if isinstance(v, str) else None
+
+
+def _dict(obj: JsonObj, key: str) -> JsonObj | None:
+    v = obj.get(key)
+    return v if isinstance(v, dict) else None
+
+
+def _list(obj: JsonObj, key: str) -> list[Any]:
+    v = obj.get(key)
+    return v if isinstance(v, list) else []
+
+
 def iter_spine_bundles_from_path(
     path: Path,
     *,
     jurisdiction_iso: str,
     source_system: str = "it_anac_ocds",
     include_raw: bool = False,
+    workers: int = 1,
+    chunk_size: int = 1000,
 ) -> Iterator[JsonObj]:
     """Iterate "spine bundles" from a JSON or JSONL file.
 
     Supported:
     - *.json  : OCDS release package or record package object
     - *.jsonl : each line is a release or a package object (we handle both)
+
+    For JSONL input, workers > 1 parses chunks of chunk_size lines in a
+    process pool. Output order is identical to the single-worker path.
     """
     if path.suffix.lower() == ".jsonl":
-        with path.open("r", encoding="utf-8") as f:
-            for line_no, line in enumerate(f, start=1):
-                s = line.strip()
-                if not s:
-                    continue
-                try:
-                    obj = json.loads(s)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON on line {line_no} of {path}: {e}") from e
+        with path.open("rb") as f:
+            lines = _iter_jsonl_lines(f)
+            if workers > 1:
+                yield from _iter_bundles_parallel(
+                    lines,
+                    path=path,
+                    jurisdiction_iso=jurisdiction_iso,
+                    source_system=source_system,
+                    include_raw=include_raw,
+                    workers=workers,
+                    chunk_size=chunk_size,
+                )
+                return
+            for line_no, line in lines:
                 yield from iter_spine_bundles_from_obj(
-                    obj,
+                    _parse_jsonl_line(line, line_no=line_no, path=path),
                     jurisdiction_iso=jurisdiction_iso,
                     source_system=source_system,
                     include_raw=include_raw,
@@ -97,7 +138,7 @@ def iter_spine_bundles_from_path(
         return
 
     if path.suffix.lower() == ".json":
-        obj = json.loads(path.read_text(encoding="utf-8"))
+        obj = _loads(path.read_bytes())
         yield from iter_spine_bundles_from_obj(
             obj,
             jurisdiction_iso=jurisdiction_iso,
@@ -109,6 +150,82 @@ def iter_spine_bundles_from_path(
     raise ValueError(f"Unsupported file type: {path}")
 
 
+def _iter_jsonl_lines(f: Iterable[bytes]) -> Iterator[tuple[int, bytes]]:
+    """Yield (line_no, line) for non-blank lines of a binary JSONL stream.
+
+    Lines are passed through unstripped: JSON parsers ignore the trailing newline,
+    and bytes.isspace() detects blank lines without allocating a copy.
+    """
+    for line_no, line in enumerate(f, start=1):
+        if line and not line.isspace():
+            yield line_no, line
+
+
+def _parse_jsonl_line(line: bytes, *, line_no: int, path: Path) -> Any:
+    try:
+        return _loads(line)
+    except ValueError as e:
+        # Covers json.JSONDecodeError, orjson.JSONDecodeError, and bad UTF-8.
+        raise ValueError(f"Invalid JSON on line {line_no} of {path}: {e}") from e
+
+
+def _bundles_from_jsonl_chunk(
+    chunk: list[tuple[int, bytes]],
+    *,
+    path: Path,
+    jurisdiction_iso: str,
+    source_system: str,
+    include_raw: bool,
+) -> list[JsonObj]:
+    """Parse a chunk of JSONL lines into bundles (process pool worker)."""
+    bundles: list[JsonObj] = []
+    for line_no, line in chunk:
+        bundles.extend(
+            iter_spine_bundles_from_obj(
+                _parse_jsonl_line(line, line_no=line_no, path=path),
+                jurisdiction_iso=jurisdiction_iso,
+                source_system=source_system,
+                include_raw=include_raw,
+            )
+        )
+    return bundles
+
+
+def _iter_bundles_parallel(
+    lines: Iterator[tuple[int, bytes]],
+    *,
+    path: Path,
+    jurisdiction_iso: str,
+    source_system: str,
+    include_raw: bool,
+    workers: int,
+    chunk_size: int,
+) -> Iterator[JsonObj]:
+    """Fan JSONL chunks out to a process pool and yield bundles in input order.
+
+    At most 2 * workers chunks are in flight, so memory stays bounded for
+    large dumps.
+    """
+    worker = partial(
+        _bundles_from_jsonl_chunk,
+        path=path,
+        jurisdiction_iso=jurisdiction_iso,
+        source_system=source_system,
+        include_raw=include_raw,
+    )
+    chunks = iter(lambda: list(islice(lines, max(1, chunk_size))), [])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[list[JsonObj]]] = deque(
+            executor.submit(worker, chunk) for chunk in islice(chunks, 2 * workers)
+        )
+        while pending:
+            bundles = pending.popleft().result()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(executor.submit(worker, next_chunk))
+            yield from bundles
+
+
 def iter_spine_bundles_from_obj(
     obj: Any,
     *,
@@ -135,67 +252,34 @@ def iter_spine_bundles_from_obj(
 
 
 def _iter_releases(obj: Any) -> Iterator[JsonObj]:
-    """Yield OCDS release dicts from a release, release package, or record package."""
-    if not isinstance(obj, dict):
-        return
+    """Yield OCDS release dicts from a release, release package, or record package.
 
-    if _is_release_package(obj):
-        yield from _iter_release_package(obj)
-        return
-
-    if _is_record_package(obj):
-        yield from _iter_record_package(obj)
+    Dispatch reads "releases" and "records" once each:
+    - release package: has a "releases" list
+    - record package: has a "records" list, each record with a "releases" list
+    - bare release: has an "ocid"
+    """
+    if not isinstance(obj, dict):
         return
 
-    if _looks_like_release(obj):
-        yield obj  # type: ignore[misc]
-
-
-def _is_release_package(obj: JsonObj) -> bool:
-    return isinstance(obj.get("releases"), list)
-
-
-def _is_record_package(obj: JsonObj) -> bool:
-    return isinstance(obj.get("records"), list)
-
-
-def _iter_release_package(pkg: JsonObj) -> Iterator[JsonObj]:
-    releases = pkg.get("releases")
-    if not isinstance(releases, list):
+    releases = obj.get("releases")
+    if isinstance(releases, list):
+        yield from _iter_dicts(releases)
         return
-    for r in releases:
-        if isinstance(r, dict):
-            yield r
 
-
-def _iter_record_package(pkg: JsonObj) -> Iterator[JsonObj]:
-    records = pkg.get("records")
-    if not isinstance(records, list):
+    records = obj.get("records")
+    if isinstance(records, list):
+        for rec in _iter_dicts(records):
+            yield from _iter_dicts(_list(rec, "releases"))
         return
 
-    for rec in records:
-        if not isinstance(rec, dict):
-            continue
-        yield from _iter_record_releases(rec)
-
-
-def _iter_record_releases(rec: JsonObj) -> Iterator[JsonObj]:
-    releases = rec.get("releases")
-    if not isinstance(releases, list):
-        return
-    for r in releases:
-        if isinstance(r, dict):
-            yield r
+    if "ocid" in obj:
+        yield obj
 
 
-def _looks_like_release(obj: JsonObj) -> bool:
-    # Most releases have ocid and at least one of: id, date, tag, tender, awards, contracts.
-    if "ocid" not in obj:
-        return False
-    for k in ("id", "date", "tag", "tender", "awards", "contracts", "parties", "buyer"):
-        if k in obj:
-            return True
-    return True
+def _iter_dicts(items: list[Any]) -> Iterator[JsonObj]:
+    """Lazily yield the dict elements (including dict subclasses) of a JSON array."""
+    return (x for x in items if isinstance(x, dict))
 
 
 def _release_to_spine_bundle(
@@ -207,8 +291,7 @@ def _release_to_spine_bundle(
 ) -> JsonObj | None:
     ref = _extract_ocds_ref(release)
 
-    parties = release.get("parties")
-    parties_list: list[JsonObj] = parties if isinstance(parties, list) else []
+    parties_list: list[JsonObj] = _list(release, "parties")
 
     buyer_payload = _extract_buyer_payload(
         release, parties_list, jurisdiction_iso=jurisdiction_iso, source_system=source_system
@@ -217,26 +300,22 @@ def _release_to_spine_bundle(
         release, parties_list, jurisdiction_iso=jurisdiction_iso, source_system=source_system
     )
 
-    tender_obj = release.get("tender") if isinstance(release.get("tender"), dict) else None
+    tender_obj = _dict(release, "tender")
     tender_payload = _normalize_tender(
         tender_obj, ref=ref, jurisdiction_iso=jurisdiction_iso, source_system=source_system
     )
 
-    awards_raw = release.get("awards")
-    awards_list: list[Any] = awards_raw if isinstance(awards_raw, list) else []
     award_payloads = [
         _normalize_award(a, ref=ref, jurisdiction_iso=jurisdiction_iso, source_system=source_system)
-        for a in awards_list
+        for a in _list(release, "awards")
         if isinstance(a, dict)
     ]
 
-    contracts_raw = release.get("contracts")
-    contracts_list: list[Any] = contracts_raw if isinstance(contracts_raw, list) else []
     contract_payloads = [
         _normalize_contract(
             c, ref=ref, jurisdiction_iso=jurisdiction_iso, source_system=source_system
         )
-        for c in contracts_list
+        for c in _list(release, "contracts")
         if isinstance(c, dict)
     ]
 
@@ -262,9 +341,9 @@ def _release_to_spine_bundle(
 
 
 def _extract_ocds_ref(release: JsonObj) -> OcdsRef:
-    ocid = release.get("ocid") if isinstance(release.get("ocid"), str) else None
-    release_id = release.get("id") if isinstance(release.get("id"), str) else None
-    date = release.get("date") if isinstance(release.get("date"), str) else None
+    ocid = _str(release, "ocid")
+    release_id = _str(release, "id")
+    date = _str(release, "date")
     tags_raw = release.get("tag")
     tags: list[str] = []
     if isinstance(tags_raw, list):
@@ -282,7 +361,7 @@ def _extract_buyer_payload(
     source_system: str,
 ) -> JsonObj | None:
     # Prefer release["buyer"] if present.
-    buyer_obj = release.get("buyer") if isinstance(release.get("buyer"), dict) else None
+    buyer_obj = _dict(release, "buyer")
     if buyer_obj is not None:
         return _normalize_party(
             party=buyer_obj,
@@ -317,15 +396,10 @@ def _extract_supplier_payloads(
     suppliers: list[JsonObj] = []
 
     # Primary source: awards[].suppliers
-    awards_raw = release.get("awards")
-    awards_list: list[Any] = awards_raw if isinstance(awards_raw, list) else []
-    for a in awards_list:
+    for a in _list(release, "awards"):
         if not isinstance(a, dict):
             continue
-        sup_list = a.get("suppliers")
-        if not isinstance(sup_list, list):
-            continue
-        for s in sup_list:
+        for s in _list(a, "suppliers"):
             if isinstance(s, dict):
                 suppliers.append(
                     _normalize_party(
@@ -355,20 +429,19 @@ def _extract_supplier_payloads(
 
 
 def _dedupe_parties_by_key(parties: list[JsonObj]) -> list[JsonObj]:
-    """Deduplicate by (party_id, name) to stabilize output."""
-    seen: set[tuple[str, str]] = set()
-    out: list[JsonObj] = []
+    """Deduplicate by (party_id, name) to stabilize output.
+
+    The first party seen for a key wins; dict insertion order keeps output stable.
+    """
+    out: dict[str, JsonObj] = {}
     for p in parties:
         pid = p.get("party_id") or ""
         name = p.get("legal_name") or ""
         pid = pid if isinstance(pid, str) else ""
         name = name if isinstance(name, str) else ""
-        key = (pid, name)
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(p)
-    return out
+        # \x1f (unit separator) cannot collide with ordinary id/name text.
+        out.setdefault(pid + "\x1f" + name, p)
+    return list(out.values())
 
 
 def _normalize_party(
@@ -383,18 +456,14 @@ def _normalize_party(
 
     This is intentionally minimal. Downstream adapters can enrich and localize.
     """
-    pid = party.get("id") if isinstance(party.get("id"), str) else None
-    name = party.get("name") if isinstance(party.get("name"), str) else None
+    pid = _str(party, "id")
+    name = _str(party, "name")
 
     # OCDS parties can include identifiers/address/contactPoint
-    identifiers = party.get("identifier") if isinstance(party.get("identifier"), dict) else None
-    additional_ids = (
-        party.get("additionalIdentifiers")
-        if isinstance(party.get("additionalIdentifiers"), list)
-        else []
-    )
-    address = party.get("address") if isinstance(party.get("address"), dict) else None
-    contact = party.get("contactPoint") if isinstance(party.get("contactPoint"), dict) else None
+    identifiers = _dict(party, "identifier")
+    additional_ids = _list(party, "additionalIdentifiers")
+    address = _dict(party, "address")
+    contact = _dict(party, "contactPoint")
 
     return {
         "kind": "party",
@@ -405,50 +474,93 @@ def _normalize_party(
         "party_id": pid,
         "legal_name": name,
         "identifier": identifiers,
-        "additional_identifiers": [x for x in (additional_ids or []) if isinstance(x, dict)],
+        "additional_identifiers": [x for x in additional_ids if isinstance(x, dict)],
         "address": address,
         "contact_point": contact,
     }
 
 
-def _normalize_tender(
-    tender: JsonObj | None,
+# Field projections: (output key, OCDS key, accessor). Add a field in one place.
+_FieldSpec = tuple[tuple[str, str, Callable[[JsonObj, str], Any]], ...]
+
+_TENDER_FIELDS: _FieldSpec = (
+    ("tender_id", "id", _str),
+    ("title", "title", _str),
+    ("description", "description", _str),
+    ("status", "status", _str),
+    ("procurement_method", "procurementMethod", _str),
+    ("procurement_method_details", "procurementMethodDetails", _str),
+    ("main_procurement_category", "mainProcurementCategory", _str),
+    ("value", "value", _dict),
+    ("items", "items", _list),
+    ("lots", "lots", _list),
+    ("tender_period", "tenderPeriod", _dict),
+)
+
+_AWARD_FIELDS: _FieldSpec = (
+    ("award_id", "id", _str),
+    ("title", "title", _str),
+    ("description", "description", _str),
+    ("status", "status", _str),
+    ("date", "date", _str),
+    ("value", "value", _dict),
+    ("suppliers", "suppliers", _list),
+    ("items", "items", _list),
+    ("related_lots", "relatedLots", _list),
+)
+
+_CONTRACT_FIELDS: _FieldSpec = (
+    ("contract_id", "id", _str),
+    ("award_id", "awardID", _str),
+    ("title", "title", _str),
+    ("description", "description", _str),
+    ("status", "status", _str),
+    ("period", "period", _dict),
+    ("value", "value", _dict),
+    ("date_signed", "dateSigned", _str),
+    ("related_lots", "relatedLots", _list),
+    ("implementation", "implementation", _dict),
+)
+
+
+def _project(
+    kind: str,
+    obj: JsonObj,
+    fields: _FieldSpec,
     *,
     ref: OcdsRef,
     jurisdiction_iso: str,
     source_system: str,
-) -> JsonObj | None:
-    if tender is None:
-        return None
-
-    return {
-        "kind": "tender",
+) -> JsonObj:
+    """Build a normalized payload: common header, then the projected fields."""
+    payload: JsonObj = {
+        "kind": kind,
         "source_system": source_system,
         "jurisdiction_iso": jurisdiction_iso,
         "ocid": ref.ocid,
         "release_id": ref.release_id,
-        "tender_id": tender.get("id") if isinstance(tender.get("id"), str) else None,
-        "title": tender.get("title") if isinstance(tender.get("title"), str) else None,
-        "description": tender.get("description")
-        if isinstance(tender.get("description"), str)
-        else None,
-        "status": tender.get("status") if isinstance(tender.get("status"), str) else None,
-        "procurement_method": tender.get("procurementMethod")
-        if isinstance(tender.get("procurementMethod"), str)
-        else None,
-        "procurement_method_details": tender.get("procurementMethodDetails")
-        if isinstance(tender.get("procurementMethodDetails"), str)
-        else None,
-        "main_procurement_category": tender.get("mainProcurementCategory")
-        if isinstance(tender.get("mainProcurementCategory"), str)
-        else None,
-        "value": tender.get("value") if isinstance(tender.get("value"), dict) else None,
-        "items": tender.get("items") if isinstance(tender.get("items"), list) else [],
-        "lots": tender.get("lots") if isinstance(tender.get("lots"), list) else [],
-        "tender_period": tender.get("tenderPeriod")
-        if isinstance(tender.get("tenderPeriod"), dict)
-        else None,
     }
+    payload.update({out: get(obj, key) for out, key, get in fields})
+    return payload
+
+
+def _normalize_tender(
+    tender: JsonObj | None,
+    *,
+    ref: OcdsRef,
+    jurisdiction_iso: str,
+    source_system: str,
+) -> JsonObj | None:
+    if tender is None:
+        return None
+    return _project(
+        "tender",
+        tender,
+        _TENDER_FIELDS,
+        ref=ref,
+        jurisdiction_iso=jurisdiction_iso,
+        source_system=source_system,
+    )
 
 
 def _normalize_award(
@@ -458,26 +570,14 @@ def _normalize_award(
     jurisdiction_iso: str,
     source_system: str,
 ) -> JsonObj:
-    return {
-        "kind": "award",
-        "source_system": source_system,
-        "jurisdiction_iso": jurisdiction_iso,
-        "ocid": ref.ocid,
-        "release_id": ref.release_id,
-        "award_id": award.get("id") if isinstance(award.get("id"), str) else None,
-        "title": award.get("title") if isinstance(award.get("title"), str) else None,
-        "description": award.get("description")
-        if isinstance(award.get("description"), str)
-        else None,
-        "status": award.get("status") if isinstance(award.get("status"), str) else None,
-        "date": award.get("date") if isinstance(award.get("date"), str) else None,
-        "value": award.get("value") if isinstance(award.get("value"), dict) else None,
-        "suppliers": award.get("suppliers") if isinstance(award.get("suppliers"), list) else [],
-        "items": award.get("items") if isinstance(award.get("items"), list) else [],
-        "related_lots": award.get("relatedLots")
-        if isinstance(award.get("relatedLots"), list)
-        else [],
-    }
+    return _project(
+        "award",
+        award,
+        _AWARD_FIELDS,
+        ref=ref,
+        jurisdiction_iso=jurisdiction_iso,
+        source_system=source_system,
+    )
 
 
 def _normalize_contract(
@@ -487,28 +587,11 @@ def _normalize_contract(
     jurisdiction_iso: str,
     source_system: str,
 ) -> JsonObj:
-    return {
-        "kind": "contract",
-        "source_system": source_system,
-        "jurisdiction_iso": jurisdiction_iso,
-        "ocid": ref.ocid,
-        "release_id": ref.release_id,
-        "contract_id": contract.get("id") if isinstance(contract.get("id"), str) else None,
-        "award_id": contract.get("awardID") if isinstance(contract.get("awardID"), str) else None,
-        "title": contract.get("title") if isinstance(contract.get("title"), str) else None,
-        "description": contract.get("description")
-        if isinstance(contract.get("description"), str)
-        else None,
-        "status": contract.get("status") if isinstance(contract.get("status"), str) else None,
-        "period": contract.get("period") if isinstance(contract.get("period"), dict) else None,
-        "value": contract.get("value") if isinstance(contract.get("value"), dict) else None,
-        "date_signed": contract.get("dateSigned")
-        if isinstance(contract.get("dateSigned"), str)
-        else None,
-        "related_lots": contract.get("relatedLots")
-        if isinstance(contract.get("relatedLots"), list)
-        else [],
-        "implementation": contract.get("implementation")
-        if isinstance(contract.get("implementation"), dict)
-        else None,
-    }
+    return _project(
+        "contract",
+        contract,
+        _CONTRACT_FIELDS,
+        ref=ref,
+        jurisdiction_iso=jurisdiction_iso,
+        source_system=source_system,
+    )
@@ -39,7 +39,7 @@ JsonDict = dict[str, Any]
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcurementSmeAdapterKey(AdapterKey):
     """Typed key for this adapter."""
 
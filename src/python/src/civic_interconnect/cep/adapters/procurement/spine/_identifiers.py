@@ -0,0 +1,28 @@
+# src/python/src/civic_interconnect/cep/adapters/procurement/spine/_identifiers.py
+"""Party identifier evidence shared by the buyer and supplier spine builders."""
+
+from civic_interconnect.cep.adapters.procurement.spine._types import JsonObj
+
+
+def collect_identifiers(party: JsonObj) -> JsonObj:
+    """Carry a party's OCDS identifier and additional identifiers forward as evidence.
+
+    Identifiers are copied, not interpreted: {"primary": {...} | None, "additional": [...]}.
+    """
+    ident = party.get("identifier")
+    addl = party.get("additional_identifiers")
+    return {
+        "primary": _identifier(ident) if isinstance(ident, dict) else None,
+        "additional": (
+            [_identifier(x) for x in addl if isinstance(x, dict)] if isinstance(addl, list) else []
+        ),
+    }
+
+
+def _identifier(x: JsonObj) -> JsonObj:
+    return {
+        "scheme": x.get("scheme"),
+        "id": x.get("id"),
+        "legalName": x.get("legalName"),
+        "uri": x.get("uri"),
+    }
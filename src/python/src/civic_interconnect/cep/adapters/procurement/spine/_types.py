@@ -0,0 +1,43 @@
+# src/python/src/civic_interconnect/cep/adapters/procurement/spine/_types.py
+"""Shared container types for procurement spine build requests.
+
+Build requests have a fixed field set, so they are slotted frozen dataclasses
+rather than dicts. Convert with as_dict() only at the Rust builder boundary.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+JsonObj = dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class BuildRequest:
+    """Internal build request handed to the Rust builder.
+
+    The instance is frozen; source_ref and payload are plain dicts and may be
+    shared between requests from the same release, so treat them as read-only.
+    Values must be JSON-native (str, int, float, bool, None, dict, list) so the
+    boundary serializer (orjson when installed) needs no default= hook.
+    """
+
+    record_kind: str
+    record_type: str
+    jurisdiction_iso: str
+    source_system: str
+    source_ref: JsonObj
+    payload: JsonObj
+    # Link-phase key captured at build time: the award id of an award request,
+    # or the referenced award id of a contract request. Not part of the wire form.
+    award_id: str | None = None
+
+    def as_dict(self) -> JsonObj:
+        """Return the dict form of this request (shallow; nested dicts are shared)."""
+        return {
+            "record_kind": self.record_kind,
+            "record_type": self.record_type,
+            "jurisdiction_iso": self.jurisdiction_iso,
+            "source_system": self.source_system,
+            "source_ref": self.source_ref,
+            "payload": self.payload,
+        }
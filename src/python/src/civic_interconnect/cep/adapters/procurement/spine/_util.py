@@ -0,0 +1,59 @@
+# src/python/src/civic_interconnect/cep/adapters/procurement/spine/_util.py
+"""Small validation and payload helpers shared by the procurement spine builders."""
+
+from typing import Any
+
+from civic_interconnect.cep.adapters.procurement.spine._types import JsonObj
+
+
+def require_str(obj: JsonObj, key: str) -> str:
+    """Return obj[key] stripped, or raise ValueError if it is not a non-blank str."""
+    v = obj.get(key)
+    if isinstance(v, str):
+        s = v.strip()
+        if s:
+            return s
+    raise ValueError(f"Missing or invalid string field: {key}")
+
+
+def require_kind_role(obj: JsonObj, *, kind: str, role: str) -> None:
+    """Raise ValueError unless obj is a source party record with this kind and role."""
+    if obj.get("kind") != kind:
+        raise ValueError(f"Expected kind={kind}, got {obj.get('kind')}")
+    if obj.get("role") != role:
+        raise ValueError(f"Expected role={role}, got {obj.get('role')}")
+
+
+def resolve_min_ocds_ref(ocds_ref: JsonObj | None, min_ocds_ref: JsonObj | None) -> JsonObj:
+    """Return min_ocds_ref if given, else minimize ocds_ref (one of them is required)."""
+    if min_ocds_ref is not None:
+        return min_ocds_ref
+    if ocds_ref is None:
+        raise ValueError("Either ocds_ref or min_ocds_ref is required")
+    return minimize_ocds_ref(ocds_ref)
+
+
+def minimize_ocds_ref(ocds_ref: JsonObj) -> JsonObj:
+    """Return the minimal OCDS source ref carried on every spine request."""
+    return {
+        "ocid": ocds_ref.get("ocid"),
+        "releaseId": ocds_ref.get("release_id"),
+        "date": ocds_ref.get("date"),
+        "tag": ocds_ref.get("tag"),
+    }
+
+
+def maybe_dict(obj: JsonObj, key: str) -> JsonObj | None:
+    """Return obj[key] if it is a dict, else None."""
+    v = obj.get(key)
+    if isinstance(v, dict):
+        return v
+    return None
+
+
+def maybe_list(obj: JsonObj, key: str) -> list[Any]:
+    """Return obj[key] if it is a list, else a new empty list."""
+    v = obj.get(key)
+    if isinstance(v, list):
+        return v
+    return []
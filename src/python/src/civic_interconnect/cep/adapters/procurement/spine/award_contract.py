@@ -47,10 +47,17 @@ We do NOT attempt to reconcile award suppliers with normalized supplier entities
 That belongs to the identity/evidence layer later.
 """
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
-JsonObj = dict[str, Any]
+from civic_interconnect.cep.adapters.procurement.spine._types import BuildRequest, JsonObj
+from civic_interconnect.cep.adapters.procurement.spine._util import (
+    maybe_dict,
+    maybe_list,
+    minimize_ocds_ref,
+    require_str,
+    resolve_min_ocds_ref,
+)
 
 
 def award_and_contract_build_requests(
@@ -58,157 +65,215 @@ def award_and_contract_build_requests(
     awards: Iterable[JsonObj],
     contracts: Iterable[JsonObj],
     ocds_ref: JsonObj,
-    buyer_request: JsonObj | None,
-    supplier_requests: list[JsonObj],
-    tender_request: JsonObj | None,
+    buyer_request: BuildRequest | None,
+    supplier_requests: list[BuildRequest],
+    tender_request: BuildRequest | None,
 ) -> list[JsonObj]:
     """Produce build requests for award/contract records plus conservative link stubs.
 
     buyer_request/supplier_requests/tender_request are the outputs from spine buyer/supplier/tender modules.
     We use them only to attach stable references (not to merge identity).
+    Every item is a plain dict: award/contract records are BuildRequest.as_dict()
+    forms, and link stubs carry "endpoints" as {"from": ..., "to": ...}.
     """
-    out: list[JsonObj] = []
-
-    award_reqs = [award_build_request(a, ocds_ref=ocds_ref) for a in awards]
-    contract_reqs = [contract_build_request(c, ocds_ref=ocds_ref) for c in contracts]
-
-    out.extend(award_reqs)
-    out.extend(contract_reqs)
-
-    # Relationship/link stubs (internal). Downstream can map these to CEP Relationship records.
-    out.extend(
-        link_stub_requests(
+    return list(
+        iter_award_and_contract_build_requests(
+            awards=awards,
+            contracts=contracts,
             ocds_ref=ocds_ref,
             buyer_request=buyer_request,
             supplier_requests=supplier_requests,
             tender_request=tender_request,
-            award_requests=award_reqs,
-            contract_requests=contract_reqs,
         )
     )
 
-    return out
 
+def iter_award_and_contract_build_requests(
+    *,
+    awards: Iterable[JsonObj],
+    contracts: Iterable[JsonObj],
+    ocds_ref: JsonObj,
+    buyer_request: BuildRequest | None,
+    supplier_requests: list[BuildRequest],
+    tender_request: BuildRequest | None,
+) -> Iterator[JsonObj]:
+    """Yield award requests, then contract requests, then link stubs.
+
+    Same output and order as award_and_contract_build_requests. Each request is
+    yielded as soon as it is built; award/contract requests are still retained
+    until the end because the link stubs are derived from them.
+    """
+    # One shared (read-only) source ref for every request and link in this release.
+    min_ref = minimize_ocds_ref(ocds_ref)
+
+    award_reqs: list[BuildRequest] = []
+    for a in awards:
+        award_req = award_build_request(a, min_ocds_ref=min_ref)
+        award_reqs.append(award_req)
+        yield award_req.as_dict()
+
+    contract_reqs: list[BuildRequest] = []
+    for c in contracts:
+        contract_req = contract_build_request(c, min_ocds_ref=min_ref)
+        contract_reqs.append(contract_req)
+        yield contract_req.as_dict()
+
+    # Relationship/link stubs (internal). Downstream can map these to CEP Relationship records.
+    yield from link_stub_requests(
+        min_ocds_ref=min_ref,
+        buyer_request=buyer_request,
+        supplier_requests=supplier_requests,
+        tender_request=tender_request,
+        award_requests=award_reqs,
+        contract_requests=contract_reqs,
+    )
+
+
+def award_build_request(
+    award: JsonObj,
+    *,
+    ocds_ref: JsonObj | None = None,
+    min_ocds_ref: JsonObj | None = None,
+) -> BuildRequest:
+    """Output single award build request.
 
-def award_build_request(award: JsonObj, *, ocds_ref: JsonObj) -> JsonObj:
-    """Output single award build request."""
+    Pass min_ocds_ref (already minimized) to share one source ref across requests.
+    """
     if award.get("kind") != "award":
         raise ValueError(f"Expected kind=award, got {award.get('kind')}")
 
-    jurisdiction_iso = _require_str(award, "jurisdiction_iso")
-    source_system = _require_str(award, "source_system")
+    jurisdiction_iso = require_str(award, "jurisdiction_iso")
+    source_system = require_str(award, "source_system")
+    source_ref = resolve_min_ocds_ref(ocds_ref, min_ocds_ref)
+    award_id = award.get("award_id")
 
     payload: JsonObj = {
         "jurisdictionIso": jurisdiction_iso,
         "entityType": "award",
         "award": {
-            "awardId": award.get("award_id"),
+            "awardId": award_id,
             "title": award.get("title"),
             "description": award.get("description"),
             "status": award.get("status"),
             "date": award.get("date"),
-            "value": _maybe_dict(award, "value"),
-            "relatedLots": award.get("related_lots")
-            if isinstance(award.get("related_lots"), list)
-            else [],
-            "items": award.get("items") if isinstance(award.get("items"), list) else [],
+            "value": maybe_dict(award, "value"),
+            "relatedLots": maybe_list(award, "related_lots"),
+            "items": maybe_list(award, "items"),
             # Raw supplier references (OCDS); do not resolve here.
-            "suppliers": award.get("suppliers") if isinstance(award.get("suppliers"), list) else [],
+            "suppliers": maybe_list(award, "suppliers"),
         },
         "source": {
             "sourceSystem": source_system,
             "sourceKind": "ocds",
-            "ocds": _min_ocds_ref(ocds_ref),
+            "ocds": source_ref,
             "award": {
                 "ocid": award.get("ocid"),
                 "releaseId": award.get("release_id"),
-                "awardId": award.get("award_id"),
+                "awardId": award_id,
             },
         },
     }
 
-    return {
-        "record_kind": "entity",
-        "record_type": "procurement.award",
-        "jurisdiction_iso": jurisdiction_iso,
-        "source_system": source_system,
-        "source_ref": _min_ocds_ref(ocds_ref),
-        "payload": payload,
-    }
+    return BuildRequest(
+        record_kind="entity",
+        record_type="procurement.award",
+        jurisdiction_iso=jurisdiction_iso,
+        source_system=source_system,
+        source_ref=source_ref,
+        payload=payload,
+        award_id=award_id if isinstance(award_id, str) else None,
+    )
 
 
-def contract_build_request(contract: JsonObj, *, ocds_ref: JsonObj) -> JsonObj:
-    """Output single contract build request."""
+def contract_build_request(
+    contract: JsonObj,
+    *,
+    ocds_ref: JsonObj | None = None,
+    min_ocds_ref: JsonObj | None = None,
+) -> BuildRequest:
+    """Output single contract build request.
+
+    Pass min_ocds_ref (already minimized) to share one source ref across requests.
+    """
     if contract.get("kind") != "contract":
         raise ValueError(f"Expected kind=contract, got {contract.get('kind')}")
 
-    jurisdiction_iso = _require_str(contract, "jurisdiction_iso")
-    source_system = _require_str(contract, "source_system")
+    jurisdiction_iso = require_str(contract, "jurisdiction_iso")
+    source_system = require_str(contract, "source_system")
+    source_ref = resolve_min_ocds_ref(ocds_ref, min_ocds_ref)
+    award_id = contract.get("award_id")
 
     payload: JsonObj = {
         "jurisdictionIso": jurisdiction_iso,
         "entityType": "contract",
         "contract": {
             "contractId": contract.get("contract_id"),
-            "awardId": contract.get("award_id"),
+            "awardId": award_id,
             "title": contract.get("title"),
             "description": contract.get("description"),
             "status": contract.get("status"),
             "dateSigned": contract.get("date_signed"),
-            "period": _maybe_dict(contract, "period"),
-            "value": _maybe_dict(contract, "value"),
-            "relatedLots": contract.get("related_lots")
-            if isinstance(contract.get("related_lots"), list)
-            else [],
-            "implementation": _maybe_dict(contract, "implementation"),
+            "period": maybe_dict(contract, "period"),
+            "value": maybe_dict(contract, "value"),
+            "relatedLots": maybe_list(contract, "related_lots"),
+            "implementation": maybe_dict(contract, "implementation"),
         },
         "source": {
             "sourceSystem": source_system,
             "sourceKind": "ocds",
-            "ocds": _min_ocds_ref(ocds_ref),
+            "ocds": source_ref,
             "contract": {
                 "ocid": contract.get("ocid"),
                 "releaseId": contract.get("release_id"),
                 "contractId": contract.get("contract_id"),
-                "awardId": contract.get("award_id"),
+                "awardId": award_id,
             },
         },
     }
 
-    return {
-        "record_kind": "entity",
-        "record_type": "procurement.contract",
-        "jurisdiction_iso": jurisdiction_iso,
-        "source_system": source_system,
-        "source_ref": _min_ocds_ref(ocds_ref),
-        "payload": payload,
-    }
+    return BuildRequest(
+        record_kind="entity",
+        record_type="procurement.contract",
+        jurisdiction_iso=jurisdiction_iso,
+        source_system=source_system,
+        source_ref=source_ref,
+        payload=payload,
+        award_id=award_id if isinstance(award_id, str) else None,
+    )
 
 
 def link_stub_requests(
     *,
-    ocds_ref: JsonObj,
-    buyer_request: JsonObj | None,
-    supplier_requests: list[JsonObj],
-    tender_request: JsonObj | None,
-    award_requests: list[JsonObj],
-    contract_requests: list[JsonObj],
+    ocds_ref: JsonObj | None = None,
+    min_ocds_ref: JsonObj | None = None,
+    buyer_request: BuildRequest | None,
+    supplier_requests: list[BuildRequest],
+    tender_request: BuildRequest | None,
+    award_requests: list[BuildRequest],
+    contract_requests: list[BuildRequest],
 ) -> list[JsonObj]:
     """Emit conservative link stubs between the procurement spine records."""
-    src = _min_ocds_ref(ocds_ref)
-
-    buyer_key = _endpoint_key(buyer_request)
-    tender_key = _endpoint_key(tender_request)
-
-    supplier_keys = _collect_supplier_keys(supplier_requests)
-
-    award_keys_by_award_id = _index_awards_by_award_id(award_requests)
-    contract_pairs = _iter_contract_award_pairs(contract_requests)
+    src = resolve_min_ocds_ref(ocds_ref, min_ocds_ref)
 
+    # Most releases are sparse; skip each link pass whose inputs are empty.
     links: list[JsonObj] = []
-    links.extend(_buyer_to_tender_links(src, buyer_key, tender_key))
-    links.extend(_supplier_to_award_links(src, supplier_keys, award_requests))
-    links.extend(_award_to_contract_links(src, award_keys_by_award_id, contract_pairs))
+    if buyer_request is not None and tender_request is not None:
+        buyer_key = _endpoint_key(buyer_request)
+        tender_key = _endpoint_key(tender_request)
+        links.extend(_buyer_to_tender_links(src, buyer_key, tender_key))
+
+    if not award_requests:
+        return links
+
+    if supplier_requests:
+        supplier_keys = _collect_supplier_keys(supplier_requests)
+        links.extend(_supplier_to_award_links(src, supplier_keys, award_requests))
+
+    if contract_requests:
+        contract_pairs = _iter_contract_award_pairs(contract_requests)
+        if contract_pairs:
+            award_keys_by_award_id = _index_awards_by_award_id(award_requests)
+            links.extend(_award_to_contract_links(src, award_keys_by_award_id, contract_pairs))
     return links
 
 
@@ -229,7 +294,7 @@ def _buyer_to_tender_links(
     ]
 
 
-def _collect_supplier_keys(supplier_requests: list[JsonObj]) -> list[JsonObj]:
+def _collect_supplier_keys(supplier_requests: list[BuildRequest]) -> list[JsonObj]:
     keys = [_endpoint_key(r) for r in supplier_requests]
     return [k for k in keys if k]
 
@@ -237,51 +302,38 @@ def _collect_supplier_keys(supplier_requests: list[JsonObj]) -> list[JsonObj]:
 def _supplier_to_award_links(
     src: JsonObj,
     supplier_keys: list[JsonObj],
-    award_requests: list[JsonObj],
+    award_requests: list[BuildRequest],
 ) -> list[JsonObj]:
     if not supplier_keys:
         return []
 
-    links: list[JsonObj] = []
-    for a in award_requests:
-        award_key = _endpoint_key(a)
-        if not award_key:
-            continue
-        for sk in supplier_keys:
-            links.append(
-                {
-                    "record_kind": "relationship_stub",
-                    "record_type": "procurement.link.supplier_to_award",
-                    "source_ref": src,
-                    "endpoints": {"from": sk, "to": award_key},
-                }
-            )
-    return links
+    # S x A links share everything but their endpoints; copy a template per link.
+    base: JsonObj = {
+        "record_kind": "relationship_stub",
+        "record_type": "procurement.link.supplier_to_award",
+        "source_ref": src,
+    }
+    award_keys = [k for k in map(_endpoint_key, award_requests) if k]
+    return [
+        {**base, "endpoints": {"from": sk, "to": ak}} for ak in award_keys for sk in supplier_keys
+    ]
 
 
-def _index_awards_by_award_id(award_requests: list[JsonObj]) -> dict[str, JsonObj]:
-    out: dict[str, JsonObj] = {}
-    for a in award_requests:
-        aid = _get_award_id(a)
-        if aid:
-            out[aid] = a
-    return out
+def _index_awards_by_award_id(award_requests: list[BuildRequest]) -> dict[str, BuildRequest]:
+    return {a.award_id: a for a in award_requests if a.award_id}
 
 
-def _iter_contract_award_pairs(contract_requests: list[JsonObj]) -> list[tuple[JsonObj, str]]:
+def _iter_contract_award_pairs(
+    contract_requests: list[BuildRequest],
+) -> list[tuple[BuildRequest, str]]:
     """Return list of (contract_request, award_id) for contracts that reference an award."""
-    out: list[tuple[JsonObj, str]] = []
-    for c in contract_requests:
-        aid = _get_contract_award_id(c)
-        if isinstance(aid, str) and aid:
-            out.append((c, aid))
-    return out
+    return [(c, c.award_id) for c in contract_requests if c.award_id]
 
 
 def _award_to_contract_links(
     src: JsonObj,
-    award_by_award_id: dict[str, JsonObj],
-    contract_pairs: list[tuple[JsonObj, str]],
+    award_by_award_id: dict[str, BuildRequest],
+    contract_pairs: list[tuple[BuildRequest, str]],
 ) -> list[JsonObj]:
     links: list[JsonObj] = []
     for contract_req, award_id in contract_pairs:
@@ -305,85 +357,64 @@ def _award_to_contract_links(
     return links
 
 
-def _endpoint_key(req: JsonObj | None) -> JsonObj | None:
+def _endpoint_key(req: BuildRequest | None) -> JsonObj | None:
     """Produce a stable endpoint key from a build request.
 
     This is not a CEP id. It is an internal key used for link stubs.
     """
-    if not req or not isinstance(req, dict):
-        return None
-    rt = req.get("record_type")
-    payload = req.get("payload") if isinstance(req.get("payload"), dict) else None
-    if not isinstance(rt, str) or payload is None:
+    if req is None or not isinstance(req.payload, dict):
         return None
+    # Called per request inside the link loops: one dict lookup on record_type.
+    key_fn = _ENDPOINT_KEY_BY_RECORD_TYPE.get(req.record_type)
+    if key_fn is None:
+        return {"type": req.record_type}
+    return key_fn(req)
 
-    if rt == "procurement.buyer":
-        src_party_id = _deep_get(payload, ["source", "party", "partyId"])
-        return {"type": "buyer", "partyId": src_party_id}
 
-    if rt == "procurement.supplier":
-        src_party_id = _deep_get(payload, ["source", "party", "partyId"])
-        return {"type": "supplier", "partyId": src_party_id}
+def _party_id(payload: JsonObj) -> Any:
+    src = payload.get("source")
+    party = src.get("party") if isinstance(src, dict) else None
+    return party.get("partyId") if isinstance(party, dict) else None
 
-    if rt == "procurement.tender":
-        tid = _deep_get(payload, ["tender", "tenderId"])
-        return {"type": "tender", "tenderId": tid}
-
-    if rt == "procurement.award":
-        aid = _deep_get(payload, ["award", "awardId"])
-        return {"type": "award", "awardId": aid}
-
-    if rt == "procurement.contract":
-        cid = _deep_get(payload, ["contract", "contractId"])
-        return {"type": "contract", "contractId": cid}
 
-    return {"type": rt}
+def _buyer_endpoint_key(req: BuildRequest) -> JsonObj:
+    return {"type": "buyer", "partyId": _party_id(req.payload)}
 
 
-def _get_award_id(req: JsonObj) -> str | None:
-    payload = req.get("payload")
-    if isinstance(payload, dict):
-        aid = _deep_get(payload, ["award", "awardId"])
-        return aid if isinstance(aid, str) else None
-    return None
+def _supplier_endpoint_key(req: BuildRequest) -> JsonObj:
+    return {"type": "supplier", "partyId": _party_id(req.payload)}
 
 
-def _get_contract_id(req: JsonObj) -> str | None:
-    payload = req.get("payload")
-    if isinstance(payload, dict):
-        cid = _deep_get(payload, ["contract", "contractId"])
-        return cid if isinstance(cid, str) else None
-    return None
+def _tender_endpoint_key(req: BuildRequest) -> JsonObj:
+    tender = req.payload.get("tender")
+    tid = tender.get("tenderId") if isinstance(tender, dict) else None
+    return {"type": "tender", "tenderId": tid}
 
 
-def _get_contract_award_id(req: JsonObj) -> str | None:
-    payload = req.get("payload")
-    if isinstance(payload, dict):
-        aid = _deep_get(payload, ["contract", "awardId"])
-        return aid if isinstance(aid, str) else None
-    return None
+def _award_endpoint_key(req: BuildRequest) -> JsonObj:
+    return {"type": "award", "awardId": req.award_id}
 
 
-def _min_ocds_ref(ocds_ref: JsonObj) -> JsonObj:
-    return {
-        "ocid": ocds_ref.get("ocid"),
-        "releaseId": ocds_ref.get("release_id"),
-        "date": ocds_ref.get("date"),
-        "tag": ocds_ref.get("tag"),
-    }
+def _contract_endpoint_key(req: BuildRequest) -> JsonObj:
+    contract = req.payload.get("contract")
+    cid = contract.get("contractId") if isinstance(contract, dict) else None
+    return {"type": "contract", "contractId": cid}
 
 
-def _require_str(obj: JsonObj, key: str) -> str:
-    v = obj.get(key)
-    if not isinstance(v, str) or not v.strip():
-        raise ValueError(f"Missing or invalid string field: {key}")
-    return v.strip()
+_ENDPOINT_KEY_BY_RECORD_TYPE: dict[str, Callable[[BuildRequest], JsonObj]] = {
+    "procurement.buyer": _buyer_endpoint_key,
+    "procurement.supplier": _supplier_endpoint_key,
+    "procurement.tender": _tender_endpoint_key,
+    "procurement.award": _award_endpoint_key,
+    "procurement.contract": _contract_endpoint_key,
+}
 
 
-def _maybe_dict(obj: JsonObj, key: str) -> JsonObj | None:
-    v = obj.get(key)
-    if isinstance(v, dict):
-        return v
+def _get_contract_id(req: BuildRequest) -> str | None:
+    payload = req.payload
+    if isinstance(payload, dict):
+        cid = _deep_get(payload, ["contract", "contractId"])
+        return cid if isinstance(cid, str) else None
     return None
 
 
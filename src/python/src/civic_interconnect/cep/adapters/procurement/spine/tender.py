@@ -23,29 +23,36 @@ tender = {
 }
 
 Output:
-{
-  "record_kind": "entity",
-  "record_type": "procurement.tender",
-  "payload": { ... }
-}
+BuildRequest(
+  record_kind="entity",
+  record_type="procurement.tender",
+  payload={ ... },
+  ...
+)
 """
 
-from typing import Any
-
-JsonObj = dict[str, Any]
+from civic_interconnect.cep.adapters.procurement.spine._types import BuildRequest, JsonObj
+from civic_interconnect.cep.adapters.procurement.spine._util import (
+    maybe_dict,
+    maybe_list,
+    require_str,
+    resolve_min_ocds_ref,
+)
 
 
 def tender_build_request(
     tender: JsonObj,
     *,
-    ocds_ref: JsonObj,
-) -> JsonObj:
+    ocds_ref: JsonObj | None = None,
+    min_ocds_ref: JsonObj | None = None,
+) -> BuildRequest:
     """Output single tender build request."""
     if tender.get("kind") != "tender":
         raise ValueError(f"Expected kind=tender, got {tender.get('kind')}")
 
-    jurisdiction_iso = _require_str(tender, "jurisdiction_iso")
-    source_system = _require_str(tender, "source_system")
+    jurisdiction_iso = require_str(tender, "jurisdiction_iso")
+    source_system = require_str(tender, "source_system")
+    source_ref = resolve_min_ocds_ref(ocds_ref, min_ocds_ref)
 
     payload: JsonObj = {
         "jurisdictionIso": jurisdiction_iso,
@@ -59,16 +66,16 @@ def tender_build_request(
             "procurementMethod": tender.get("procurement_method"),
             "procurementMethodDetails": tender.get("procurement_method_details"),
             "mainProcurementCategory": tender.get("main_procurement_category"),
-            "value": _maybe_dict(tender, "value"),
-            "tenderPeriod": _maybe_dict(tender, "tender_period"),
+            "value": maybe_dict(tender, "value"),
+            "tenderPeriod": maybe_dict(tender, "tender_period"),
             # Keep items/lots as raw evidence; a later adapter can map them to CEP types.
-            "items": tender.get("items") if isinstance(tender.get("items"), list) else [],
-            "lots": tender.get("lots") if isinstance(tender.get("lots"), list) else [],
+            "items": maybe_list(tender, "items"),
+            "lots": maybe_list(tender, "lots"),
         },
         "source": {
             "sourceSystem": source_system,
             "sourceKind": "ocds",
-            "ocds": _min_ocds_ref(ocds_ref),
+            "ocds": source_ref,
             "tender": {
                 "ocid": tender.get("ocid"),
                 "releaseId": tender.get("release_id"),
@@ -77,34 +84,11 @@ def tender_build_request(
         },
     }
 
-    return {
-        "record_kind": "entity",
-        "record_type": "procurement.tender",
-        "jurisdiction_iso": jurisdiction_iso,
-        "source_system": source_system,
-        "source_ref": _min_ocds_ref(ocds_ref),
-        "payload": payload,
-    }
-
-
-def _min_ocds_ref(ocds_ref: JsonObj) -> JsonObj:
-    return {
-        "ocid": ocds_ref.get("ocid"),
-        "releaseId": ocds_ref.get("release_id"),
-        "date": ocds_ref.get("date"),
-        "tag": ocds_ref.get("tag"),
-    }
-
-
-def _require_str(obj: JsonObj, key: str) -> str:
-    v = obj.get(key)
-    if not isinstance(v, str) or not v.strip():
-        raise ValueError(f"Missing or invalid string field: {key}")
-    return v.strip()
-
-
-def _maybe_dict(obj: JsonObj, key: str) -> JsonObj | None:
-    v = obj.get(key)
-    if isinstance(v, dict):
-        return v
-    return None
+    return BuildRequest(
+        record_kind="entity",
+        record_type="procurement.tender",
+        jurisdiction_iso=jurisdiction_iso,
+        source_system=source_system,
+        source_ref=source_ref,
+        payload=payload,
+    )
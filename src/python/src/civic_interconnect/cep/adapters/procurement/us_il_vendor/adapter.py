@@ -19,9 +19,14 @@ one of the following keys:
 Path: src/python/src/civic_interconnect/cep/adapters/procurement/us_il_vendor/adapter.py
 """
 
+from collections.abc import Iterable
 from typing import Any
 
-from civic_interconnect.cep.adapters.base import AdapterKey, JsonDict, SimpleEntityAdapter
+from civic_interconnect.cep.adapters.base import (
+    AdapterKey,
+    JsonDict,
+    SimpleEntityAdapter,
+)
 
 
 class UsIlVendorAdapter(SimpleEntityAdapter):
@@ -71,16 +76,89 @@ class UsIlVendorAdapter(SimpleEntityAdapter):
         if not legal_name:
             raise ValueError(f"raw must contain a vendor name under one of: {', '.join(name_keys)}")
 
-        jurisdiction_iso = str(raw.get("jurisdiction_iso", "US-IL")).strip() or "US-IL"
+        return self.canonicalize_name(legal_name, str(raw.get("jurisdiction_iso", "US-IL")))
+
+    def canonicalize_name(self, vendor_name: str, jurisdiction_iso: str = "US-IL") -> JsonDict:
+        """Canonicalize a bare vendor name; same result as canonicalize() on a raw record.
+
+        For callers that already hold the name, so no raw record dict is built.
+
+        Raises:
+            ValueError: if vendor_name is empty after stripping.
+        """
+        legal_name = vendor_name.strip()
+        if not legal_name:
+            raise ValueError("vendor_name must be non-empty")
+
+        jurisdiction_iso = jurisdiction_iso.strip() or "US-IL"
 
         try:
             normalized_name = self.apply_localization_name(legal_name, jurisdiction_iso)
         except Exception:
             normalized_name = " ".join(legal_name.lower().split())
 
-        return {
-            "legalName": legal_name,
-            "legalNameNormalized": normalized_name,
-            "jurisdictionIso": jurisdiction_iso,
-            "entityType": "vendor",
-        }
+        return _canonical_record(legal_name, normalized_name, jurisdiction_iso)
+
+    def identify_names(
+        self, names: Iterable[str], jurisdiction_iso: str = "US-IL"
+    ) -> list[JsonDict]:
+        """Canonicalize, align and identify many vendor names for one jurisdiction.
+
+        Same records as compute_identity(align_schema(canonicalize(raw))) per
+        name, but the names are localized in one batched FFI call and the
+        SNFEIs are hashed in one pass (repeated names hashed once). Output
+        order matches input order. A subclass that overrides canonicalize or
+        canonicalize_name runs that step pipeline per name; one that overrides
+        compute_identity gets it called per record instead of the batched hash.
+
+        Unlike canonicalize, the batched path raises a localization failure
+        rather than replacing it with a lowercased name.
+
+        Raises:
+            ValueError: if a name is empty after stripping.
+        """
+        legal_names = [str(name).strip() for name in names]
+        if not all(legal_names):
+            raise ValueError("vendor names must be non-empty")
+
+        jurisdiction_iso = jurisdiction_iso.strip() or "US-IL"
+
+        cls = type(self)
+        if (
+            cls.canonicalize is not UsIlVendorAdapter.canonicalize
+            or cls.canonicalize_name is not UsIlVendorAdapter.canonicalize_name
+        ):
+            raws = ({"vendor_name": n, "jurisdiction_iso": jurisdiction_iso} for n in legal_names)
+            return [self.compute_identity(self.align_schema(self.canonicalize(r))) for r in raws]
+
+        normalized_names = self.apply_localization_names(legal_names, jurisdiction_iso)
+
+        align_schema = self.align_schema
+        aligned = [
+            align_schema(_canonical_record(legal_name, normalized, jurisdiction_iso))
+            for legal_name, normalized in zip(legal_names, normalized_names, strict=True)
+        ]
+
+        if type(self).compute_identity is not SimpleEntityAdapter.compute_identity:
+            compute_identity = self.compute_identity
+            return [compute_identity(record) for record in aligned]
+
+        keys = self.identity_projection_keys
+        snfeis = self.compute_snfei_batch({key: record[key] for key in keys} for record in aligned)
+        return [
+            {
+                **record,
+                "identifiers": {**(record.get("identifiers") or {}), "snfei": {"value": snfei}},
+            }
+            for record, snfei in zip(aligned, snfeis, strict=True)
+        ]
+
+
+def _canonical_record(legal_name: str, normalized_name: str, jurisdiction_iso: str) -> JsonDict:
+    """Canonical vendor dict shared by canonicalize_name and identify_names."""
+    return {
+        "legalName": legal_name,
+        "legalNameNormalized": normalized_name,
+        "jurisdictionIso": jurisdiction_iso,
+        "entityType": "vendor",
+    }
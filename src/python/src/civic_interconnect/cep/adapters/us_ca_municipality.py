@@ -4,9 +4,20 @@ This module provides an adapter for turning raw municipality
 records into normalized payloads for the CEP Entity builder.
 """
 
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import batched, islice
+import os
 from typing import Any
 
-from civic_interconnect.cep.adapters.base import AdapterKey, JsonDict, SimpleEntityAdapter
+from civic_interconnect.cep.adapters.base import (
+    AdapterContext,
+    AdapterKey,
+    JsonDict,
+    SimpleEntityAdapter,
+    compute_snfei_for_names,
+)
 from civic_interconnect.cep.localization import apply_localization_name
 
 
@@ -25,8 +36,11 @@ class UsCaMunicipalityAdapter(SimpleEntityAdapter):
         if "legal_name" not in raw:
             raise ValueError("raw must contain 'legal_name'.")
 
-        legal_name = str(raw["legal_name"]).strip()
-        jurisdiction_iso = str(raw.get("jurisdiction_iso", "US-CA")).strip()
+        # Source values are almost always str already; skip the str() call for them.
+        name = raw["legal_name"]
+        legal_name = name.strip() if isinstance(name, str) else str(name).strip()
+        juris = raw.get("jurisdiction_iso", "US-CA")
+        jurisdiction_iso = juris.strip() if isinstance(juris, str) else str(juris).strip()
 
         # Rust localization pre-normalization (jurisdiction-aware)
         localized = apply_localization_name(legal_name, jurisdiction_iso)
@@ -37,3 +51,76 @@ class UsCaMunicipalityAdapter(SimpleEntityAdapter):
             "jurisdictionIso": jurisdiction_iso,
             "entityType": "municipality",
         }
+
+
+def compute_snfei_batch(names: Iterable[str], jurisdiction_iso: str) -> list[str]:
+    """Compute SNFEI values for many normalized names in one jurisdiction.
+
+    Equivalent to running compute_identity on each record, without building
+    the intermediate aligned dicts. Output order matches input order.
+    """
+    return compute_snfei_for_names((name, jurisdiction_iso) for name in names)
+
+
+def build_municipality_entities_batch(
+    raw_records: Iterable[dict[str, Any]],
+    *,
+    context: AdapterContext | None = None,
+    workers: int | None = None,
+    chunk_size: int = 1024,
+) -> list[JsonDict]:
+    """Run the CA municipality pipeline over many raw records.
+
+    Records are independent, so chunks of chunk_size records are fanned out
+    to a process pool (workers=None uses os.cpu_count()). workers=1 runs
+    in-process. Output order matches input order.
+
+    At most 2 * workers chunks are in flight, so a large or streaming input
+    is read only as fast as the pool drains it. The context is sent to each
+    worker process once, when it starts.
+    """
+    if workers == 1:
+        return _run_chunk(tuple(raw_records), context=context)
+
+    workers = workers or os.cpu_count() or 1
+    chunks = batched(raw_records, chunk_size)
+    entities: list[JsonDict] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(context,)
+    ) as executor:
+        pending: deque[Future[list[JsonDict]]] = deque(
+            executor.submit(_run_worker_chunk, chunk) for chunk in islice(chunks, 2 * workers)
+        )
+        while pending:
+            done = pending.popleft().result()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(executor.submit(_run_worker_chunk, next_chunk))
+            entities.extend(done)
+    return entities
+
+
+def _run_chunk(
+    raws: tuple[dict[str, Any], ...],
+    *,
+    context: AdapterContext | None,
+) -> list[JsonDict]:
+    """In-process path: one adapter instance for the whole input."""
+    return UsCaMunicipalityAdapter(context).run_many(raws)
+
+
+# Per worker process; set once by the pool initializer.
+_worker_adapter: UsCaMunicipalityAdapter | None = None
+
+
+def _init_worker(context: AdapterContext | None) -> None:
+    """Pool initializer: build the worker's adapter from the shared context."""
+    global _worker_adapter  # noqa: PLW0603
+    _worker_adapter = UsCaMunicipalityAdapter(context)
+
+
+def _run_worker_chunk(raws: tuple[dict[str, Any], ...]) -> list[JsonDict]:
+    """Worker entry point: run one chunk through this process's adapter."""
+    if _worker_adapter is None:
+        raise RuntimeError("worker process was started without _init_worker")
+    return _worker_adapter.run_many(raws)
@@ -111,12 +111,10 @@ class UsFecCampaignFinanceAdapter(Adapter):
 
         snfei_value = sha256(canonical_json).hexdigest()
 
-        updated: JsonDict = dict(aligned)
-        identifiers: JsonDict = dict(updated.get("identifiers") or {})
-        identifiers["snfei"] = {"value": snfei_value}
-        updated["identifiers"] = identifiers
-
-        return updated
+        # align_schema always emits an identifiers dict: layer the SNFEI onto it
+        # in one copy instead of re-validating and rebuilding the block.
+        identifiers: JsonDict = {**aligned["identifiers"], "snfei": {"value": snfei_value}}
+        return {**aligned, "identifiers": identifiers}
 
 
 # Register for lookup via the registry
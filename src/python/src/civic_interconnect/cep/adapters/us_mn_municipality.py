@@ -34,8 +34,11 @@ class UsMnMunicipalityAdapter(SimpleEntityAdapter):
         if "legal_name" not in raw:
             raise ValueError("raw must contain 'legal_name'.")
 
-        legal_name = str(raw["legal_name"]).strip()
-        jurisdiction_iso = str(raw.get("jurisdiction_iso", "US-MN")).strip()
+        # Source values are almost always str already; skip the str() call for them.
+        name = raw["legal_name"]
+        legal_name = name.strip() if isinstance(name, str) else str(name).strip()
+        juris = raw.get("jurisdiction_iso", "US-MN")
+        jurisdiction_iso = juris.strip() if isinstance(juris, str) else str(juris).strip()
 
         # Rust localization pre-normalization (jurisdiction-aware)
         localized = apply_localization_name(legal_name, jurisdiction_iso)
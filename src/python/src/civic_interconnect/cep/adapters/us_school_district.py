@@ -4,11 +4,38 @@ This module provides an adapter for turning raw US school district records
 into normalized payloads for the CEP Entity builder.
 """
 
-from typing import Any
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, ClassVar
 
-from civic_interconnect.cep.adapters.base import AdapterKey, JsonDict, SimpleEntityAdapter
+from civic_interconnect.cep.adapters.base import (
+    AdapterKey,
+    JsonDict,
+    SimpleEntityAdapter,
+    compute_snfei_for_names,
+)
 from civic_interconnect.cep.localization import apply_localization_name
 
+try:
+    # Fused localization + SNFEI (newer cep_py builds): one FFI call per record.
+    from cep_py import (  # type: ignore
+        localize_name_with_snfei as _localize_name_with_snfei,  # type: ignore[attr-defined]
+    )
+except ImportError:
+    _localize_name_with_snfei = None  # type: ignore[assignment]
+
+try:
+    # Batch form of the fused call: one FFI crossing per run_many batch.
+    from cep_py import (  # type: ignore
+        localize_names_with_snfei as _localize_names_with_snfei,  # type: ignore[attr-defined]
+    )
+except ImportError:
+    _localize_names_with_snfei = None  # type: ignore[assignment]
+
+# Steps the native path computes in one call instead of dispatching to them,
+# plus the projection keys it hashes (fixed to the default in the fused call).
+_FUSED_STEPS = ("canonicalize", "align_schema", "compute_identity", "identity_projection_keys")
+
 
 class UsSchoolDistrictAdapter(SimpleEntityAdapter):
     """Adapter for US school district records."""
@@ -20,17 +47,49 @@ class UsSchoolDistrictAdapter(SimpleEntityAdapter):
         version="1.0.0",
     )
 
+    _native_steps: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Route subclasses that override a fused step or the projection keys to the steps."""
+        super().__init_subclass__(**kwargs)
+        cls._native_steps = all(
+            getattr(cls, name) is getattr(UsSchoolDistrictAdapter, name) for name in _FUSED_STEPS
+        )
+
+    def run(self, raw: dict[str, Any]) -> JsonDict:
+        """End-to-end pipeline; a single native call per record when available."""
+        if _localize_name_with_snfei is None or not self._native_steps:
+            return super().run(raw)
+        return self._run_native(raw)
+
+    def run_many(self, raws: Iterable[dict[str, Any]]) -> list[JsonDict]:
+        """Run the pipeline over many raw inputs; same result as [run(r) for r in raws].
+
+        With the batch native call, distinct (name, jurisdiction) pairs are
+        localized and hashed in a single FFI crossing for the whole batch.
+        Subclasses that override canonicalize, align_schema, compute_identity
+        or identity_projection_keys run the step pipeline instead, so the
+        override is honored.
+        """
+        if not self._native_steps:
+            return super().run_many(raws)
+        if _localize_names_with_snfei is not None:
+            fields = [_source_fields(raw) for raw in raws]
+            unique = list(dict.fromkeys(fields))
+            resolved = dict(zip(unique, _localize_names_with_snfei(unique), strict=True))
+            build = self._native_record
+            return [build(name, iso, *resolved[name, iso]) for name, iso in fields]
+        if _localize_name_with_snfei is None:
+            return super().run_many(raws)
+        run_native = self._run_native
+        return [run_native(raw) for raw in raws]
+
     def canonicalize(self, raw: dict[str, Any]) -> JsonDict:
         """Convert raw record into canonical form."""
-        if "legal_name" not in raw:
-            raise ValueError("raw must contain 'legal_name'.")
-        if "jurisdiction_iso" not in raw:
-            raise ValueError("raw must contain 'jurisdiction_iso'.")
-
-        legal_name = str(raw["legal_name"]).strip()
-        jurisdiction_iso = str(raw["jurisdiction_iso"]).strip()
+        legal_name, jurisdiction_iso = _source_fields(raw)
 
-        # Rust localization pre-normalization (jurisdiction-aware)
+        # Rust localization pre-normalization (jurisdiction-aware); apply_localization_name
+        # memoizes per pair. SNFEI for a repeated projection is memoized in the base class.
         localized = apply_localization_name(legal_name, jurisdiction_iso)
 
         return {
@@ -39,3 +98,58 @@ class UsSchoolDistrictAdapter(SimpleEntityAdapter):
             "jurisdictionIso": jurisdiction_iso,
             "entityType": "school_district",
         }
+
+    def _run_native(self, raw: dict[str, Any]) -> JsonDict:
+        """Build the step pipeline's record, with localization and SNFEI in one FFI call."""
+        legal_name, jurisdiction_iso = _source_fields(raw)
+        localized, snfei_value = _localized_name_with_snfei(legal_name, jurisdiction_iso)
+        return self._native_record(legal_name, jurisdiction_iso, localized, snfei_value)
+
+    def _native_record(
+        self, legal_name: str, jurisdiction_iso: str, localized: str, snfei_value: str
+    ) -> JsonDict:
+        """Assemble the attested record from natively computed fields."""
+        record: JsonDict = {
+            "entityType": "school_district",
+            "jurisdictionIso": jurisdiction_iso,
+            "legalName": legal_name,
+            "legalNameNormalized": localized,
+            "identifiers": {"snfei": {"value": snfei_value}},
+        }
+        return self.attach_attestation(record, inplace=True)
+
+
+def _source_fields(raw: dict[str, Any]) -> tuple[str, str]:
+    """Validate and strip the (legal_name, jurisdiction_iso) source fields."""
+    if "legal_name" not in raw:
+        raise ValueError("raw must contain 'legal_name'.")
+    if "jurisdiction_iso" not in raw:
+        raise ValueError("raw must contain 'jurisdiction_iso'.")
+
+    # Source values are almost always str already; skip the str() call for them.
+    name = raw["legal_name"]
+    legal_name = name.strip() if isinstance(name, str) else str(name).strip()
+    juris = raw["jurisdiction_iso"]
+    jurisdiction_iso = juris.strip() if isinstance(juris, str) else str(juris).strip()
+    return legal_name, jurisdiction_iso
+
+
+@lru_cache(maxsize=100_000)
+def _localized_name_with_snfei(legal_name: str, jurisdiction_iso: str) -> tuple[str, str]:
+    """(localized name, SNFEI) via the fused native call, memoized per pair.
+
+    Re-ingests and snapshot diffs repeat the same rows; both values are pure
+    functions of their inputs, so repeats skip the FFI call. Tests that change
+    localization behavior can call _localized_name_with_snfei.cache_clear().
+    """
+    return _localize_name_with_snfei(legal_name, jurisdiction_iso)  # type: ignore[misc]
+
+
+def compute_snfei_batch(names: Iterable[str], jurisdictions: Iterable[str]) -> list[str]:
+    """Compute SNFEI values for parallel sequences of normalized names and jurisdictions.
+
+    School districts span states, so each name carries its own jurisdiction.
+    Equivalent to running compute_identity on each record. Output order
+    matches input order; the two inputs must have the same length.
+    """
+    return compute_snfei_for_names(zip(names, jurisdictions, strict=True))
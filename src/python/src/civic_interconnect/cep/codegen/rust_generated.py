@@ -17,6 +17,7 @@ uv run python src/python/src/civic_interconnect/cep/codegen/rust_generated.py
 
 from __future__ import annotations
 
+from functools import cache
 import json
 from pathlib import Path
 import re
@@ -178,9 +179,15 @@ def _generate_enum_from_vocabulary(vocab_path: Path, enum_name: str) -> str:
     return _generate_string_enum(enum_name, values)
 
 
+@cache
 def _repo_root_from_schema_path(schema_path: Path) -> Path:
-    """Best-effort repo root discovery (walk parents until a 'schemas' dir exists)."""
-    for p in [schema_path.resolve()] + list(schema_path.resolve().parents):
+    """Best-effort repo root discovery (walk parents until a 'schemas' dir exists).
+
+    Cached per schema path: every remote $ref of a schema resolves against the
+    same root, so the upward walk (one stat per parent) runs once per file.
+    """
+    resolved = schema_path.resolve()
+    for p in [resolved, *resolved.parents]:
         if (p / "schemas").exists():
             return p
     # Fallback: current working directory.
@@ -891,8 +898,18 @@ def generate_rust_struct(schema_path: Path, struct_name: str) -> str:
     return "\n".join(lines)
 
 
-def write_generated_rust(schema_path: Path, struct_name: str, out_path: Path) -> None:
-    """Generate Rust code from schema_path and write to out_path."""
+def write_generated_rust(schema_path: Path, struct_name: str, out_path: Path) -> bool:
+    """Generate Rust code from schema_path and write to out_path.
+
+    An existing out_path whose content already matches is left untouched (so
+    its mtime does not trigger a cargo rebuild). Returns True if it was written.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
     rust_code = generate_rust_struct(schema_path, struct_name)
+    try:
+        if out_path.read_text(encoding="utf-8") == rust_code:
+            return False
+    except FileNotFoundError:
+        pass
     out_path.write_text(rust_code, encoding="utf-8")
+    return True
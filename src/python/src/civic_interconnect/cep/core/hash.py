@@ -23,7 +23,13 @@ class CanonicalHash:
         """
         if len(hex_value) != 64:
             raise ValueError(f"Hash must be 64 hex characters, got {len(hex_value)}")
-        if not all(c in "0123456789abcdefABCDEF" for c in hex_value):
+        # bytes.fromhex scans in C; with 64 characters, 32 bytes out means no
+        # whitespace was skipped, so every character is a hex digit.
+        try:
+            is_hex = len(bytes.fromhex(hex_value)) == 32
+        except ValueError:
+            is_hex = False
+        if not is_hex:
             raise ValueError("Hash must contain only hexadecimal characters")
         self._hex = hex_value.lower()
 
@@ -37,9 +43,8 @@ class CanonicalHash:
         Returns:
             A CanonicalHash instance.
         """
-        hasher = hashlib.sha256()
-        hasher.update(canonical.encode("utf-8"))
-        return cls(hasher.hexdigest())
+        # One-shot digest; hashlib's OpenSSL backend uses SHA-NI where available.
+        return cls(hashlib.sha256(canonical.encode("utf-8")).hexdigest())
 
     @classmethod
     def from_hex(cls, hex_value: str) -> Optional["CanonicalHash"]:
@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 import json
+import os
 from pathlib import Path
 
 from referencing import Registry, Resource
@@ -17,6 +18,9 @@ def _schema_version() -> str:
     return f"{parts[0]}.{parts[1]}"
 
 
+# Environment variable that pins the repository root and skips discovery
+REPO_ROOT_ENV = "CEP_REPO_ROOT"
+
 # Map (name, version) to relative paths from repo root
 SCHEMA_CATALOG = {
     ("entity", "1.0"): "schemas/core/cep.entity.schema.json",
@@ -27,18 +31,35 @@ SCHEMA_CATALOG = {
 
 
 def _find_repo_root() -> Path:
-    """Walk up from current file to find repository root."""
+    """Find the repository root.
+
+    CEP_REPO_ROOT, when set, is used as-is. It is read on every call, so a
+    changed value takes effect; only the filesystem walk is cached.
+    """
+    override = os.environ.get(REPO_ROOT_ENV)
+    if override:
+        return Path(override)
+    return _discover_repo_root()
+
+
+@lru_cache(maxsize=1)
+def _discover_repo_root() -> Path:
+    """Walk up from this file to the first directory containing pyproject.toml."""
     current = Path(__file__).resolve().parent
-    for parent in [current, *current.parents]:
-        if (parent / "pyproject.toml").exists():
+    for parent in (current, *current.parents):
+        if (parent / "pyproject.toml").is_file():
             return parent
     raise RuntimeError("Could not find repository root")
 
 
-@lru_cache(maxsize=1)
 def _build_global_registry() -> tuple[Registry, dict]:
-    """Build registry containing all CEP schemas. Cached on first call."""
-    repo_root = _find_repo_root()
+    """Build registry containing all CEP schemas under the current repo root."""
+    return _build_registry(_find_repo_root())
+
+
+@lru_cache(maxsize=4)
+def _build_registry(repo_root: Path) -> tuple[Registry, dict]:
+    """Build registry for one repo root. Cached per root."""
     schemas = {}
     resources = []
 
@@ -18,6 +18,12 @@ File: src/python/src/civic_interconnect/cep/entity/api.py
 import json
 from typing import Any
 
+try:
+    # Optional accelerator for the JSON handoff to and from the Rust builder.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 try:
     # Native extension from src/rust/cep-py, if built and on PYTHONPATH.
     from cep_py import (  # type: ignore
@@ -29,6 +35,14 @@ except ImportError:
     _build_entity_json_native = None  # type: ignore[assignment]
     _HAS_NATIVE = False
 
+try:
+    # Dict-in/dict-out builder (newer cep_py builds); skips the JSON text round-trip.
+    from cep_py import (  # type: ignore
+        build_entity_dict as _build_entity_dict_native,  # type: ignore[attr-defined]
+    )
+except ImportError:
+    _build_entity_dict_native = None  # type: ignore[assignment]
+
 
 # Public flag so tools and tests can see what is available.
 HAS_NATIVE_BACKEND: bool = _HAS_NATIVE
@@ -45,8 +59,10 @@ def build_entity_from_raw(raw: dict[str, Any]) -> dict[str, Any]:
     - entityType: domain type label such as "municipality", "school_district", etc.
     - attestations: list[dict], MUST be non-empty (record-envelope requirement)
 
-    This function delegates to Rust via cep_py. If cep_py is not available,
-    it raises an error. If Rust validation fails, it raises and does not fallback.
+    This function delegates to Rust via cep_py, passing the dict directly when
+    the extension provides build_entity_dict and JSON text otherwise. If cep_py
+    is not available, it raises an error. If Rust validation fails, it raises
+    and does not fallback.
     """
     if not HAS_NATIVE_BACKEND or _build_entity_json_native is None:
         raise RuntimeError(
@@ -56,9 +72,11 @@ def build_entity_from_raw(raw: dict[str, Any]) -> dict[str, Any]:
     _validate_minimal_raw_payload(raw)
 
     try:
-        input_json = json.dumps(raw, sort_keys=True)
+        if _build_entity_dict_native is not None:
+            return _build_entity_dict_native(raw)  # type: ignore[misc]
+        input_json = _dumps_for_native(raw)
         output_json = _build_entity_json_native(input_json)  # type: ignore[misc]
-        entity: dict[str, Any] = json.loads(output_json)
+        entity: dict[str, Any] = orjson.loads(output_json) if orjson else json.loads(output_json)
         return entity
     except Exception as exc:
         # Provide a clearer error for the most common failure mode.
@@ -72,18 +90,35 @@ def build_entity_from_raw(raw: dict[str, Any]) -> dict[str, Any]:
         raise
 
 
-def _validate_minimal_raw_payload(raw: dict[str, Any]) -> None:
-    required_keys = [
+def _dumps_for_native(raw: dict[str, Any]) -> str:
+    """Serialize a payload for the Rust builder (sorted keys, as before).
+
+    Payloads must be JSON-native (str, int, float, bool, None, dict, list).
+    orjson emits non-ASCII as UTF-8 rather than ASCII escapes; both parse to
+    the same values on the Rust side.
+    """
+    if orjson is not None:
+        return orjson.dumps(raw, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(raw, sort_keys=True)
+
+
+# Keys every normalized payload must carry; checked as one set difference.
+_REQUIRED_KEYS: frozenset[str] = frozenset(
+    {
         "jurisdictionIso",
         "legalName",
         "legalNameNormalized",
         "snfei",
         "entityType",
         "attestations",
-    ]
-    missing = [k for k in required_keys if k not in raw]
+    }
+)
+
+
+def _validate_minimal_raw_payload(raw: dict[str, Any]) -> None:
+    missing = _REQUIRED_KEYS - raw.keys()
     if missing:
-        raise ValueError(f"Normalized entity payload is missing keys: {missing}")
+        raise ValueError(f"Normalized entity payload is missing keys: {sorted(missing)}")
 
     attestations = raw.get("attestations")
     if not isinstance(attestations, list) or len(attestations) < 1:
@@ -6,6 +6,7 @@ from civic_interconnect.cep.snfei.localization import (
     apply_localization_name,
     apply_localization_name_detailed,
     apply_localization_name_detailed_json,
+    apply_localization_names,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "apply_localization_name",
     "apply_localization_name_detailed",
     "apply_localization_name_detailed_json",
+    "apply_localization_names",
 ]
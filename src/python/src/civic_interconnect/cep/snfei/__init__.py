@@ -10,6 +10,9 @@ Design contract:
 Expected Rust FFI surface (names must match exactly):
 SNFEI:
 - generate_snfei(...)
+- generate_snfei_batch(...)
+- generate_snfei_full(...)
+- compute_snfei(...)
 - generate_snfei_detailed_json(...)
 - generate_snfei_detailed(...)
 
@@ -19,19 +22,31 @@ Normalizers:
 - normalize_registration_date(...)
 """
 
-import json
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import batched
+import os
 from typing import Any
 
 import cep_py as _core
 
+from civic_interconnect.cep.snfei.normalizer import CanonicalInput
 
+
+@lru_cache(maxsize=65536)
 def generate_snfei(
     legal_name: str,
     country_code: str,
     address: str | None = None,
     registration_date: str | None = None,
 ) -> str:
-    """Return SNFEI as a 64-char lowercase hex string via the Rust core."""
+    """Return SNFEI as a 64-char lowercase hex string via the Rust core.
+
+    The SNFEI is a pure function of the raw inputs and batch ingestion repeats
+    entities heavily, so results are memoized (bounded LRU); see
+    generate_snfei.cache_info() / cache_clear().
+    """
     return _core.generate_snfei(
         legal_name,
         country_code,
@@ -40,6 +55,76 @@ def generate_snfei(
     )
 
 
+def generate_snfei_batch(
+    rows: Iterable[tuple[str, str, str | None, str | None]],
+) -> list[str]:
+    """Return SNFEI values for (legal_name, country_code, address, registration_date) rows.
+
+    Same values as generate_snfei per row, in one FFI call for the batch.
+    Output order matches input order.
+    """
+    return _core.generate_snfei_batch(list(rows))
+
+
+def generate_snfei_parallel(
+    rows: Iterable[tuple[str, str, str | None, str | None]],
+    *,
+    workers: int | None = None,
+    chunk_size: int = 4096,
+) -> list[str]:
+    """Return generate_snfei_batch(rows), computed on a thread pool.
+
+    The Rust batch call releases the GIL, so chunks of chunk_size rows run
+    concurrently (workers=None uses os.cpu_count()). workers=1 runs in the
+    calling thread. Output order matches input order.
+    """
+    if workers == 1:
+        return generate_snfei_batch(rows)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return [
+            snfei
+            for chunk in executor.map(generate_snfei_batch, batched(rows, chunk_size))
+            for snfei in chunk
+        ]
+
+
+def generate_snfei_full(
+    legal_name: str,
+    country_code: str,
+    address: str | None = None,
+    registration_date: str | None = None,
+) -> tuple[str, str, str | None, str, str | None]:
+    """Return the SNFEI with the normalized fields it was hashed from.
+
+    The tuple is (snfei, legal_name_normalized, address_normalized,
+    country_code, registration_date), from one Rust call that normalizes and
+    hashes. Same values as the `snfei` and `canonical` of
+    generate_snfei_detailed, without tiering or a JSON round-trip.
+    """
+    return _core.generate_snfei_full(
+        legal_name,
+        country_code,
+        address,
+        registration_date,
+    )
+
+
+def compute_snfei(canonical: CanonicalInput) -> str:
+    """Return the SNFEI of an already-normalized canonical snapshot.
+
+    For callers that already hold the output of build_canonical_input (or the
+    `canonical` block of generate_snfei_detailed): the Rust core only hashes,
+    it does not normalize the fields again.
+    """
+    return _core.compute_snfei(
+        canonical["legalNameNormalized"],
+        canonical["countryCode"],
+        canonical.get("addressNormalized"),
+        canonical.get("registrationDate"),
+    )
+
+
 def generate_snfei_detailed_json(
     legal_name: str,
     country_code: str,
@@ -71,12 +156,12 @@ def generate_snfei_detailed(
     lei: str | None = None,
     sam_uei: str | None = None,
 ) -> dict[str, Any]:
-    """Return SNFEI pipeline metadata as a parsed dict via the Rust core.
+    """Return SNFEI pipeline metadata as a dict via the Rust core.
 
-    If the Rust FFI returns a dict already, we return it.
-    If it returns a JSON string, we parse it.
+    Same content as json.loads(generate_snfei_detailed_json(...)); the Rust
+    core builds the dict directly, without a JSON text round-trip.
     """
-    raw = _core.generate_snfei_detailed(
+    return _core.generate_snfei_detailed(
         legal_name,
         country_code,
         address,
@@ -85,11 +170,6 @@ def generate_snfei_detailed(
         sam_uei,
     )
 
-    if isinstance(raw, str):
-        return json.loads(raw)
-
-    return raw
-
 
 def normalize_legal_name(value: str) -> str:
     """Normalize a legal name using the Rust core."""
@@ -108,6 +188,10 @@ def normalize_registration_date(value: str) -> str | None:
 
 __all__ = [
     "generate_snfei",
+    "generate_snfei_batch",
+    "generate_snfei_parallel",
+    "generate_snfei_full",
+    "compute_snfei",
     "generate_snfei_detailed_json",
     "generate_snfei_detailed",
     "normalize_legal_name",
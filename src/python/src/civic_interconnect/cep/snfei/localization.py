@@ -13,8 +13,10 @@ This module exists for two reasons:
 Path: src/python/src/civic_interconnect/cep/snfei/localization.py
 """
 
+from collections.abc import Callable, Iterable
+from functools import cache, lru_cache
 import json
-from typing import TypedDict, cast
+from typing import Any, TypedDict, cast
 
 import cep_py as _core
 
@@ -55,6 +57,7 @@ class LocalizationApplyResult(TypedDict):
 # =============================================================================
 
 
+@cache
 def _get_ffi(*names: str):
     """Return the first existing callable from `cep_py` among `names`.
 
@@ -69,6 +72,9 @@ def _get_ffi(*names: str):
     Failure mode:
     - If none of the candidate names exist in the installed `cep_py` module,
       we raise AttributeError with a precise message listing expected names.
+
+    Resolution is cached per name tuple: the extension module does not change
+    at runtime, and adapters call this once per record. Failures are not cached.
     """
     for n in names:
         fn = getattr(_core, n, None)
@@ -77,11 +83,38 @@ def _get_ffi(*names: str):
     raise AttributeError(f"cep_py is missing expected function(s): {', '.join(names)}")
 
 
+def _first_callable(*names: str) -> Callable[..., Any]:
+    """Resolve `names` like _get_ffi, once, for a module-level binding.
+
+    If none of the names is exported, the returned stand-in raises _get_ffi's
+    AttributeError when called, so a partial `cep_py` build still imports and
+    fails only at the call site, as before.
+    """
+    try:
+        return _get_ffi(*names)
+    except AttributeError as error:
+        message = str(error)
+
+    def missing(*_args: Any, **_kwargs: Any) -> Any:
+        raise AttributeError(message)
+
+    return missing
+
+
+# Bound at import: the extension module does not change at runtime, so the hot
+# per-record entry points call these directly instead of resolving per call.
+_apply_localization_name_ffi = _first_callable("apply_localization_name")
+_detailed_json_ffi = getattr(_core, "apply_localization_name_detailed_json", None)
+_detailed_ffi = getattr(_core, "apply_localization_name_detailed", None)
+_apply_localization_names_ffi = getattr(_core, "apply_localization_names", None)
+
+
 # =============================================================================
 # Public API (stable call surface for the Python package)
 # =============================================================================
 
 
+@lru_cache(maxsize=65536)
 def apply_localization_name(name: str, jurisdiction: str) -> str:
     """Apply Rust localization to `name` for `jurisdiction` and return a string.
 
@@ -91,9 +124,38 @@ def apply_localization_name(name: str, jurisdiction: str) -> str:
 
     The output is expected to be a normalized/localized string produced by the
     Rust localization layer (often a "pre-normalization" rewrite stage).
+
+    Results are memoized per (name, jurisdiction): the embedded configs are
+    fixed for the process, and bulk inputs repeat names heavily. Errors are
+    not cached; call apply_localization_name.cache_clear() to drop entries.
+    """
+    return cast("str", _apply_localization_name_ffi(name, jurisdiction))
+
+
+def apply_localization_names(names: Iterable[str], jurisdiction: str) -> list[str]:
+    """Apply Rust localization to many names for one `jurisdiction`.
+
+    Same result as calling apply_localization_name per name. Repeated names
+    (common in bulk registry dumps) are localized only once, and with the
+    batch export (cep_py.apply_localization_names) all unique names cross the
+    FFI boundary in one call. Output order matches input order.
     """
-    fn = _get_ffi("apply_localization_name")
-    return cast("str", fn(name, jurisdiction))
+    batch = _apply_localization_names_ffi
+    if batch is not None:
+        names = list(names)
+        unique = list(dict.fromkeys(names))
+        localized = dict(zip(unique, batch(unique, jurisdiction), strict=True))
+        return [localized[name] for name in names]
+
+    fn = _apply_localization_name_ffi
+    cache: dict[str, str] = {}
+    out: list[str] = []
+    for name in names:
+        value = cache.get(name)
+        if value is None:
+            value = cache[name] = cast("str", fn(name, jurisdiction))
+        out.append(value)
+    return out
 
 
 def apply_localization_name_detailed_json(name: str, jurisdiction: str) -> str:
@@ -110,7 +172,7 @@ def apply_localization_name_detailed_json(name: str, jurisdiction: str) -> str:
     - This makes it suitable for golden files, snapshots, and CLI output.
     """
     # Prefer an explicit JSON-returning FFI if it exists.
-    fn = getattr(_core, "apply_localization_name_detailed_json", None)
+    fn = _detailed_json_ffi
     if fn is not None:
         raw = fn(name, jurisdiction)
         return cast("str", raw)
@@ -132,8 +194,10 @@ def apply_localization_name_detailed(name: str, jurisdiction: str) -> Localizati
     """Apply Rust localization and return a parsed dict with provenance.
 
     Implementation detail:
-    - We call apply_localization_name_detailed_json(...) to ensure we always
-      consume a JSON string, then json.loads it.
+    - When cep_py.apply_localization_name_detailed builds the dict natively,
+      it is returned as-is (no JSON serialize/parse round-trip).
+    - Otherwise we call apply_localization_name_detailed_json(...) and
+      json.loads it.
 
     This yields a stable Python shape:
     {
@@ -141,6 +205,13 @@ def apply_localization_name_detailed(name: str, jurisdiction: str) -> Localizati
       "provenance": { ... }
     }
     """
+    fn = _detailed_ffi
+    if fn is not None:
+        raw = fn(name, jurisdiction)
+        if isinstance(raw, dict):
+            return cast("LocalizationApplyResult", raw)
+        return cast("LocalizationApplyResult", json.loads(raw))
+
     return cast(
         "LocalizationApplyResult",
         json.loads(apply_localization_name_detailed_json(name, jurisdiction)),
@@ -153,4 +224,5 @@ __all__ = [
     "apply_localization_name",
     "apply_localization_name_detailed",
     "apply_localization_name_detailed_json",
+    "apply_localization_names",
 ]
@@ -15,28 +15,33 @@ This module exists only to provide a stable Python surface:
 There is no business logic here; everything delegates to Rust.
 """
 
-from typing import TypedDict
+import json
+from typing import Required, TypedDict
 
 import cep_py as _core
 
+# Older cep_py builds do not export generate_snfei_full; build_canonical_input
+# falls back to the detailed JSON pipeline there.
+_snfei_full_ffi = getattr(_core, "generate_snfei_full", None)
+
 
 class CanonicalInput(TypedDict, total=False):
     """Canonical snapshot returned by the Rust SNFEI pipeline.
 
     This mirrors the shape of the `canonical` block in SnfeiResult as
-    serialized by serde_json:
+    serialized by serde_json, in the same key order:
 
         {
             "legalNameNormalized": str,
-            "countryCode": str,
             "addressNormalized": str | None,
+            "countryCode": str,
             "registrationDate": str | None,
             ...
         }
     """
 
-    legalNameNormalized: str
-    countryCode: str
+    legalNameNormalized: Required[str]
+    countryCode: Required[str]
     addressNormalized: str | None
     registrationDate: str | None
 
@@ -69,34 +74,41 @@ def build_canonical_input(
 ) -> CanonicalInput:
     """Build a canonical snapshot via the Rust SNFEI pipeline.
 
-    TODO: Implement a dedicated Rust function to build just the canonical
-    snapshot without computing the SNFEI hash.
-
-    For now, we reuse the Rust SNFEI pipeline and extract its `canonical`
-    section. This guarantees that:
+    Uses the single native generate_snfei_full call and keeps its normalized
+    fields; the hash it also returns is cheap next to normalization. This
+    guarantees that:
 
     - Canonicalization happens exactly once (in Rust).
     - The canonical shape matches what SNFEI actually uses.
 
-    For normalization (without the hash), this is still
-    safe because SNFEI does not mutate the canonical fields; it only reads them.
+    Pass the result to civic_interconnect.cep.snfei.compute_snfei to hash it
+    without normalizing again. Without generate_snfei_full (older cep_py), the
+    `canonical` block of generate_snfei_detailed_json is used instead; both
+    paths return the keys in the Rust struct's serialization order.
 
     Returns:
         CanonicalInput dict with the normalized fields.
     """
-    # Import here to avoid cycles: civic_interconnect.cep.snfei.__init__
-    from civic_interconnect.cep.snfei import generate_snfei_detailed
-
-    detailed = generate_snfei_detailed(
-        legal_name=legal_name,
-        country_code=country_code,
-        address=address,
-        registration_date=registration_date,
-        lei=None,
-        sam_uei=None,
+    if _snfei_full_ffi is None:
+        detailed = json.loads(
+            _core.generate_snfei_detailed_json(
+                legal_name, country_code, address, registration_date, None, None
+            )
+        )
+        return detailed["canonical"]
+
+    _snfei, name_norm, address_norm, country, date_norm = _snfei_full_ffi(
+        legal_name,
+        country_code,
+        address,
+        registration_date,
     )
-    # Trust Rust's canonical structure; we only type it.
-    return detailed["canonical"]  # type: ignore[return-value]
+    return {
+        "legalNameNormalized": name_norm,
+        "addressNormalized": address_norm,
+        "countryCode": country,
+        "registrationDate": date_norm,
+    }
 
 
 __all__ = [
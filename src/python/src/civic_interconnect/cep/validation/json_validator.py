@@ -7,10 +7,13 @@ This module is imported by the CLI, and contains domain-specific logic:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 import json
+import os
 from pathlib import Path
 
 from civic_interconnect.cep.core import get_registry, get_schema
+from civic_interconnect.cep.core.schema_registry import REPO_ROOT_ENV
 from jsonschema import Draft202012Validator
 from jsonschema import ValidationError as JsonSchemaError
 
@@ -55,9 +58,22 @@ def _iter_json_files(path: Path, recursive: bool) -> list[Path]:
 
 
 def _find_repo_root(start: Path | None = None) -> Path:
-    """Find the repository root by walking up until pyproject.toml is found."""
-    path = (start or Path(__file__)).resolve()
-    for parent in [path] + list(path.parents):
+    """Find the repository root by walking up until pyproject.toml is found.
+
+    Without a start path, CEP_REPO_ROOT (when set) is used as-is and no walk
+    is done. The variable is read on every call; only the walk is memoized
+    per start path, so repeated schema loads do not re-probe the filesystem.
+    """
+    if start is None:
+        override = os.environ.get(REPO_ROOT_ENV)
+        if override:
+            return Path(override)
+    return _walk_to_repo_root((start or Path(__file__)).resolve())
+
+
+@lru_cache(maxsize=8)
+def _walk_to_repo_root(path: Path) -> Path:
+    for parent in (path, *path.parents):
         if (parent / "pyproject.toml").is_file():
             return parent
     raise RuntimeError("Could not find repository root (pyproject.toml not found).")
@@ -107,6 +123,16 @@ def _format_schema_error(err: JsonSchemaError) -> str:
     return f"{err.message} (instance path: {instance_path}; schema path: {schema_path})"
 
 
+@lru_cache(maxsize=8)
+def _load_validator(schema_name: str) -> Draft202012Validator:
+    """Build the validator for a logical schema name (memoized per name).
+
+    Validators are stateless across documents, so repeated validate_json_path
+    calls in one process reuse the same instance.
+    """
+    return Draft202012Validator(get_schema(schema_name), registry=get_registry())
+
+
 def validate_json_path(
     path: Path,
     schema_name: str,
@@ -122,9 +148,7 @@ def validate_json_path(
     Returns:
         ValidationSummary with per-file results.
     """
-    schema = get_schema(schema_name)
-    registry = get_registry()
-    validator = Draft202012Validator(schema, registry=registry)
+    validator = _load_validator(schema_name)
 
     json_files = _iter_json_files(path, recursive=recursive)
     results: list[FileValidationResult] = []
@@ -16,6 +16,7 @@ uv run cx generate-example examples/entity --overwrite
 """
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import PackageNotFoundError, version
 import json
 from pathlib import Path
@@ -28,20 +29,11 @@ from civic_interconnect.cep.adapters.demo_entities import (
     find_example_slices,
     load_raw_source,
 )
-from civic_interconnect.cep.codegen.python_constants import (
-    DEFAULT_ENTITY_CONSTANTS_OUT,
-    write_entity_constants,
-)
-from civic_interconnect.cep.codegen.python_constants import (
-    DEFAULT_ENTITY_SCHEMA as DEFAULT_ENTITY_SCHEMA_FOR_CONSTANTS,
-)
-from civic_interconnect.cep.codegen.rust_generated import write_generated_rust
 from civic_interconnect.cep.entity.api import build_entity_from_raw
 from civic_interconnect.cep.snfei import generate_snfei_detailed
-from civic_interconnect.cep.validation.json_validator import (
-    ValidationSummary,
-    validate_json_path,
-)
+
+# Codegen and schema validation (jsonschema) are imported inside their
+# commands, so `cx snfei` / `cx version` do not pay for them at startup.
 
 app = typer.Typer(help="Civic Exchange Protocol CLI")
 
@@ -88,10 +80,19 @@ def _canonical_snapshot_from_result(snfei_result: dict[str, Any]) -> dict[str, A
     }
 
 
-def _example_attestations(raw: dict[str, Any], slice_dir: Path) -> list[dict[str, Any]]:
-    # TODO: Change in production - Deterministic timestamp for examples (keeps git diffs stable).
-    ts = "1900-01-01T00:00:00Z"
+# Fields shared by every example attestation; per-slice fields are layered on.
+# TODO: Change in production - Deterministic timestamp for examples (keeps git diffs stable).
+_EXAMPLE_ATTESTATION_TEMPLATE: dict[str, Any] = {
+    "attestationTimestamp": "1900-01-01T00:00:00Z",
+    "attestorId": "urn:ci:attestor:example",
+    "verificationMethodUri": "urn:ci:verification-method:manual",
+    "proofType": "ManualAttestation",
+    "proofPurpose": "assertionMethod",
+    "proofValue": "",
+}
+
 
+def _example_attestations(raw: dict[str, Any], slice_dir: Path) -> list[dict[str, Any]]:
     source_system = ""
     v = raw.get("source_system")
     if isinstance(v, str):
@@ -104,12 +105,7 @@ def _example_attestations(raw: dict[str, Any], slice_dir: Path) -> list[dict[str
 
     return [
         {
-            "attestationTimestamp": ts,
-            "attestorId": "urn:ci:attestor:example",
-            "verificationMethodUri": "urn:ci:verification-method:manual",
-            "proofType": "ManualAttestation",
-            "proofPurpose": "assertionMethod",
-            "proofValue": "",
+            **_EXAMPLE_ATTESTATION_TEMPLATE,
             "sourceSystem": source_system or "examples",
             "sourceReference": source_ref,
             "anchorUri": None,
@@ -152,6 +148,14 @@ def codegen_python_constants(
     Currently generates:
     - civic_interconnect.cep.constants.entity_fields
     """
+    from civic_interconnect.cep.codegen.python_constants import (
+        DEFAULT_ENTITY_CONSTANTS_OUT,
+        write_entity_constants,
+    )
+    from civic_interconnect.cep.codegen.python_constants import (
+        DEFAULT_ENTITY_SCHEMA as DEFAULT_ENTITY_SCHEMA_FOR_CONSTANTS,
+    )
+
     if entity_schema is None:
         entity_schema = DEFAULT_ENTITY_SCHEMA_FOR_CONSTANTS
     if entity_out is None:
@@ -171,6 +175,8 @@ def codegen_rust(
     exchange_out: Path | None = None,
 ) -> None:
     """Generate Rust types from CEP JSON Schemas into generated.rs files."""
+    from civic_interconnect.cep.codegen.rust_generated import write_generated_rust
+
     if entity_schema is None:
         entity_schema = DEFAULT_ENTITY_SCHEMA
     if relationship_schema is None:
@@ -184,13 +190,17 @@ def codegen_rust(
     if exchange_out is None:
         exchange_out = DEFAULT_EXCHANGE_OUT
 
-    write_generated_rust(entity_schema, "EntityRecord", entity_out)
-    write_generated_rust(relationship_schema, "RelationshipRecord", relationship_out)
-    write_generated_rust(exchange_schema, "ExchangeRecord", exchange_out)
+    jobs = [
+        (entity_schema, "EntityRecord", entity_out),
+        (relationship_schema, "RelationshipRecord", relationship_out),
+        (exchange_schema, "ExchangeRecord", exchange_out),
+    ]
+    # The three schemas are independent; generate them concurrently.
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        written = list(executor.map(lambda job: write_generated_rust(*job), jobs))
 
-    typer.echo(f"Wrote {entity_out}")
-    typer.echo(f"Wrote {relationship_out}")
-    typer.echo(f"Wrote {exchange_out}")
+    for (_, _, out), was_written in zip(jobs, written, strict=True):
+        typer.echo(f"Wrote {out}" if was_written else f"Unchanged {out}")
 
 
 @app.command("generate-example")
@@ -322,6 +332,11 @@ def validate_json(
     ),
 ) -> None:
     """Validate JSON file(s) against a CEP JSON Schema."""
+    from civic_interconnect.cep.validation.json_validator import (
+        ValidationSummary,
+        validate_json_path,
+    )
+
     if path is None:
         typer.echo("Error: Path argument is required.")
         raise typer.Exit(code=1)
@@ -173,20 +173,26 @@ COMMON_ABBREVIATIONS: dict[str, str] = {
     "sr": "senior",
 }
 
-# Stop words to remove (after normalization)
-STOP_WORDS: set[str] = {
-    "the",
-    "of",
-    "a",
-    "an",
-    "and",
-    "for",
-    "in",
-    "on",
-    "at",
-    "to",
-    "by",
-}
+# Single lookup table for token expansion. Legal suffixes take precedence over
+# common abbreviations, so they are merged last.
+_TOKEN_EXPANSIONS: dict[str, str] = {**COMMON_ABBREVIATIONS, **LEGAL_SUFFIX_EXPANSIONS}
+
+# Stop words to remove (after normalization); immutable, membership-tested per token
+STOP_WORDS: frozenset[str] = frozenset(
+    {
+        "the",
+        "of",
+        "a",
+        "an",
+        "and",
+        "for",
+        "in",
+        "on",
+        "at",
+        "to",
+        "by",
+    }
+)
 
 # Entity type indicators (helps with classification, not removed)
 ENTITY_TYPE_INDICATORS: set[str] = {
@@ -222,10 +228,17 @@ def _to_ascii(text: str) -> str:
 
     Handles accented characters, special quotes, etc.
     """
-    # Normalize to NFD (decomposed form)
-    normalized = unicodedata.normalize("NFD", text)
-    # Remove combining characters (accents)
-    ascii_text = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+    if text.isascii():
+        # Most names are ASCII: NFD and combining-mark removal are identities.
+        ascii_text = text
+    else:
+        # Normalize to NFD (decomposed form), unless it already is
+        if unicodedata.is_normalized("NFD", text):
+            normalized = text
+        else:
+            normalized = unicodedata.normalize("NFD", text)
+        # Remove combining characters (accents)
+        ascii_text = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
     # Handle special characters that don't decompose
     replacements = {
         "æ": "ae",
@@ -289,10 +302,13 @@ def _expand_token(token: str) -> str:
 
 
 def _expand_abbreviations(text: str) -> str:
-    """Expand all abbreviations in the text."""
-    tokens = text.split()
-    expanded = [_expand_token(t) for t in tokens]
-    return " ".join(expanded)
+    """Expand all abbreviations in the text.
+
+    Same result as applying _expand_token to each token, with one dict probe
+    per token and no per-token function call.
+    """
+    expand = _TOKEN_EXPANSIONS.get
+    return " ".join([expand(t, t) for t in text.lower().split()])
 
 
 def _remove_stop_words(text: str, preserve_initial: bool = True) -> str:
@@ -436,6 +452,9 @@ SECONDARY_UNIT_PATTERNS = [
     r"\bbuilding\s*\w+",
 ]
 
+# Compiled once; normalize_address runs these on every address.
+_SECONDARY_UNIT_RES = tuple(re.compile(p, re.IGNORECASE) for p in SECONDARY_UNIT_PATTERNS)
+
 
 def normalize_address(
     address: str,
@@ -473,8 +492,8 @@ def normalize_address(
 
     # 3. Remove secondary unit designators
     if remove_secondary:
-        for pattern in SECONDARY_UNIT_PATTERNS:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+        for pattern in _SECONDARY_UNIT_RES:
+            text = pattern.sub("", text)
 
     # 4. Remove punctuation
     text = _remove_punctuation(text)
@@ -501,6 +520,20 @@ def normalize_address(
 # =============================================================================
 
 
+# (compiled pattern, strptime format), tried in order.
+_DATE_PATTERNS = (
+    # ISO format
+    (re.compile(r"^(\d{4})-(\d{2})-(\d{2})$"), "%Y-%m-%d"),
+    # US format
+    (re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$"), "%m/%d/%Y"),
+    (re.compile(r"^(\d{1,2})-(\d{1,2})-(\d{4})$"), "%m-%d-%Y"),
+    # European format
+    (re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$"), "%d/%m/%Y"),
+    # Year only
+    (re.compile(r"^(\d{4})$"), "%Y"),
+)
+
+
 def normalize_registration_date(date_str: str) -> str | None:
     """Normalize a registration date to ISO 8601 format.
 
@@ -519,21 +552,8 @@ def normalize_registration_date(date_str: str) -> str | None:
     date_str = date_str.strip()
 
     # Try common date patterns
-
-    patterns = [
-        # ISO format
-        (r"^(\d{4})-(\d{2})-(\d{2})$", "%Y-%m-%d"),
-        # US format
-        (r"^(\d{1,2})/(\d{1,2})/(\d{4})$", "%m/%d/%Y"),
-        (r"^(\d{1,2})-(\d{1,2})-(\d{4})$", "%m-%d-%Y"),
-        # European format
-        (r"^(\d{1,2})/(\d{1,2})/(\d{4})$", "%d/%m/%Y"),
-        # Year only
-        (r"^(\d{4})$", "%Y"),
-    ]
-
-    for pattern, fmt in patterns:
-        if re.match(pattern, date_str):
+    for pattern, fmt in _DATE_PATTERNS:
+        if pattern.match(date_str):
             try:
                 if fmt == "%Y":
                     # Year only - use January 1
@@ -551,7 +571,7 @@ def normalize_registration_date(date_str: str) -> str | None:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CanonicalInput:
     """Normalized input for SNFEI hashing."""
 
@@ -0,0 +1,18 @@
+"""Shared fixtures for adapter tests."""
+
+from datetime import UTC, datetime
+
+from civic_interconnect.cep.adapters.base import AdapterContext
+import pytest
+
+
+class FixedClock(AdapterContext):
+    """Context with a constant now(), so attested records compare equal across runs."""
+
+    def now(self) -> datetime:
+        return datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+
+@pytest.fixture
+def fixed_context() -> AdapterContext:
+    return FixedClock()
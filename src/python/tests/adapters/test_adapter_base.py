@@ -0,0 +1,115 @@
+"""Tests for shared adapter machinery in civic_interconnect.cep.adapters.base."""
+
+import hashlib
+import json
+
+from civic_interconnect.cep.adapters.base import SimpleEntityAdapter
+
+
+def _reference_snfei(projection: dict[str, str]) -> str:
+    canonical = json.dumps(projection, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def test_snfei_projection_hash_matches_stdlib_json() -> None:
+    projections = [
+        {"legalNameNormalized": "city of springfield", "jurisdictionIso": "US-IL"},
+        {"legalNameNormalized": "café municipal", "jurisdictionIso": "US-MN"},
+        {"legalNameNormalized": 'quote " and \\ and \x7f', "jurisdictionIso": "US-NY"},
+    ]
+    for projection in projections:
+        got = SimpleEntityAdapter._compute_snfei_from_projection(projection)
+        assert got == _reference_snfei(projection)
+
+
+def test_snfei_projection_hash_matches_stdlib_json_for_orjson_edge_values() -> None:
+    # orjson rejects lone surrogates and ints >= 2**64 and writes NaN as null;
+    # the digest must still match the stdlib serialization.
+    projections = [
+        {"legalNameNormalized": "lone \ud800 surrogate", "jurisdictionIso": "US-IL"},
+        {"legalNameNormalized": "big int", "jurisdictionIso": "US-IL", "n": 2**64},
+        {"legalNameNormalized": "not a number", "jurisdictionIso": "US-IL", "x": float("nan")},
+        {"legalNameNormalized": "tiny float", "jurisdictionIso": "US-IL", "x": 1e-7},
+    ]
+    for projection in projections:
+        expected = _reference_snfei(projection)
+        assert SimpleEntityAdapter._compute_snfei_from_projection(projection) == expected
+        assert SimpleEntityAdapter.compute_snfei_batch([projection]) == [expected]
+
+
+def test_compute_snfei_batch_matches_single_and_preserves_order() -> None:
+    a = {"legalNameNormalized": "city of a", "jurisdictionIso": "US-MN"}
+    b = {"jurisdictionIso": "US-MN", "legalNameNormalized": "city of b"}
+    batch = [a, b, dict(a), b]
+
+    got = SimpleEntityAdapter.compute_snfei_batch(batch)
+
+    assert got == [SimpleEntityAdapter._compute_snfei_from_projection(p) for p in batch]
+    assert got[0] == got[2]
+
+
+def test_attach_attestation_copy_and_inplace() -> None:
+    from civic_interconnect.cep.adapters.us_mn_municipality import UsMnMunicipalityAdapter
+
+    adapter = UsMnMunicipalityAdapter()
+    record = {"legalName": "X", "attestation": {"legacy": True}}
+
+    copied = adapter.attach_attestation(record)
+    assert copied is not record
+    assert "attestations" not in record
+    assert "attestation" not in copied
+    assert copied["attestations"][0]["attestationTimestamp"].endswith("Z")
+
+    same = adapter.attach_attestation(record, inplace=True)
+    assert same is record
+    assert len(record["attestations"]) == 1
+    assert "attestation" not in record
+
+
+def test_attach_attestation_timestamp_is_utc_for_naive_and_offset_clocks() -> None:
+    from datetime import UTC, datetime, timedelta, timezone
+
+    from civic_interconnect.cep.adapters.base import AdapterContext
+    from civic_interconnect.cep.adapters.us_mn_municipality import UsMnMunicipalityAdapter
+
+    naive = datetime(2024, 1, 2, 3, 4, 5, 123456)
+    plus_two = datetime(2024, 1, 2, 5, 4, 5, 123456, tzinfo=timezone(timedelta(hours=2)))
+
+    def stamp(value: datetime) -> str:
+        class Clock(AdapterContext):
+            def now(self) -> datetime:
+                return value
+
+        attestations = UsMnMunicipalityAdapter(Clock()).attach_attestation({})["attestations"]
+        return attestations[0]["attestationTimestamp"]
+
+    assert stamp(plus_two) == "2024-01-02T03:04:05.123456Z"
+    # A naive clock is read as local time, as datetime.astimezone does.
+    expected = naive.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    assert stamp(naive) == expected
+    assert len(expected) == len("2024-01-02T03:04:05.123456Z")
+
+
+def test_run_many_matches_run(fixed_context) -> None:
+    from civic_interconnect.cep.adapters.us_fec_campaign_finance import (
+        UsFecCampaignFinanceAdapter,
+    )
+
+    adapter = UsFecCampaignFinanceAdapter(fixed_context)
+    raws = [
+        {"donor_name": "ACME PAC", "amount": "1000"},
+        {"donor_name": "Friends of B", "amount": "250"},
+    ]
+
+    assert adapter.run_many(raws) == [adapter.run(r) for r in raws]
+
+
+def test_registry_get_by_key_matches_get() -> None:
+    from civic_interconnect.cep.adapters.base import registry
+    from civic_interconnect.cep.adapters.us_fec_campaign_finance import (
+        UsFecCampaignFinanceAdapter,
+    )
+
+    k = UsFecCampaignFinanceAdapter.key
+    triple = (k.domain, k.jurisdiction, k.source_system)
+    assert registry.get_by_key(triple) is registry.get(*triple) is UsFecCampaignFinanceAdapter
@@ -0,0 +1,150 @@
+"""Tests for the Italy ANAC OCDS source parser (procurement spine bundles)."""
+
+import json
+from pathlib import Path
+
+from civic_interconnect.cep.adapters.procurement.it_anac.source_ocds import (
+    iter_spine_bundles_from_path,
+)
+
+SAMPLE = Path(__file__).parents[1] / "data" / "procurement" / "it_anac" / "ocds_sample.jsonl"
+
+
+def test_it_anac_spine_bundles_basic_shape() -> None:
+    bundles = list(iter_spine_bundles_from_path(SAMPLE, jurisdiction_iso="IT"))
+
+    assert bundles
+    for b in bundles:
+        assert b["source_system"] == "it_anac_ocds"
+        assert b["jurisdiction_iso"] == "IT"
+        assert isinstance(b["suppliers"], list)
+        assert isinstance(b["awards"], list)
+        assert isinstance(b["contracts"], list)
+
+
+def test_it_anac_spine_parallel_matches_serial() -> None:
+    serial = list(iter_spine_bundles_from_path(SAMPLE, jurisdiction_iso="IT"))
+    parallel = list(
+        iter_spine_bundles_from_path(SAMPLE, jurisdiction_iso="IT", workers=2, chunk_size=4)
+    )
+
+    assert parallel == serial
+
+
+def test_it_anac_release_packages_keep_dict_subclasses() -> None:
+    from collections import OrderedDict
+
+    from civic_interconnect.cep.adapters.procurement.it_anac.source_ocds import _iter_releases
+
+    release = OrderedDict(ocid="ocds-x", id="r1")
+    package = {"releases": [release, "not a release"]}
+    records = {"records": [OrderedDict(releases=[release])]}
+
+    assert list(_iter_releases(package)) == [release]
+    assert list(_iter_releases(records)) == [release]
+
+
+def test_spine_missing_list_fields_are_lists() -> None:
+    from civic_interconnect.cep.adapters.procurement.spine.award_contract import (
+        award_build_request,
+    )
+    from civic_interconnect.cep.adapters.procurement.spine.tender import tender_build_request
+
+    ocds_ref = {"ocid": "ocds-x", "release_id": "r1"}
+    tender = tender_build_request(
+        {"kind": "tender", "jurisdiction_iso": "IT", "source_system": "s", "items": None},
+        ocds_ref=ocds_ref,
+    ).payload["tender"]
+    award = award_build_request(
+        {"kind": "award", "jurisdiction_iso": "IT", "source_system": "s", "items": [{"id": "1"}]},
+        ocds_ref=ocds_ref,
+    ).payload["award"]
+
+    assert tender["items"] == [] and tender["lots"] == []
+    assert type(tender["items"]) is list and type(tender["lots"]) is list
+    assert award["items"] == [{"id": "1"}]
+    assert type(award["relatedLots"]) is list and type(award["suppliers"]) is list
+
+
+def _party(role: str, party_id: str) -> dict:
+    return {
+        "kind": "party",
+        "role": role,
+        "jurisdiction_iso": "IT",
+        "source_system": "s",
+        "party_id": party_id,
+        "legal_name": f"{role} {party_id}",
+    }
+
+
+def _release_requests() -> tuple[list, dict]:
+    from civic_interconnect.cep.adapters.procurement.spine.award_contract import (
+        award_and_contract_build_requests,
+    )
+    from civic_interconnect.cep.adapters.procurement.spine.buyer import buyer_build_request
+    from civic_interconnect.cep.adapters.procurement.spine.supplier import (
+        supplier_build_requests,
+    )
+    from civic_interconnect.cep.adapters.procurement.spine.tender import tender_build_request
+
+    ocds_ref = {"ocid": "ocds-x", "release_id": "r1", "date": "2024-01-01", "tag": ["award"]}
+    common = {"jurisdiction_iso": "IT", "source_system": "s", "ocid": "ocds-x"}
+    out = award_and_contract_build_requests(
+        awards=[{"kind": "award", "award_id": "a1", **common}],
+        contracts=[{"kind": "contract", "contract_id": "c1", "award_id": "a1", **common}],
+        ocds_ref=ocds_ref,
+        buyer_request=buyer_build_request(_party("buyer", "b1"), ocds_ref=ocds_ref),
+        supplier_requests=supplier_build_requests([_party("supplier", "s1")], ocds_ref=ocds_ref),
+        tender_request=tender_build_request(
+            {"kind": "tender", "tender_id": "t1", **common}, ocds_ref=ocds_ref
+        ),
+    )
+    return out, ocds_ref
+
+
+def test_spine_link_stubs_serialize_endpoints_as_from_to() -> None:
+    out, _ = _release_requests()
+    links = [r for r in out if r["record_kind"] == "relationship_stub"]
+
+    assert [json.loads(json.dumps(link["endpoints"])) for link in links] == [
+        {"from": {"type": "buyer", "partyId": "b1"}, "to": {"type": "tender", "tenderId": "t1"}},
+        {"from": {"type": "supplier", "partyId": "s1"}, "to": {"type": "award", "awardId": "a1"}},
+        {
+            "from": {"type": "award", "awardId": "a1"},
+            "to": {"type": "contract", "contractId": "c1"},
+        },
+    ]
+
+
+def test_spine_builders_output_shape() -> None:
+    from civic_interconnect.cep.adapters.procurement.spine._types import BuildRequest
+    from civic_interconnect.cep.adapters.procurement.spine.buyer import buyer_build_request
+
+    out, ocds_ref = _release_requests()
+    wire_keys = {
+        "record_kind",
+        "record_type",
+        "jurisdiction_iso",
+        "source_system",
+        "source_ref",
+        "payload",
+    }
+    min_ref = {"ocid": "ocds-x", "releaseId": "r1", "date": "2024-01-01", "tag": ["award"]}
+
+    assert all(type(r) is dict for r in out)
+    assert [r["record_type"] for r in out] == [
+        "procurement.award",
+        "procurement.contract",
+        "procurement.link.buyer_to_tender",
+        "procurement.link.supplier_to_award",
+        "procurement.link.award_to_contract",
+    ]
+    for r in out[:2]:
+        assert set(r) == wire_keys
+        assert r["source_ref"] == min_ref
+    assert json.loads(json.dumps(out)) == out
+
+    buyer = buyer_build_request(_party("buyer", "b1"), ocds_ref=ocds_ref)
+    assert isinstance(buyer, BuildRequest)
+    assert set(buyer.as_dict()) == wire_keys
+    assert buyer.as_dict()["payload"]["legalName"] == "buyer b1"
@@ -0,0 +1,45 @@
+"""Tests for the US-CA municipality adapter's batch helpers."""
+
+from civic_interconnect.cep.adapters.us_ca_municipality import (
+    UsCaMunicipalityAdapter,
+    build_municipality_entities_batch,
+    compute_snfei_batch,
+)
+from civic_interconnect.cep.localization import apply_localization_name
+import pytest
+
+
+def test_us_ca_compute_snfei_batch_matches_pipeline() -> None:
+    adapter = UsCaMunicipalityAdapter()
+    records = [
+        adapter.align_schema(
+            {
+                "legalName": name,
+                "legalNameNormalized": name.lower(),
+                "jurisdictionIso": "US-CA",
+                "entityType": "municipality",
+            }
+        )
+        for name in ("City of Fresno", "City of Oakland", "City of Fresno", "La Cañada")
+    ]
+
+    got = compute_snfei_batch([r["legalNameNormalized"] for r in records], "US-CA")
+
+    assert got == [adapter.compute_identity(r)["identifiers"]["snfei"]["value"] for r in records]
+
+
+def test_build_municipality_entities_batch_pool_matches_in_process(fixed_context) -> None:
+    try:
+        apply_localization_name("City of Fresno", "US-CA")
+    except Exception as exc:
+        pytest.skip(f"Rust localization unavailable: {exc}")
+
+    raws = [{"legal_name": f"City {i}"} for i in range(7)]
+    expected = build_municipality_entities_batch(raws, context=fixed_context, workers=1)
+
+    # A generator input: the pool reads it chunk by chunk as work completes.
+    got = build_municipality_entities_batch(
+        iter(raws), context=fixed_context, workers=2, chunk_size=2
+    )
+
+    assert got == expected
@@ -0,0 +1,73 @@
+"""Tests for the US-IL vendor adapter's batched identify_names path."""
+
+from civic_interconnect.cep.adapters.procurement.us_il_vendor import UsIlVendorAdapter
+import pytest
+
+NAMES = [" ACME Corp ", "Café Ltd", "ACME Corp"]
+
+
+def _fake_localize(self, name: str, jurisdiction: str | None = None) -> str:
+    return name.lower()
+
+
+def _fake_batch(self, names: list[str], jurisdiction: str | None = None) -> list[str]:
+    return [_fake_localize(self, n) for n in names]
+
+
+@pytest.fixture
+def fake_localization(monkeypatch):
+    monkeypatch.setattr(UsIlVendorAdapter, "apply_localization_name", _fake_localize)
+    monkeypatch.setattr(UsIlVendorAdapter, "apply_localization_names", _fake_batch)
+    return monkeypatch
+
+
+def _step_pipeline(adapter: UsIlVendorAdapter, names: list[str]) -> list[dict]:
+    return [
+        adapter.compute_identity(
+            adapter.align_schema(
+                adapter.canonicalize({"vendor_name": n, "jurisdiction_iso": "US-IL"})
+            )
+        )
+        for n in names
+    ]
+
+
+def test_us_il_vendor_identify_names_matches_step_pipeline(fake_localization) -> None:
+    adapter = UsIlVendorAdapter()
+
+    assert adapter.identify_names(NAMES) == _step_pipeline(adapter, NAMES)
+    assert [adapter.canonicalize_name(n) for n in NAMES] == [
+        adapter.canonicalize({"vendor_name": n}) for n in NAMES
+    ]
+
+
+def test_us_il_vendor_identify_names_uses_overrides(fake_localization) -> None:
+    class Custom(UsIlVendorAdapter):
+        identity_projection_keys = ("legalName", "jurisdictionIso")
+
+        def align_schema(self, canonical):
+            return {**super().align_schema(canonical), "aligned": True}
+
+    class Tagged(UsIlVendorAdapter):
+        def compute_identity(self, aligned):
+            return {**super().compute_identity(aligned), "tagged": True}
+
+    class Renamed(UsIlVendorAdapter):
+        def canonicalize_name(self, vendor_name, jurisdiction_iso="US-IL"):
+            return {**super().canonicalize_name(vendor_name, jurisdiction_iso), "legalName": "X"}
+
+    class Recanonicalized(UsIlVendorAdapter):
+        def canonicalize(self, raw):
+            return {**super().canonicalize(raw), "entityType": "supplier"}
+
+    for adapter in (Custom(), Tagged(), Renamed(), Recanonicalized()):
+        assert adapter.identify_names(NAMES) == _step_pipeline(adapter, NAMES)
+
+
+def test_us_il_vendor_identify_names_raises_localization_errors(fake_localization) -> None:
+    def broken_batch(self, names: list[str], jurisdiction: str | None = None) -> list[str]:
+        raise RuntimeError("localization unavailable")
+
+    fake_localization.setattr(UsIlVendorAdapter, "apply_localization_names", broken_batch)
+    with pytest.raises(RuntimeError, match="localization unavailable"):
+        UsIlVendorAdapter().identify_names(NAMES)
@@ -0,0 +1,110 @@
+"""Tests for the US school district adapter's batch and native (fused FFI) paths."""
+
+from civic_interconnect.cep.adapters import us_school_district as mod
+from civic_interconnect.cep.adapters.base import SimpleEntityAdapter, compute_snfei_for_names
+import pytest
+
+RAWS = [
+    {"legal_name": " Springfield USD ", "jurisdiction_iso": "US-IL"},
+    {"legal_name": "École District", "jurisdiction_iso": "US-VT"},
+]
+
+
+def _fake_localize(name: str, iso: str) -> str:
+    return name.lower()
+
+
+def _fake_fused(name: str, iso: str) -> tuple[str, str]:
+    localized = _fake_localize(name, iso)
+    return localized, compute_snfei_for_names([(localized, iso)])[0]
+
+
+@pytest.fixture
+def step_pipeline(monkeypatch):
+    """Fake localization with the native calls disabled, so run() takes the step pipeline."""
+    monkeypatch.setattr(mod, "apply_localization_name", _fake_localize)
+    monkeypatch.setattr(mod, "_localize_name_with_snfei", None)
+    monkeypatch.setattr(mod, "_localize_names_with_snfei", None)
+    mod._localized_name_with_snfei.cache_clear()
+    yield monkeypatch
+    mod._localized_name_with_snfei.cache_clear()
+
+
+def test_compute_snfei_for_names_matches_projection_hash() -> None:
+    names = [
+        "springfield unified school district",
+        "école district",
+        "springfield unified school district",
+    ]
+    isos = ["US-IL", "US-VT", "US-OR"]
+
+    got = mod.compute_snfei_batch(names, isos)
+
+    assert got == [
+        SimpleEntityAdapter._compute_snfei_from_projection(
+            {"legalNameNormalized": n, "jurisdictionIso": j}
+        )
+        for n, j in zip(names, isos, strict=True)
+    ]
+
+
+def test_us_school_district_native_run_matches_step_pipeline(step_pipeline, fixed_context) -> None:
+    adapter = mod.UsSchoolDistrictAdapter(fixed_context)
+    expected = adapter.run_many(RAWS)
+
+    step_pipeline.setattr(mod, "_localize_name_with_snfei", _fake_fused)
+
+    assert adapter.run_many(RAWS) == expected
+    assert [adapter.run(r) for r in RAWS] == expected
+    assert list(adapter.run(RAWS[0])) == list(expected[0])
+
+
+def test_us_school_district_native_batch_matches_step_pipeline(
+    step_pipeline, fixed_context
+) -> None:
+    adapter = mod.UsSchoolDistrictAdapter(fixed_context)
+    expected = adapter.run_many(RAWS)
+
+    def fake_batch(pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        return [_fake_fused(n, j) for n, j in pairs]
+
+    step_pipeline.setattr(mod, "_localize_names_with_snfei", fake_batch)
+
+    assert adapter.run_many([*RAWS, RAWS[0]]) == [*expected, expected[0]]
+
+
+def test_us_school_district_native_path_honors_compute_identity_override(step_pipeline) -> None:
+    class Tagged(mod.UsSchoolDistrictAdapter):
+        def compute_identity(self, aligned):
+            return {**super().compute_identity(aligned), "tagged": True}
+
+    def fail(*args):
+        raise AssertionError("native path must not run for an overriding subclass")
+
+    step_pipeline.setattr(mod, "_localize_name_with_snfei", fail)
+    step_pipeline.setattr(mod, "_localize_names_with_snfei", fail)
+    adapter = Tagged()
+
+    assert adapter.run(RAWS[0])["tagged"] is True
+    assert [r["tagged"] for r in adapter.run_many(RAWS)] == [True, True]
+    assert mod.UsSchoolDistrictAdapter._native_steps
+
+
+def test_us_school_district_native_path_honors_projection_keys_override(
+    step_pipeline, fixed_context
+) -> None:
+    class ByLegalName(mod.UsSchoolDistrictAdapter):
+        identity_projection_keys = ("legalName", "jurisdictionIso")
+
+    def fail(*args):
+        raise AssertionError("native path must not run for an overriding subclass")
+
+    step_pipeline.setattr(mod, "_localize_name_with_snfei", fail)
+    step_pipeline.setattr(mod, "_localize_names_with_snfei", fail)
+    adapter = ByLegalName(fixed_context)
+    expected = adapter.attach_attestation(
+        adapter.compute_identity(adapter.align_schema(adapter.canonicalize(RAWS[0])))
+    )
+
+    assert adapter.run(RAWS[0]) == expected
+    assert adapter.run_many(RAWS)[0] == expected
@@ -9,7 +9,9 @@ Run:
 """
 
 import csv
+from functools import lru_cache
 import importlib.util
+import json
 import os
 from pathlib import Path
 import sys
@@ -25,7 +27,9 @@ CHICAGO_SAMPLE_URL = (
 AUDIT_SCRIPT = Path("tools") / "audit_identity_collisions.py"
 
 
+@lru_cache(maxsize=1)
 def _import_audit_module():
+    """Load the audit script as a module (once per process; failures are not cached)."""
     if not AUDIT_SCRIPT.exists():
         raise AssertionError(f"Missing audit script at: {AUDIT_SCRIPT}")
 
@@ -85,6 +89,22 @@ def test_us_il_vendor_identity_audit_produces_collisions_csv(tmp_path: Path, lim
         assert not missing, f"collisions.csv missing columns: {missing} (found: {fieldnames})"
 
 
+def test_trace_sha256_matches_committed_audit_traces() -> None:
+    """The detailed-dict hash must reproduce the digests of the JSON trace text."""
+    audit = _import_audit_module()
+    traces_path = Path("out") / "audit" / "us_il_vendor" / "traces.jsonl"
+    if not traces_path.exists():
+        pytest.skip(f"Missing committed audit traces: {traces_path}")
+
+    hash_trace = audit._TraceHasher()
+    with traces_path.open("r", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+
+    assert rows
+    for row in rows:
+        assert hash_trace(json.loads(row["trace"])) == row["trace_sha256"]
+
+
 def main(argv: list[str] | None = None) -> None:
     """Run the audit script with provided arguments."""
     audit = _import_audit_module()
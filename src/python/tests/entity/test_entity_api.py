@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+cep_py = pytest.importorskip("cep_py")
+
+from civic_interconnect.cep.entity.api import build_entity_from_raw  # noqa: E402
+
+
+def _raw() -> dict:
+    return {
+        "jurisdictionIso": "US-MN",
+        "legalName": "Springfield Public Schools",
+        "legalNameNormalized": "springfield public schools",
+        "snfei": "deadbeef" * 8,
+        "entityType": "school_district",
+        "attestations": [
+            {
+                "attestationTimestamp": "1900-01-01T00:00:00.000000Z",
+                "attestorId": "cep-entity:example:ingest",
+                "verificationMethodUri": "urn:cep:attestor:cep-entity:example:ingest",
+                "proofType": "ManualAttestation",
+                "proofPurpose": "assertionMethod",
+                "proofValue": None,
+                "sourceSystem": None,
+                "sourceReference": None,
+            }
+        ],
+    }
+
+
+def test_build_entity_from_raw_keeps_json_builder_key_order() -> None:
+    if not hasattr(cep_py, "build_entity_dict"):
+        pytest.skip("cep_py build has no build_entity_dict")
+
+    from_json = json.loads(cep_py.build_entity_json(json.dumps(_raw())))
+    from_dict = build_entity_from_raw(_raw())
+
+    assert from_dict == from_json
+    # Record field order, not alphabetical: the dict path must not reorder keys.
+    assert list(from_dict) == list(from_json)
+    assert list(from_dict) != sorted(from_dict)
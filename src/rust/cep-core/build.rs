@@ -9,6 +9,7 @@
 /// - SCHEMAS: JSON Schema files from `schemas/`
 /// - VOCABULARY: Vocabulary JSON files from `vocabulary/`
 /// - LOCALIZATION_YAMLS: YAML localization files from `localization/`
+/// - LOCALIZATION_JSON: the same localization files pre-converted to JSON
 /// - TEST_VECTORS: Test vector JSON files from `test_vectors/`
 /// /// Each array contains tuples of (key, content),
 /// where `key` is derived from the file path according to specific rules.
@@ -119,6 +120,15 @@ fn main() {
         "LOCALIZATION_YAMLS",
     );
 
+    // localization -> LOCALIZATION_JSON (same keys, parsed once here)
+    generate_yaml_as_json_group(
+        &repo_root,
+        &out_dir,
+        &mut out,
+        "localization",
+        "LOCALIZATION_JSON",
+    );
+
     // test_vectors -> TEST_VECTORS (relative path without .json)
     generate_simple_group(
         &repo_root,
@@ -417,6 +427,81 @@ fn generate_yaml_group(
     writeln!(out, "];\n").unwrap();
 }
 
+/// Generate a group of YAML files converted to compact JSON at build time.
+///
+/// Keys follow `localization_key_for`, matching the YAML group entry for entry,
+/// so the runtime can parse JSON (serde_json) instead of YAML (serde_yaml).
+/// A file that cannot be converted is emitted as an empty string; the runtime
+/// then falls back to parsing the YAML text.
+fn generate_yaml_as_json_group(
+    repo_root: &Path,
+    out_dir: &Path,
+    out: &mut fs::File,
+    folder: &str,
+    static_name: &str,
+) {
+    let source_dir = repo_root.join(folder);
+    if !source_dir.is_dir() {
+        writeln!(out, "pub static {}: &[(&str, &str)] = &[];\n", static_name).unwrap();
+        return;
+    }
+
+    let rel_paths = collect_yaml_relative_paths(&source_dir);
+
+    let mut entries: Vec<(PathBuf, String)> = rel_paths
+        .into_iter()
+        .map(|rel| {
+            let key = localization_key_for(&rel);
+            (rel, key)
+        })
+        .collect();
+
+    // Deterministic order (same as the YAML group)
+    entries.sort_by(|a, b| a.1.cmp(&b.1));
+
+    let group_out_dir = out_dir.join(format!("{}_json", folder));
+    fs::create_dir_all(&group_out_dir)
+        .unwrap_or_else(|error| panic!("Failed to create {}: {}", group_out_dir.display(), error));
+
+    writeln!(out, "pub static {}: &[(&str, &str)] = &[", static_name).unwrap();
+
+    for (rel_path, key) in entries {
+        let src_path = source_dir.join(&rel_path);
+        let dest_path = group_out_dir.join(&rel_path).with_extension("json");
+
+        if let Some(parent) = dest_path.parent() {
+            fs::create_dir_all(parent)
+                .unwrap_or_else(|error| panic!("Failed to create {}: {}", parent.display(), error));
+        }
+
+        let json_text = yaml_file_to_json(&src_path).unwrap_or_default();
+        fs::write(&dest_path, json_text)
+            .unwrap_or_else(|error| panic!("Failed to write {}: {}", dest_path.display(), error));
+
+        let rel_str = dest_path
+            .strip_prefix(&group_out_dir)
+            .expect("strip_prefix failed")
+            .to_string_lossy()
+            .replace('\\', "/");
+
+        writeln!(
+            out,
+            "    (\"{}\", include_str!(concat!(env!(\"OUT_DIR\"), \"/{}_json/{}\"))),",
+            key, folder, rel_str
+        )
+        .unwrap();
+    }
+
+    writeln!(out, "];\n").unwrap();
+}
+
+/// Parse one YAML file and re-serialize it as compact JSON.
+fn yaml_file_to_json(path: &Path) -> Option<String> {
+    let text = fs::read_to_string(path).ok()?;
+    let value: serde_json::Value = serde_yaml::from_str(&text).ok()?;
+    serde_json::to_string(&value).ok()
+}
+
 /// Recursively collect all `.yaml` and `.yml` files under `root`,
 /// returning paths relative to `root`.
 fn collect_yaml_relative_paths(root: &Path) -> Vec<PathBuf> {
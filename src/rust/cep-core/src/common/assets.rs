@@ -14,11 +14,12 @@ mod generated {
     pub static SCHEMAS: &[(&str, &str)] = &[];
     pub static VOCABULARY: &[(&str, &str)] = &[];
     pub static LOCALIZATION_YAMLS: &[(&str, &str)] = &[];
+    pub static LOCALIZATION_JSON: &[(&str, &str)] = &[];
     pub static TEST_VECTORS: &[(&str, &str)] = &[];
 }
 
 // Re-export raw tables in case advanced callers want them.
-pub use generated::{LOCALIZATION_YAMLS, SCHEMAS, TEST_VECTORS, VOCABULARY};
+pub use generated::{LOCALIZATION_JSON, LOCALIZATION_YAMLS, SCHEMAS, TEST_VECTORS, VOCABULARY};
 
 /// Get a JSON Schema by key.
 ///
@@ -4,6 +4,32 @@
 use sha2::{Digest, Sha256};
 use std::fmt;
 
+/// SHA-256 of `bytes` as a 64-character lowercase hex string.
+///
+/// One-shot digest shared by every CEP hash site. The `sha2` crate picks its
+/// compression backend at runtime (via `cpufeatures`): SHA-NI on x86/x86_64
+/// CPUs that have it, the ARMv8 crypto extensions on aarch64, portable code
+/// otherwise. No build flags are needed to get the hardware path.
+pub fn sha256_hex(bytes: &[u8]) -> String {
+    let digest: [u8; 32] = Sha256::digest(bytes).into();
+    hex_32(&digest)
+}
+
+/// Lowercase hex of a 32-byte digest.
+///
+/// The size is fixed, so this is a straight table lookup into a 64-byte
+/// buffer rather than a `format!("{:x}")` pass through the fmt machinery.
+fn hex_32(digest: &[u8; 32]) -> String {
+    const HEX: &[u8; 16] = b"0123456789abcdef";
+    let mut out = [0u8; 64];
+    for (pair, &byte) in out.chunks_exact_mut(2).zip(digest) {
+        pair[0] = HEX[usize::from(byte >> 4)];
+        pair[1] = HEX[usize::from(byte & 0x0f)];
+    }
+    // Every byte written above is an ASCII hex digit, so this cannot fail.
+    String::from_utf8(out.to_vec()).unwrap_or_default()
+}
+
 /// A SHA-256 hash value represented as a 64-character lowercase hex string.
 #[derive(Debug, Clone, PartialEq, Eq, Hash)]
 pub struct CanonicalHash(String);
@@ -11,18 +37,15 @@ pub struct CanonicalHash(String);
 impl CanonicalHash {
     /// Computes the SHA-256 hash of the given canonical string.
     pub fn from_canonical_string(canonical: &str) -> Self {
-        let mut hasher = Sha256::new();
-        hasher.update(canonical.as_bytes());
-        let result = hasher.finalize();
-        Self(format!("{:x}", result))
+        Self(sha256_hex(canonical.as_bytes()))
     }
 
     /// Creates a CanonicalHash from a pre-computed hex string.
     ///
     /// Returns None if the string is not a valid 64-character hex string.
     pub fn from_hex(hex: &str) -> Option<Self> {
-        if hex.len() == 64 && hex.chars().all(|c| c.is_ascii_hexdigit()) {
-            Some(Self(hex.to_lowercase()))
+        if hex.len() == 64 && hex.bytes().all(|b| b.is_ascii_hexdigit()) {
+            Some(Self(hex.to_ascii_lowercase()))
         } else {
             None
         }
@@ -6,18 +6,22 @@
 // N: IntermediateCanonical -> FinalCanonical
 // SNFEI = Hash(N(L(raw_data)))
 //
-// This module loads localization configs from embedded YAML assets generated
-// by build.rs (LOCALIZATION_YAMLS), merges parent configs, and applies
-// transforms deterministically.
+// This module loads localization configs from embedded assets generated by
+// build.rs, merges parent configs, and applies transforms deterministically.
+// build.rs parses each YAML once and embeds it as JSON (LOCALIZATION_JSON);
+// the registry loads that with serde_json and only falls back to parsing the
+// YAML text (LOCALIZATION_YAMLS) for an entry that could not be converted.
 //
 // NOTE: This module intentionally does not validate YAML against JSON Schema
 // at runtime. Schema validation is done in tooling/tests.
 
-use crate::common::assets::LOCALIZATION_YAMLS;
+use crate::common::assets::{LOCALIZATION_JSON, LOCALIZATION_YAMLS};
+use aho_corasick::AhoCorasick;
 use regex::{Regex, RegexBuilder};
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::collections::{HashMap, HashSet};
-use std::sync::{Mutex, OnceLock};
+use std::sync::{Arc, Mutex, OnceLock};
 
 static GLOBAL_REGISTRY: OnceLock<Mutex<Result<LocalizationRegistry, String>>> = OnceLock::new();
 
@@ -170,20 +174,47 @@ pub struct LocalizationApplyResult {
     pub provenance: LocalizationApplyProvenance,
 }
 
-// Internal compiled form (avoid recompiling regex each call)
+// Internal compiled form of the enabled custom rules, in application order
+// (avoid recompiling regex each call).
 #[derive(Debug, Clone)]
-struct CompiledRule {
-    rule: LocalizationRule,
-    regex: Option<Regex>,
+enum CompiledRule {
+    Regex(Regex, String),
+    // Lowercased (pattern, replacement), computed once at compile time since
+    // apply_to_name matches it against lowercased text.
+    Literal(String, String),
+    // A run of consecutive single-character literal rules (e.g. accent
+    // folding), applied in one pass over the text. `ascii_keys` records whether
+    // any key is ASCII; if none is, ASCII text is skipped without a scan.
+    CharMap {
+        map: HashMap<char, String>,
+        ascii_keys: bool,
+    },
+}
+
+/// Ordered `\bkey\b` substitutions plus a one-pass key prefilter.
+///
+/// Each key keeps its own regex, applied in order to the evolving text. The
+/// Aho-Corasick automaton over the ASCII keys finds, in a single scan, which
+/// keys occur in the text at all, so only those regexes run; most names
+/// contain none of a config's agency or entity-type keys.
+#[derive(Debug, Clone)]
+struct WordSubstitutions {
+    regexes: Vec<(Regex, String)>,
+    // Pattern i of `finder` is the key of regexes[prefiltered[i]].
+    finder: Option<AhoCorasick>,
+    prefiltered: Vec<usize>,
 }
 
 #[derive(Debug, Clone)]
 pub struct CompiledConfig {
     cfg: LocalizationConfig,
     // agency_names + entity_types are word-boundary regex substitutions
-    agency_regexes: Vec<(Regex, String)>,
-    entity_type_regexes: Vec<(Regex, String)>,
+    agency_regexes: WordSubstitutions,
+    entity_type_regexes: WordSubstitutions,
     compiled_rules: Vec<CompiledRule>,
+    // No substitutions, abbreviations, enabled rules or stop words: applying
+    // the config only lowercases and collapses whitespace.
+    is_noop: bool,
 }
 
 // =============================================================================
@@ -198,9 +229,18 @@ fn normalize_key(input: &str) -> String {
     }
 
     // Allow ISO 3166-2 inputs like "US-IL" and also already-path-like "us/il".
-    // Normalize to lower with "/" separators.
-    let s = s.replace('-', "/");
-    s.to_lowercase()
+    // Normalize to lower with "/" separators; ASCII keys (all real ones) are
+    // built in a single allocation.
+    if s.is_ascii() {
+        return s
+            .bytes()
+            .map(|b| match b {
+                b'-' => '/',
+                _ => char::from(b.to_ascii_lowercase()),
+            })
+            .collect();
+    }
+    s.replace('-', "/").to_lowercase()
 }
 
 // =============================================================================
@@ -210,7 +250,24 @@ fn normalize_key(input: &str) -> String {
 fn parse_yaml_to_config(key: &str, yaml_text: &str) -> Result<LocalizationConfig, String> {
     let file_cfg: LocalizationConfigFile =
         serde_yaml::from_str(yaml_text).map_err(|e| format!("YAML parse error for {key}: {e}"))?;
+    Ok(file_to_config(file_cfg))
+}
+
+/// Load a config from its build-time JSON form, falling back to the YAML text.
+fn parse_embedded_config(
+    key: &str,
+    json_text: Option<&str>,
+    yaml_text: &str,
+) -> Result<LocalizationConfig, String> {
+    if let Some(json_text) = json_text.filter(|t| !t.is_empty()) {
+        if let Ok(file_cfg) = serde_json::from_str::<LocalizationConfigFile>(json_text) {
+            return Ok(file_to_config(file_cfg));
+        }
+    }
+    parse_yaml_to_config(key, yaml_text)
+}
 
+fn file_to_config(file_cfg: LocalizationConfigFile) -> LocalizationConfig {
     // Canonicalize parent/jurisdiction values to internal lookup keys.
     let jurisdiction_key = normalize_key(&file_cfg.jurisdiction);
     let parent_key = file_cfg.parent.as_ref().map(|p| normalize_key(p));
@@ -256,7 +313,7 @@ fn parse_yaml_to_config(key: &str, yaml_text: &str) -> Result<LocalizationConfig
         .map(|s| s.to_lowercase())
         .collect();
 
-    Ok(LocalizationConfig {
+    LocalizationConfig {
         jurisdiction: jurisdiction_key,
         parent: parent_key,
         version: file_cfg.version,
@@ -267,82 +324,305 @@ fn parse_yaml_to_config(key: &str, yaml_text: &str) -> Result<LocalizationConfig
         entity_types,
         rules,
         stop_words,
-    })
+    }
 }
 
-fn merge_configs(child: &LocalizationConfig, parent: &LocalizationConfig) -> LocalizationConfig {
-    let mut merged_abbrevs = parent.abbreviations.clone();
-    merged_abbrevs.extend(child.abbreviations.clone());
-
-    let mut merged_agencies = parent.agency_names.clone();
-    merged_agencies.extend(child.agency_names.clone());
+/// Overlay `child` onto `merged`: child entries win.
+///
+/// An empty parent map (usual for agency_names / entity_types) takes a
+/// straight clone of the child's table; otherwise room for every child entry is
+/// reserved up front so the extend does not rehash repeatedly.
+fn overlay_map(merged: &mut HashMap<String, String>, child: &HashMap<String, String>) {
+    if merged.is_empty() {
+        merged.clone_from(child);
+        return;
+    }
+    merged.reserve(child.len());
+    merged.extend(child.iter().map(|(k, v)| (k.clone(), v.clone())));
+}
 
-    let mut merged_types = parent.entity_types.clone();
-    merged_types.extend(child.entity_types.clone());
+/// Fold `child` over the config merged so far (parent-most first).
+///
+/// The accumulator's maps, rules and stop words are extended in place, so a
+/// root->leaf walk allocates each field once instead of copying the parent
+/// at every level.
+fn merge_configs(child: &LocalizationConfig, mut merged: LocalizationConfig) -> LocalizationConfig {
+    overlay_map(&mut merged.abbreviations, &child.abbreviations);
+    overlay_map(&mut merged.agency_names, &child.agency_names);
+    overlay_map(&mut merged.entity_types, &child.entity_types);
 
     // Rules: parent first then child
-    let mut merged_rules = parent.rules.clone();
-    merged_rules.extend(child.rules.clone());
-
-    let merged_stop_words: HashSet<String> = parent
-        .stop_words
-        .union(&child.stop_words)
-        .cloned()
-        .collect();
+    merged.rules.extend_from_slice(&child.rules);
+    if merged.stop_words.is_empty() {
+        merged.stop_words.clone_from(&child.stop_words);
+    } else {
+        merged.stop_words.reserve(child.stop_words.len());
+        merged.stop_words.extend(child.stop_words.iter().cloned());
+    }
 
-    LocalizationConfig {
-        jurisdiction: child.jurisdiction.clone(),
-        parent: child.parent.clone().or_else(|| parent.parent.clone()),
-        version: child.version.clone().or_else(|| parent.version.clone()),
-        updated_timestamp: child
-            .updated_timestamp
-            .clone()
-            .or_else(|| parent.updated_timestamp.clone()),
-        config_hash: child
-            .config_hash
-            .clone()
-            .or_else(|| parent.config_hash.clone()),
-        abbreviations: merged_abbrevs,
-        agency_names: merged_agencies,
-        entity_types: merged_types,
-        rules: merged_rules,
-        stop_words: merged_stop_words,
+    merged.jurisdiction = child.jurisdiction.clone();
+    if child.parent.is_some() {
+        merged.parent = child.parent.clone();
+    }
+    if child.version.is_some() {
+        merged.version = child.version.clone();
+    }
+    if child.updated_timestamp.is_some() {
+        merged.updated_timestamp = child.updated_timestamp.clone();
+    }
+    if child.config_hash.is_some() {
+        merged.config_hash = child.config_hash.clone();
     }
+
+    merged
 }
 
 // =============================================================================
 // APPLY LOGIC
 // =============================================================================
 
-fn collapse_whitespace(s: &str) -> String {
-    s.split_whitespace().collect::<Vec<&str>>().join(" ")
+/// Apply a regex replacement, keeping `text` as is when nothing matched.
+///
+/// Most names match none of a config's agency / entity-type patterns, and
+/// `replace_all` returns the input borrowed in that case; only a hit allocates.
+///
+/// Returns whether anything was replaced.
+fn replace_all_in_place(re: &Regex, text: &mut String, replacement: &str) -> bool {
+    let replaced = match re.replace_all(text.as_str(), replacement) {
+        Cow::Owned(replaced) => Some(replaced),
+        Cow::Borrowed(_) => None,
+    };
+    match replaced {
+        Some(replaced) => {
+            *text = replaced;
+            true
+        }
+        None => false,
+    }
 }
 
-fn compile_config(cfg: LocalizationConfig) -> Result<CompiledConfig, String> {
-    // Precompile agency_name substitutions with word boundaries and case-insensitive matching.
-    let mut agency_regexes = Vec::with_capacity(cfg.agency_names.len());
-    for (k, v) in cfg.agency_names.iter() {
+fn compile_word_substitutions(
+    map: &HashMap<String, String>,
+    what: &str,
+) -> Result<WordSubstitutions, String> {
+    let mut regexes = Vec::with_capacity(map.len());
+    let mut ascii_keys = Vec::with_capacity(map.len());
+    let mut prefiltered = Vec::with_capacity(map.len());
+    for (k, v) in map.iter() {
         let escaped = regex::escape(k);
         let pat = format!(r"\b{}\b", escaped);
         let re = RegexBuilder::new(&pat)
             .case_insensitive(true)
             .build()
-            .map_err(|e| format!("Failed compiling agency_names regex {pat}: {e}"))?;
-        agency_regexes.push((re, v.clone()));
+            .map_err(|e| format!("Failed compiling {what} regex {pat}: {e}"))?;
+        // Where ascii_case_folds_exactly holds, a case-insensitive match of a
+        // non-empty ASCII key implies the key occurs as an ASCII-case-insensitive
+        // substring. Other keys are never skipped.
+        if k.is_ascii() && !k.is_empty() {
+            prefiltered.push(regexes.len());
+            ascii_keys.push(k.as_str());
+        }
+        regexes.push((re, v.clone()));
     }
 
-    // Precompile entity_type substitutions similarly.
-    let mut entity_type_regexes = Vec::with_capacity(cfg.entity_types.len());
-    for (k, v) in cfg.entity_types.iter() {
-        let escaped = regex::escape(k);
-        let pat = format!(r"\b{}\b", escaped);
-        let re = RegexBuilder::new(&pat)
-            .case_insensitive(true)
-            .build()
-            .map_err(|e| format!("Failed compiling entity_types regex {pat}: {e}"))?;
-        entity_type_regexes.push((re, v.clone()));
+    let finder = if ascii_keys.is_empty() {
+        None
+    } else {
+        Some(
+            AhoCorasick::builder()
+                .ascii_case_insensitive(true)
+                .build(&ascii_keys)
+                .map_err(|e| format!("Failed building {what} key automaton: {e}"))?,
+        )
+    };
+
+    Ok(WordSubstitutions {
+        regexes,
+        finder,
+        prefiltered,
+    })
+}
+
+/// Whether a case-insensitive regex can match an ASCII key in `text` only
+/// where the key occurs as an ASCII-case-insensitive substring.
+///
+/// Under Unicode simple case folding, exactly two non-ASCII chars match an
+/// ASCII letter: U+017F LATIN SMALL LETTER LONG S (s) and U+212A KELVIN SIGN
+/// (k). Any text without them, accented names included, can use the prefilter.
+fn ascii_case_folds_exactly(text: &str) -> bool {
+    text.is_ascii() || !text.chars().any(|c| matches!(c, '\u{17f}' | '\u{212a}'))
+}
+
+impl WordSubstitutions {
+    /// Apply the substitutions in order; returns whether anything changed.
+    fn apply(&self, text: &mut String) -> bool {
+        if self.regexes.is_empty() || self.provably_no_key(text) {
+            return false;
+        }
+
+        let mut changed = false;
+        let mut candidates = self.candidates(text);
+        for (i, (re, replacement)) in self.regexes.iter().enumerate() {
+            if !candidates[i] {
+                continue;
+            }
+            // A replacement can introduce later keys; rescan before going on.
+            if replace_all_in_place(re, text, replacement) {
+                changed = true;
+                candidates = self.candidates(text);
+            }
+        }
+        changed
+    }
+
+    /// True when every key is prefiltered and none occurs in `text`: the
+    /// common case, settled by one automaton scan without per-key flags.
+    fn provably_no_key(&self, text: &str) -> bool {
+        self.prefiltered.len() == self.regexes.len()
+            && self
+                .finder
+                .as_ref()
+                .is_some_and(|finder| ascii_case_folds_exactly(text) && !finder.is_match(text))
+    }
+
+    /// Per-regex flags: false only where the key provably does not occur.
+    fn candidates(&self, text: &str) -> Vec<bool> {
+        let Some(finder) = self
+            .finder
+            .as_ref()
+            .filter(|_| ascii_case_folds_exactly(text))
+        else {
+            return vec![true; self.regexes.len()];
+        };
+        let mut candidates = vec![true; self.regexes.len()];
+        for &i in self.prefiltered.iter() {
+            candidates[i] = false;
+        }
+        for m in finder.find_overlapping_iter(text) {
+            candidates[self.prefiltered[m.pattern().as_usize()]] = true;
+        }
+        candidates
+    }
+}
+
+fn collapse_whitespace(s: &str) -> String {
+    s.split_whitespace().collect::<Vec<&str>>().join(" ")
+}
+
+/// Collapse whitespace runs to single spaces and trim, in place.
+///
+/// Text that is already collapsed (the usual case between passes) is left
+/// untouched instead of being re-split and re-joined.
+fn collapse_whitespace_in_place(text: &mut String) {
+    if is_collapsed(text) {
+        return;
+    }
+    *text = collapse_whitespace(text);
+}
+
+fn is_collapsed(s: &str) -> bool {
+    let mut prev_space = true; // rejects leading whitespace
+    for c in s.chars() {
+        if c == ' ' {
+            if prev_space {
+                return false;
+            }
+            prev_space = true;
+        } else if c.is_whitespace() {
+            return false;
+        } else {
+            prev_space = false;
+        }
+    }
+    !s.ends_with(' ')
+}
+
+/// Replace each token of collapsed `text` found in `abbreviations` by its
+/// expansion; returns whether anything changed.
+///
+/// One pass with one lookup per token. Text up to the first abbreviation is
+/// copied as-is, and text without any is left untouched.
+fn expand_abbreviations(text: &mut String, abbreviations: &HashMap<String, String>) -> bool {
+    if text.is_empty() || abbreviations.is_empty() {
+        return false;
+    }
+
+    // Collapsed text separates tokens by exactly one space.
+    let mut expanded: Option<String> = None;
+    let mut start = 0;
+    for tok in text.split(' ') {
+        let replacement = abbreviations.get(tok);
+        match (&mut expanded, replacement) {
+            (None, None) => {}
+            (None, Some(replacement)) => {
+                let mut out = String::with_capacity(text.len() + replacement.len());
+                out.push_str(&text[..start]);
+                out.push_str(replacement);
+                expanded = Some(out);
+            }
+            (Some(out), replacement) => {
+                out.push(' ');
+                out.push_str(replacement.map_or(tok, String::as_str));
+            }
+        }
+        start += tok.len() + 1;
+    }
+
+    match expanded {
+        Some(out) => {
+            *text = out;
+            true
+        }
+        None => false,
+    }
+}
+
+/// Drop the tokens of collapsed `text` found in `stop_words`; returns whether
+/// anything changed.
+///
+/// One pass with one lookup per token, like expand_abbreviations.
+fn remove_stop_words(text: &mut String, stop_words: &HashSet<String>) -> bool {
+    if text.is_empty() || stop_words.is_empty() {
+        return false;
+    }
+
+    let mut kept: Option<String> = None;
+    let mut start = 0;
+    for tok in text.split(' ') {
+        let stop = stop_words.contains(tok);
+        match (&mut kept, stop) {
+            (None, false) => {}
+            (None, true) => {
+                let mut out = String::with_capacity(text.len());
+                out.push_str(text[..start].trim_end_matches(' '));
+                kept = Some(out);
+            }
+            (Some(_), true) => {}
+            (Some(out), false) => {
+                if !out.is_empty() {
+                    out.push(' ');
+                }
+                out.push_str(tok);
+            }
+        }
+        start += tok.len() + 1;
     }
 
+    match kept {
+        Some(out) => {
+            *text = out;
+            true
+        }
+        None => false,
+    }
+}
+
+fn compile_config(cfg: LocalizationConfig) -> Result<CompiledConfig, String> {
+    // Precompile agency_name / entity_type substitutions with word boundaries and
+    // case-insensitive matching.
+    let agency_regexes = compile_word_substitutions(&cfg.agency_names, "agency_names")?;
+    let entity_type_regexes = compile_word_substitutions(&cfg.entity_types, "entity_types")?;
+
     // Respect optional explicit order; stable sort by (order, original_index).
     let mut rules_indexed: Vec<(usize, LocalizationRule)> =
         cfg.rules.iter().cloned().enumerate().collect();
@@ -355,7 +635,6 @@ fn compile_config(cfg: LocalizationConfig) -> Result<CompiledConfig, String> {
     let mut compiled_rules = Vec::with_capacity(rules_indexed.len());
     for (_idx, rule) in rules_indexed.into_iter() {
         if !rule.enabled {
-            compiled_rules.push(CompiledRule { rule, regex: None });
             continue;
         }
 
@@ -364,89 +643,156 @@ fn compile_config(cfg: LocalizationConfig) -> Result<CompiledConfig, String> {
                 .case_insensitive(!rule.case_sensitive)
                 .build()
                 .map_err(|e| format!("Failed compiling rule regex {}: {e}", rule.pattern))?;
-            compiled_rules.push(CompiledRule {
-                rule,
-                regex: Some(re),
-            });
+            compiled_rules.push(CompiledRule::Regex(re, rule.replacement));
         } else {
-            compiled_rules.push(CompiledRule { rule, regex: None });
+            push_literal_rule(
+                &mut compiled_rules,
+                rule.pattern.to_lowercase(),
+                rule.replacement.to_lowercase(),
+            );
         }
     }
 
+    let is_noop = agency_regexes.regexes.is_empty()
+        && entity_type_regexes.regexes.is_empty()
+        && compiled_rules.is_empty()
+        && cfg.abbreviations.is_empty()
+        && cfg.stop_words.is_empty();
+
     Ok(CompiledConfig {
         cfg,
         agency_regexes,
         entity_type_regexes,
         compiled_rules,
+        is_noop,
     })
 }
 
+/// Append a literal rule, folding it into a preceding `CharMap` run when the
+/// one-pass map gives the same result as applying the rules in sequence.
+///
+/// That holds when the pattern is a single non-whitespace char not already in
+/// the run (a repeated char was replaced by the earlier rule; the later one
+/// would find nothing), and no replacement in the run contains a char that a
+/// later rule of the run would rewrite again.
+fn push_literal_rule(rules: &mut Vec<CompiledRule>, pattern: String, replacement: String) {
+    let Some(c) = single_char(&pattern) else {
+        rules.push(CompiledRule::Literal(pattern, replacement));
+        return;
+    };
+
+    match rules.last_mut() {
+        Some(CompiledRule::CharMap { map, ascii_keys }) if !map.values().any(|r| r.contains(c)) => {
+            map.entry(c).or_insert(replacement);
+            *ascii_keys |= c.is_ascii();
+        }
+        Some(CompiledRule::Literal(prev, prev_replacement)) => {
+            match single_char(prev).filter(|_| !prev_replacement.contains(c)) {
+                Some(p) => {
+                    let mut map = HashMap::with_capacity(2);
+                    map.insert(p, std::mem::take(prev_replacement));
+                    map.entry(c).or_insert(replacement);
+                    let ascii_keys = p.is_ascii() || c.is_ascii();
+                    *rules.last_mut().expect("matched Some above") =
+                        CompiledRule::CharMap { map, ascii_keys };
+                }
+                None => rules.push(CompiledRule::Literal(pattern, replacement)),
+            }
+        }
+        _ => rules.push(CompiledRule::Literal(pattern, replacement)),
+    }
+}
+
+/// The char of a one-character, non-whitespace pattern.
+fn single_char(pattern: &str) -> Option<char> {
+    let mut chars = pattern.chars();
+    match (chars.next(), chars.next()) {
+        (Some(c), None) if !c.is_whitespace() => Some(c),
+        _ => None,
+    }
+}
+
+impl CompiledRule {
+    /// Apply the rule to `text`; returns whether anything changed.
+    fn apply(&self, text: &mut String) -> bool {
+        match self {
+            CompiledRule::Regex(re, replacement) => replace_all_in_place(re, text, replacement),
+            CompiledRule::Literal(pattern, replacement) => {
+                // Literal replace. If rule is case_sensitive, apply to the original casing would matter,
+                // but at this stage we are already in lowercase. This matches typical CEP behavior.
+                if !text.contains(pattern.as_str()) {
+                    return false;
+                }
+                *text = text.replace(pattern.as_str(), replacement);
+                true
+            }
+            CompiledRule::CharMap { map, ascii_keys } => {
+                if !ascii_keys && text.is_ascii() {
+                    return false;
+                }
+                // The text before the first mapped char is copied as-is.
+                let Some(start) = text
+                    .char_indices()
+                    .find(|(_, c)| map.contains_key(c))
+                    .map(|(i, _)| i)
+                else {
+                    return false;
+                };
+                let mut out = String::with_capacity(text.len());
+                out.push_str(&text[..start]);
+                for c in text[start..].chars() {
+                    match map.get(&c) {
+                        Some(replacement) => out.push_str(replacement),
+                        None => out.push(c),
+                    }
+                }
+                *text = out;
+                true
+            }
+        }
+    }
+}
+
 impl CompiledConfig {
     fn apply_to_name(&self, name: &str) -> String {
         // Start by lowercasing.
         // All rules/maps are case-insensitive or normalized to lowercase.
-        let mut result = name.to_lowercase();
+        // Most names are pure ASCII, which skips the Unicode case tables.
+        let mut result = if name.is_ascii() {
+            name.to_ascii_lowercase()
+        } else {
+            name.to_lowercase()
+        };
+        if self.is_noop {
+            collapse_whitespace_in_place(&mut result);
+            return result;
+        }
 
         // 1) Agency names (word boundary, case-insensitive)
-        for (re, full) in self.agency_regexes.iter() {
-            result = re.replace_all(&result, full.as_str()).to_string();
-        }
-        result = collapse_whitespace(&result);
+        self.agency_regexes.apply(&mut result);
+        collapse_whitespace_in_place(&mut result);
 
         // 2) Abbreviations (token-based expansion)
-        let tokens: Vec<&str> = result.split_whitespace().collect();
-        let mut expanded = Vec::with_capacity(tokens.len());
-        for tok in tokens.iter() {
-            if let Some(v) = self.cfg.abbreviations.get(*tok) {
-                expanded.push(v.as_str());
-            } else {
-                expanded.push(*tok);
-            }
+        if expand_abbreviations(&mut result, &self.cfg.abbreviations) {
+            collapse_whitespace_in_place(&mut result);
         }
-        result = expanded.join(" ");
-        result = collapse_whitespace(&result);
 
         // 3) Entity types (word boundary, case-insensitive)
-        for (re, canonical) in self.entity_type_regexes.iter() {
-            result = re.replace_all(&result, canonical.as_str()).to_string();
+        if self.entity_type_regexes.apply(&mut result) {
+            collapse_whitespace_in_place(&mut result);
         }
-        result = collapse_whitespace(&result);
-
-        // 4) Custom rules (ordered; regex or literal)
-        for cr in self.compiled_rules.iter() {
-            if !cr.rule.enabled {
-                continue;
-            }
 
-            if cr.rule.is_regex {
-                if let Some(re) = cr.regex.as_ref() {
-                    result = re
-                        .replace_all(&result, cr.rule.replacement.as_str())
-                        .to_string();
-                }
-            } else {
-                // Literal replace. If rule is case_sensitive, apply to the original casing would matter,
-                // but at this stage we are already in lowercase. This matches typical CEP behavior.
-                result = result.replace(
-                    &cr.rule.pattern.to_lowercase(),
-                    &cr.rule.replacement.to_lowercase(),
-                );
+        // 4) Custom rules (ordered; regex or literal). The text is collapsed
+        // on entry and after every change, so an unchanged step needs no collapse.
+        for rule in self.compiled_rules.iter() {
+            if rule.apply(&mut result) {
+                collapse_whitespace_in_place(&mut result);
             }
-
-            result = collapse_whitespace(&result);
         }
 
         // 5) Stop words (token removal)
-        if !self.cfg.stop_words.is_empty() {
-            let tokens: Vec<&str> = result.split_whitespace().collect();
-            let mut kept = Vec::with_capacity(tokens.len());
-            for tok in tokens.iter() {
-                if !self.cfg.stop_words.contains(*tok) {
-                    kept.push(*tok);
-                }
-            }
-            result = kept.join(" ");
-            result = collapse_whitespace(&result);
+        if remove_stop_words(&mut result, &self.cfg.stop_words) {
+            collapse_whitespace_in_place(&mut result);
         }
 
         result
@@ -457,40 +803,97 @@ impl CompiledConfig {
 // REGISTRY (embedded assets, cached resolved configs)
 // =============================================================================
 
+// Configs parsed from the embedded assets. The assets are compiled in, so they
+// are parsed and merged once per process and shared read-only by every
+// registry.
+static EMBEDDED_CONFIGS: OnceLock<Result<EmbeddedConfigs, String>> = OnceLock::new();
+
+fn embedded_configs() -> Result<&'static EmbeddedConfigs, String> {
+    EMBEDDED_CONFIGS
+        .get_or_init(EmbeddedConfigs::load)
+        .as_ref()
+        .map_err(Clone::clone)
+}
+
 #[derive(Debug)]
-pub struct LocalizationRegistry {
+struct EmbeddedConfigs {
     // Base configs loaded from embedded YAML by key, e.g. "us", "us/il", "base"
     base_by_key: HashMap<String, LocalizationConfig>,
-    // Compiled + merged cache for requested jurisdiction keys
-    compiled_cache: HashMap<String, CompiledConfig>,
-    // For provenance: keep parent chain resolution keys
-    resolved_key_chains: HashMap<String, Vec<String>>,
+    // Each base key's resolved parent chain, parent-most first
+    chain_by_key: HashMap<String, Vec<String>>,
+    // Each base key's config merged down its parent chain (parent first)
+    merged_by_key: HashMap<String, LocalizationConfig>,
 }
 
-impl LocalizationRegistry {
-    pub fn new() -> Result<Self, String> {
+impl EmbeddedConfigs {
+    fn load() -> Result<Self, String> {
         let mut base_by_key: HashMap<String, LocalizationConfig> = HashMap::new();
 
+        // build.rs emits both tables with the same keys.
+        let json_by_key: HashMap<&str, &str> = LOCALIZATION_JSON.iter().copied().collect();
+
         for (key, yaml_text) in LOCALIZATION_YAMLS.iter() {
             let k = normalize_key(key);
-            let cfg = parse_yaml_to_config(&k, yaml_text)?;
+            let cfg = parse_embedded_config(&k, json_by_key.get(key).copied(), yaml_text)?;
 
             // Sanity: if YAML says jurisdiction "US" but key is "us", normalize and accept.
             base_by_key.insert(k, cfg);
         }
 
-        Ok(Self {
+        let mut configs = Self {
             base_by_key,
-            compiled_cache: HashMap::new(),
-            resolved_key_chains: HashMap::new(),
-        })
+            chain_by_key: HashMap::new(),
+            merged_by_key: HashMap::new(),
+        };
+        configs.chain_by_key = configs
+            .base_by_key
+            .keys()
+            .map(|k| (k.clone(), configs.walk_chain(k)))
+            .collect();
+        configs.merged_by_key = configs
+            .chain_by_key
+            .iter()
+            .map(|(k, chain)| (k.clone(), configs.merge_chain(chain)))
+            .collect();
+        Ok(configs)
     }
 
     fn get_base(&self, key: &str) -> Option<&LocalizationConfig> {
         self.base_by_key.get(key)
     }
 
+    /// Resolved parent chain for a requested key, parent-most first.
+    ///
+    /// The walk from a requested key only takes fallback steps until it reaches
+    /// a key with a config, and from there continues exactly as the walk from
+    /// that key did at load time; so only the fallback steps run here.
     fn resolve_chain(&self, requested_key: &str) -> Vec<String> {
+        self.first_base_key(requested_key)
+            .and_then(|k| self.chain_by_key.get(k))
+            .cloned()
+            .unwrap_or_default()
+    }
+
+    /// The first key with a config reached from `requested_key` by the path
+    /// and "base" fallbacks of walk_chain.
+    fn first_base_key<'a>(&self, requested_key: &'a str) -> Option<&'a str> {
+        let mut current = requested_key;
+        for _ in 0..50 {
+            if self.base_by_key.contains_key(current) {
+                return Some(current);
+            }
+            if current.contains('/') {
+                current = current.rsplit('/').nth(1).unwrap_or("");
+            } else if current != "base" && self.base_by_key.contains_key("base") {
+                current = "base";
+            } else {
+                return None;
+            }
+        }
+        None
+    }
+
+    fn walk_chain(&self, requested_key: &str) -> Vec<String> {
         // Preferred: follow parent field if present.
         // Fallback: if missing and contains '/', fall back to truncation.
         // Final fallback: "base" if present.
@@ -536,88 +939,168 @@ impl LocalizationRegistry {
         chain
     }
 
+    /// Merge the configs of a non-empty resolved chain, parent-most first.
+    fn merge_chain(&self, chain: &[String]) -> LocalizationConfig {
+        let mut merged = chain
+            .first()
+            .and_then(|k| self.get_base(k))
+            .cloned()
+            .unwrap_or_default();
+
+        for key in chain.iter().skip(1) {
+            if let Some(child) = self.get_base(key) {
+                merged = merge_configs(child, merged);
+            }
+        }
+        merged
+    }
+}
+
+#[derive(Debug)]
+pub struct LocalizationRegistry {
+    // Shared embedded configs (see EMBEDDED_CONFIGS)
+    configs: &'static EmbeddedConfigs,
+    // Compiled + merged config and its provenance, by normalized jurisdiction key.
+    // Compiled configs are immutable and shared, so callers can apply one after
+    // releasing the registry lock.
+    compiled_cache: HashMap<String, (Arc<CompiledConfig>, LocalizationApplyProvenance)>,
+    // Normalized key for each input spelling seen that differs from it ("US-IL")
+    key_by_input: HashMap<String, String>,
+    // Last (input spelling, normalized key) looked up. Callers pass the same
+    // jurisdiction for runs of records, so a string compare replaces the
+    // spelling lookup on repeats.
+    last_lookup: (String, String),
+}
+
+impl LocalizationRegistry {
+    pub fn new() -> Result<Self, String> {
+        Ok(Self {
+            configs: embedded_configs()?,
+            compiled_cache: HashMap::new(),
+            key_by_input: HashMap::new(),
+            last_lookup: (String::new(), String::new()),
+        })
+    }
+
+    fn get_base(&self, key: &str) -> Option<&LocalizationConfig> {
+        self.configs.get_base(key)
+    }
+
+    fn resolve_chain(&self, requested_key: &str) -> Vec<String> {
+        self.configs.resolve_chain(requested_key)
+    }
+
     fn merged_config_for_chain(&self, chain: &[String], requested_key: &str) -> LocalizationConfig {
         // If chain is empty, return empty config with the requested_key.
-        if chain.is_empty() {
+        let Some(resolved_key) = chain.last() else {
             return LocalizationConfig {
                 jurisdiction: requested_key.to_string(),
                 ..Default::default()
             };
-        }
-
-        // Start from first (parent-most) then merge down to child-most
-        let mut merged = self
-            .get_base(&chain[0])
-            .cloned()
-            .unwrap_or_else(|| LocalizationConfig {
-                jurisdiction: requested_key.to_string(),
-                ..Default::default()
-            });
+        };
 
-        for key in chain.iter().skip(1) {
-            if let Some(child) = self.get_base(key) {
-                merged = merge_configs(child, &merged);
-            }
-        }
+        // A resolved chain is the parent chain of its child-most key, whose
+        // merged form was computed when the assets were loaded.
+        let mut merged = match self.configs.merged_by_key.get(resolved_key) {
+            Some(merged) => merged.clone(),
+            None => self.configs.merge_chain(chain),
+        };
 
         merged.jurisdiction = requested_key.to_string();
         merged
     }
 
-    pub fn get_compiled(
+    /// Compiled config for a resolved chain.
+    ///
+    /// The compiled form depends only on the chain, and a chain is the parent
+    /// chain of its child-most key. So unknown or malformed jurisdictions
+    /// (which fall back to e.g. "base") and sub-keys without their own config
+    /// share one compile with that key, which is cached here on first use.
+    fn compiled_for_chain(
         &mut self,
-        jurisdiction_input: &str,
-    ) -> Result<(CompiledConfig, LocalizationApplyProvenance), String> {
-        let requested_key = normalize_key(jurisdiction_input);
-
-        if let Some(existing) = self.compiled_cache.get(&requested_key) {
-            let chain = self
-                .resolved_key_chains
-                .get(&requested_key)
-                .cloned()
-                .unwrap_or_else(|| vec![]);
-
-            let hashes = chain
-                .iter()
-                .map(|k| self.get_base(k).and_then(|c| c.config_hash.clone()))
-                .collect::<Vec<_>>();
-
-            return Ok((
-                existing.clone(),
-                LocalizationApplyProvenance {
-                    requested_key,
-                    resolved_keys: chain,
-                    resolved_config_hashes: hashes,
-                },
-            ));
+        chain: &[String],
+        requested_key: &str,
+    ) -> Result<Arc<CompiledConfig>, String> {
+        let Some(resolved_key) = chain.last().filter(|k| *k != requested_key) else {
+            return compile_config(self.merged_config_for_chain(chain, requested_key))
+                .map(Arc::new);
+        };
+        if let Some((compiled, _)) = self.compiled_cache.get(resolved_key) {
+            return Ok(Arc::clone(compiled));
         }
 
-        let chain = self.resolve_chain(&requested_key);
-        let merged = self.merged_config_for_chain(&chain, &requested_key);
-        let compiled = compile_config(merged)?;
-
-        self.compiled_cache.insert(requested_key.clone(), compiled);
-        self.resolved_key_chains
-            .insert(requested_key.clone(), chain.clone());
+        let compiled = Arc::new(compile_config(
+            self.merged_config_for_chain(chain, resolved_key),
+        )?);
+        let provenance = self.provenance(resolved_key, chain.to_vec());
+        self.compiled_cache
+            .insert(resolved_key.clone(), (Arc::clone(&compiled), provenance));
+        Ok(compiled)
+    }
 
+    fn provenance(&self, requested_key: &str, chain: Vec<String>) -> LocalizationApplyProvenance {
         let hashes = chain
             .iter()
             .map(|k| self.get_base(k).and_then(|c| c.config_hash.clone()))
             .collect::<Vec<_>>();
 
-        let compiled_ref = self
-            .compiled_cache
-            .get(&requested_key)
-            .expect("compiled cache just inserted");
+        LocalizationApplyProvenance {
+            requested_key: requested_key.to_string(),
+            resolved_keys: chain,
+            resolved_config_hashes: hashes,
+        }
+    }
+
+    /// Compiled config and provenance for a jurisdiction, compiled on first use.
+    ///
+    /// Callers repeat the same spelling for every record, so a hit on the input
+    /// as given skips key normalization and chain resolution, and nothing is
+    /// cloned.
+    pub fn get_compiled(
+        &mut self,
+        jurisdiction_input: &str,
+    ) -> Result<&(Arc<CompiledConfig>, LocalizationApplyProvenance), String> {
+        // The memo starts out empty, so an empty key never counts as a repeat.
+        let repeat = !self.last_lookup.1.is_empty() && self.last_lookup.0 == jurisdiction_input;
+        if !repeat {
+            if !self.key_by_input.contains_key(jurisdiction_input)
+                && !self.compiled_cache.contains_key(jurisdiction_input)
+            {
+                self.insert_compiled(jurisdiction_input)?;
+            }
+
+            let key = self
+                .key_by_input
+                .get(jurisdiction_input)
+                .map_or(jurisdiction_input, String::as_str);
+            let (last_input, last_key) = &mut self.last_lookup;
+            last_input.clear();
+            last_input.push_str(jurisdiction_input);
+            last_key.clear();
+            last_key.push_str(key);
+        }
+
+        Ok(&self.compiled_cache[&self.last_lookup.1])
+    }
+
+    fn insert_compiled(&mut self, jurisdiction_input: &str) -> Result<(), String> {
+        let requested_key = normalize_key(jurisdiction_input);
+
+        if !self.compiled_cache.contains_key(&requested_key) {
+            let chain = self.resolve_chain(&requested_key);
+            let compiled = self.compiled_for_chain(&chain, &requested_key)?;
+            let provenance = self.provenance(&requested_key, chain);
+            self.compiled_cache
+                .insert(requested_key.clone(), (compiled, provenance));
+        }
 
-        Ok((
-            compiled_ref.clone(),
-            LocalizationApplyProvenance {
-                requested_key,
-                resolved_keys: chain,
-                resolved_config_hashes: hashes,
-            },
-        ))
+        // normalize_key is idempotent, so an input spelling that differs from
+        // its key is never itself a normalized key.
+        if jurisdiction_input != requested_key {
+            self.key_by_input
+                .insert(jurisdiction_input.to_string(), requested_key);
+        }
+        Ok(())
     }
 }
 
@@ -625,10 +1108,64 @@ impl LocalizationRegistry {
 // PUBLIC API
 // =============================================================================
 
+/// Shared compiled config for a jurisdiction; the registry lock is held only
+/// for the lookup, so callers localize concurrently.
+fn compiled_for(jurisdiction: &str) -> Result<Arc<CompiledConfig>, String> {
+    with_registry_mut(|reg| Ok(Arc::clone(&reg.get_compiled(jurisdiction)?.0)))
+}
+
 pub fn apply_localization_name(name: &str, jurisdiction: &str) -> Result<String, String> {
-    with_registry_mut(|reg| {
-        let (compiled, _prov) = reg.get_compiled(jurisdiction)?;
-        Ok(compiled.apply_to_name(name))
+    Ok(compiled_for(jurisdiction)?.apply_to_name(name))
+}
+
+// Batches at least this large are split across threads.
+const PARALLEL_BATCH_MIN: usize = 4096;
+
+/// Localize many names for one jurisdiction, resolving its config once.
+///
+/// Same result as calling `apply_localization_name` per name, in input order.
+/// Large batches are spread over one scoped thread per available core.
+pub fn apply_localization_names<S: AsRef<str> + Sync>(
+    names: &[S],
+    jurisdiction: &str,
+) -> Result<Vec<String>, String> {
+    let compiled = compiled_for(jurisdiction)?;
+    let workers = if names.len() < PARALLEL_BATCH_MIN {
+        1
+    } else {
+        std::thread::available_parallelism().map_or(1, usize::from)
+    };
+    Ok(localize_batch(&compiled, names, workers))
+}
+
+/// Apply `compiled` to each name, splitting the batch into `workers`
+/// contiguous chunks on scoped threads that share the compiled config.
+fn localize_batch<S: AsRef<str> + Sync>(
+    compiled: &CompiledConfig,
+    names: &[S],
+    workers: usize,
+) -> Vec<String> {
+    let localize = |chunk: &[S]| -> Vec<String> {
+        chunk
+            .iter()
+            .map(|name| compiled.apply_to_name(name.as_ref()))
+            .collect()
+    };
+    if workers < 2 || names.len() < 2 {
+        return localize(names);
+    }
+
+    let chunk_size = names.len().div_ceil(workers);
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = names
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(move || localize(chunk)))
+            .collect();
+        let mut out = Vec::with_capacity(names.len());
+        for handle in handles {
+            out.extend(handle.join().expect("localization worker panicked"));
+        }
+        out
     })
 }
 
@@ -636,12 +1173,13 @@ pub fn apply_localization_name_detailed(
     name: &str,
     jurisdiction: &str,
 ) -> Result<LocalizationApplyResult, String> {
-    with_registry_mut(|reg| {
+    let (compiled, provenance) = with_registry_mut(|reg| {
         let (compiled, prov) = reg.get_compiled(jurisdiction)?;
-        Ok(LocalizationApplyResult {
-            output: compiled.apply_to_name(name),
-            provenance: prov,
-        })
+        Ok((Arc::clone(compiled), prov.clone()))
+    })?;
+    Ok(LocalizationApplyResult {
+        output: compiled.apply_to_name(name),
+        provenance,
     })
 }
 
@@ -662,6 +1200,321 @@ pub fn apply_localization_name_detailed_json(
 mod tests {
     use super::*;
 
+    #[test]
+    fn embedded_json_matches_yaml() {
+        let json_by_key: HashMap<&str, &str> = LOCALIZATION_JSON.iter().copied().collect();
+        for (key, yaml_text) in LOCALIZATION_YAMLS.iter() {
+            let k = normalize_key(key);
+            let from_yaml = parse_yaml_to_config(&k, yaml_text).expect("YAML should parse");
+            let json_text = json_by_key.get(key).copied().unwrap_or("");
+            assert!(!json_text.is_empty(), "no JSON form embedded for {key}");
+            let file_cfg = serde_json::from_str(json_text).expect("JSON should parse");
+            assert_eq!(file_to_config(file_cfg), from_yaml, "{key}");
+        }
+    }
+
+    #[test]
+    fn merge_configs_child_overrides_and_extends_parent() {
+        let parent = LocalizationConfig {
+            jurisdiction: "us".to_string(),
+            version: Some("1".to_string()),
+            abbreviations: HashMap::from([
+                ("st".to_string(), "saint".to_string()),
+                ("co".to_string(), "company".to_string()),
+            ]),
+            stop_words: HashSet::from(["the".to_string()]),
+            ..Default::default()
+        };
+        let child = LocalizationConfig {
+            jurisdiction: "us/mn".to_string(),
+            parent: Some("us".to_string()),
+            abbreviations: HashMap::from([("st".to_string(), "street".to_string())]),
+            stop_words: HashSet::from(["of".to_string()]),
+            ..Default::default()
+        };
+
+        let merged = merge_configs(&child, parent);
+
+        assert_eq!(merged.jurisdiction, "us/mn");
+        assert_eq!(merged.parent.as_deref(), Some("us"));
+        assert_eq!(merged.version.as_deref(), Some("1"));
+        assert_eq!(merged.abbreviations["st"], "street");
+        assert_eq!(merged.abbreviations["co"], "company");
+        assert_eq!(merged.stop_words.len(), 2);
+    }
+
+    #[test]
+    fn normalize_key_lowercases_and_uses_slashes() {
+        assert_eq!(normalize_key("US-IL"), "us/il");
+        assert_eq!(normalize_key(" us/mn "), "us/mn");
+        assert_eq!(normalize_key("BASE"), "base");
+        assert_eq!(normalize_key("CA-QC-\u{c9}T\u{c9}"), "ca/qc/\u{e9}t\u{e9}");
+    }
+
+    #[test]
+    fn get_compiled_caches_input_spelling_and_normalized_key() {
+        let mut reg = LocalizationRegistry::new().expect("embedded configs should load");
+        let (_, first) = reg.get_compiled("US-IL").expect("US-IL should resolve");
+        let first = first.clone();
+        assert_eq!(reg.key_by_input["US-IL"], "us/il");
+        assert!(reg.compiled_cache.contains_key("us/il"));
+
+        let (_, again) = reg.get_compiled("us/il").expect("us/il should resolve");
+        assert_eq!(again.requested_key, "us/il");
+        assert_eq!(again.resolved_keys, first.resolved_keys);
+        assert_eq!(reg.compiled_cache.len(), 1);
+        assert_eq!(reg.key_by_input.len(), 1);
+    }
+
+    #[test]
+    fn get_compiled_repeat_and_switch_resolve_the_same_entries() {
+        let mut reg = LocalizationRegistry::new().expect("embedded configs should load");
+        for input in ["US-IL", "US-IL", "us/il", "", "", "ZZ", "US-IL"] {
+            let (_, prov) = reg
+                .get_compiled(input)
+                .expect("jurisdiction should resolve");
+            assert_eq!(prov.requested_key, normalize_key(input), "{input:?}");
+            assert_eq!(reg.last_lookup.0, input);
+        }
+    }
+
+    #[test]
+    fn unknown_jurisdictions_share_the_fallback_compile() {
+        let mut reg = LocalizationRegistry::new().expect("embedded configs should load");
+        let (_, prov) = reg
+            .get_compiled("ZZ")
+            .expect("unknown key should fall back");
+        assert_eq!(prov.requested_key, "zz");
+        assert_eq!(prov.resolved_keys, vec!["base".to_string()]);
+        assert!(reg.compiled_cache.contains_key("base"));
+
+        let name = "The City of Springfield, Inc.";
+        let (compiled, _) = reg
+            .get_compiled("xx")
+            .expect("unknown key should fall back");
+        let output = compiled.apply_to_name(name);
+        let (base, base_prov) = reg.get_compiled("base").expect("base should resolve");
+        assert_eq!(base_prov.requested_key, "base");
+        assert_eq!(output, base.apply_to_name(name));
+    }
+
+    #[test]
+    fn resolve_chain_matches_full_walk() {
+        let configs = embedded_configs().expect("embedded configs should load");
+        for requested in [
+            "us/il",
+            "us/il/chicago",
+            "us/zz",
+            "us",
+            "zz",
+            "base",
+            "",
+            "/x",
+        ] {
+            assert_eq!(
+                configs.resolve_chain(requested),
+                configs.walk_chain(requested),
+                "{requested}"
+            );
+        }
+    }
+
+    #[test]
+    fn precomputed_merge_matches_chain_merge() {
+        let configs = embedded_configs().expect("embedded configs should load");
+        for requested in ["us/il", "us/il/chicago", "us", "zz", "base"] {
+            let chain = configs.resolve_chain(requested);
+            let Some(last) = chain.last() else { continue };
+            assert_eq!(
+                configs.merged_by_key[last],
+                configs.merge_chain(&chain),
+                "{requested}"
+            );
+        }
+    }
+
+    #[test]
+    fn expand_abbreviations_matches_token_join() {
+        let abbreviations: HashMap<String, String> = [("doj", "department of justice"), ("x", "")]
+            .into_iter()
+            .map(|(k, v)| (k.to_string(), v.to_string()))
+            .collect();
+        for s in [
+            "",
+            "doj",
+            "the doj",
+            "doj office",
+            "a doj b doj",
+            "x doj x",
+            "none here",
+        ] {
+            let mut text = s.to_string();
+            let changed = expand_abbreviations(&mut text, &abbreviations);
+            let expected = s
+                .split_whitespace()
+                .map(|tok| abbreviations.get(tok).map_or(tok, String::as_str))
+                .collect::<Vec<_>>()
+                .join(" ");
+            assert_eq!(text, expected, "{s:?}");
+            assert_eq!(changed, text != s, "{s:?}");
+        }
+    }
+
+    #[test]
+    fn noop_config_only_lowercases_and_collapses() {
+        let compiled =
+            compile_config(LocalizationConfig::default()).expect("empty config compiles");
+        assert!(compiled.is_noop);
+        assert_eq!(
+            compiled.apply_to_name("  The  CITY\tof X "),
+            "the city of x"
+        );
+    }
+
+    #[test]
+    fn remove_stop_words_matches_token_filter() {
+        let stop_words: HashSet<String> = ["the", "of"].into_iter().map(String::from).collect();
+        for s in [
+            "",
+            "the",
+            "the of",
+            "city of x",
+            "the city",
+            "x the",
+            "a b c",
+            "of a of b",
+        ] {
+            let mut text = s.to_string();
+            let changed = remove_stop_words(&mut text, &stop_words);
+            let expected = s
+                .split_whitespace()
+                .filter(|tok| !stop_words.contains(*tok))
+                .collect::<Vec<_>>()
+                .join(" ");
+            assert_eq!(text, expected, "{s:?}");
+            assert_eq!(changed, text != s, "{s:?}");
+        }
+    }
+
+    #[test]
+    fn apply_localization_names_matches_single_calls() {
+        let names = [
+            "MCDERMOTT CENTER|CLEANED-UP",
+            "City of Chicago",
+            "",
+            "City of Chicago",
+        ];
+        let batch = apply_localization_names(&names, "US-IL").expect("US-IL should resolve");
+        let single: Vec<String> = names
+            .iter()
+            .map(|n| apply_localization_name(n, "US-IL").expect("US-IL should resolve"))
+            .collect();
+        assert_eq!(batch, single);
+
+        let mut reg = LocalizationRegistry::new().expect("embedded configs should load");
+        let (compiled, _) = reg.get_compiled("US-IL").expect("US-IL should resolve");
+        let many: Vec<String> = (0..101)
+            .map(|i| format!("Village of Oak Park {i}|CLEANED-UP"))
+            .collect();
+        assert_eq!(
+            localize_batch(compiled, &many, 4),
+            localize_batch(compiled, &many, 1)
+        );
+    }
+
+    #[test]
+    fn collapse_in_place_matches_split_join() {
+        for s in [
+            "", " ", "a", "a b", " a b", "a  b", "a b ", "a\tb", "a\u{a0}b", "a \n b",
+        ] {
+            let mut text = s.to_string();
+            collapse_whitespace_in_place(&mut text);
+            assert_eq!(text, collapse_whitespace(s), "{s:?}");
+        }
+    }
+
+    #[test]
+    fn literal_rule_runs_match_sequential_replace() {
+        let rules = [
+            ("\u{e9}", "e"),
+            ("\u{e8}", "e"),
+            ("\u{e9}", "x"),
+            ("&", " and "),
+            ("e", "3"),
+            ("\u{e0}", "a"),
+            ("aa", "a"),
+            ("\u{e7}", ""),
+        ];
+        let mut compiled = Vec::new();
+        for (pattern, replacement) in rules {
+            push_literal_rule(&mut compiled, pattern.to_string(), replacement.to_string());
+        }
+        // The "e" rule would rewrite the "e" produced by earlier rules, and a
+        // multi-char pattern cannot join a run.
+        assert!(compiled.len() > 2 && compiled.len() < rules.len());
+
+        for input in [
+            "caf\u{e9} cr\u{e8}me & gar\u{e7}on",
+            "\u{e0}\u{e0}ron",
+            "plain",
+        ] {
+            let mut fused = input.to_string();
+            for rule in compiled.iter() {
+                if rule.apply(&mut fused) {
+                    collapse_whitespace_in_place(&mut fused);
+                }
+            }
+            let mut sequential = input.to_string();
+            for (pattern, replacement) in rules {
+                sequential = collapse_whitespace(&sequential.replace(pattern, replacement));
+            }
+            assert_eq!(fused, sequential, "{input:?}");
+        }
+    }
+
+    #[test]
+    fn word_substitutions_prefilter_skips_absent_keys_only() {
+        let map = HashMap::from([
+            ("dept".to_string(), "department".to_string()),
+            ("twp".to_string(), "township".to_string()),
+            ("\u{e9}cole".to_string(), "school".to_string()),
+        ]);
+        let subs = compile_word_substitutions(&map, "test").expect("should compile");
+        let flagged = |text: &str| -> HashSet<String> {
+            subs.candidates(text)
+                .iter()
+                .zip(subs.regexes.iter())
+                .filter(|(hit, _)| **hit)
+                .map(|(_, (_, v))| v.clone())
+                .collect()
+        };
+
+        // Non-ASCII keys are always candidates; ASCII keys only when present.
+        assert_eq!(
+            flagged("springfield dept"),
+            HashSet::from(["department".to_string(), "school".to_string()])
+        );
+        // Accented text still uses it; only long s / Kelvin sign disable it,
+        // since those match ASCII letters case-insensitively.
+        assert_eq!(
+            flagged("caf\u{e9} dept"),
+            HashSet::from(["department".to_string(), "school".to_string()])
+        );
+        assert_eq!(flagged("\u{17f}pringfield").len(), 3);
+        let mut text = "d\u{e9}p\u{f4}t twp".to_string();
+        subs.apply(&mut text);
+        assert_eq!(text, "d\u{e9}p\u{f4}t township");
+
+        let mut text = "dept of twp roads".to_string();
+        assert!(subs.apply(&mut text));
+        assert_eq!(text, "department of township roads");
+
+        // Plain ASCII with no key settles on one automaton scan.
+        let mut text = "springfield roads".to_string();
+        assert!(!subs.apply(&mut text));
+        assert_eq!(text, "springfield roads");
+    }
+
     #[test]
     fn key_normalization_accepts_us_il() {
         assert_eq!(normalize_key("US-IL"), "us/il");
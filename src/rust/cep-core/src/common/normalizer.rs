@@ -210,8 +210,23 @@ lazy_static! {
 // HELPER FUNCTIONS
 // =============================================================================
 
+/// Lowercase `text`; ASCII input takes the byte-wise path.
+fn lowercase(text: &str) -> String {
+    if text.is_ascii() {
+        text.to_ascii_lowercase()
+    } else {
+        text.to_lowercase()
+    }
+}
+
 /// Convert Unicode to ASCII equivalent.
-fn to_ascii(text: &str) -> String {
+fn to_ascii(text: String) -> String {
+    // ASCII is unchanged by NFKD and kept whole by the filter below, so the
+    // common all-ASCII name skips the Unicode decomposition entirely.
+    if text.is_ascii() {
+        return text;
+    }
+
     // First, apply NFD normalization to decompose characters
     let normalized: String = text.nfkd().collect();
 
@@ -342,10 +357,10 @@ pub fn normalize_legal_name(name: &str) -> String {
     }
 
     // 1. Lowercase
-    let text = name.to_lowercase();
+    let text = lowercase(name);
 
     // 2. ASCII transliteration
-    let text = to_ascii(&text);
+    let text = to_ascii(text);
 
     // 3. Remove punctuation
     let text = remove_punctuation(&text);
@@ -385,10 +400,10 @@ pub fn normalize_address(address: &str) -> String {
     }
 
     // 1. Lowercase
-    let mut text = address.to_lowercase();
+    let mut text = lowercase(address);
 
     // 2. ASCII transliteration
-    text = to_ascii(&text);
+    text = to_ascii(text);
 
     // 3. Remove secondary unit designators
     for pattern in SECONDARY_UNIT_PATTERNS.iter() {
@@ -579,6 +594,14 @@ mod tests {
         assert_eq!(normalize_legal_name("Société Générale"), "societe generale");
     }
 
+    #[test]
+    fn test_to_ascii_fast_path_keeps_ascii_text() {
+        let ascii = "acme corp., inc. #12 (usa)";
+        assert_eq!(to_ascii(ascii.to_string()), ascii);
+        assert_eq!(to_ascii("straße æon".to_string()), "strasse aeon");
+        assert_eq!(lowercase("ÉCOLE Acme"), "école acme");
+    }
+
     #[test]
     fn test_normalize_legal_name_punctuation() {
         assert_eq!(
@@ -2,10 +2,9 @@
 //
 // Module for computing and validating SNFEI (Structured Non-Fungible Entity Identifier).
 
-use sha2::{Digest, Sha256};
-
 use serde::{Deserialize, Serialize};
 
+use super::hash::sha256_hex;
 use super::normalizer::{CanonicalInput, build_canonical_input};
 
 /// A validated SNFEI (64-character lowercase hex string).
@@ -20,9 +19,9 @@ impl Snfei {
 
     /// Create from an existing hash string.
     pub fn from_hash(hash: &str) -> Option<Self> {
-        if hash.len() == 64 && hash.chars().all(|c| c.is_ascii_hexdigit()) {
+        if hash.len() == 64 && hash.bytes().all(|b| b.is_ascii_hexdigit()) {
             Some(Self {
-                value: hash.to_lowercase(),
+                value: hash.to_ascii_lowercase(),
             })
         } else {
             None
@@ -74,14 +73,30 @@ pub struct SnfeiResult {
 /// Compute SNFEI from canonical input.
 pub fn compute_snfei(canonical: &CanonicalInput) -> Snfei {
     let hash_input = canonical.to_hash_string();
-    let mut hasher = Sha256::new();
-    hasher.update(hash_input.as_bytes());
-    let result = hasher.finalize();
     Snfei {
-        value: format!("{:x}", result),
+        value: sha256_hex(hash_input.as_bytes()),
     }
 }
 
+// `fields_used` per tier; Tier 3 is indexed by [has_address][has_registration_date].
+const TIER1_FIELDS: &[&str] = &["lei", "legal_name", "country_code"];
+const TIER2_FIELDS: &[&str] = &["sam_uei", "legal_name", "country_code"];
+const TIER3_FIELDS: [[&[&str]; 2]; 2] = [
+    [
+        &["legal_name", "country_code"],
+        &["legal_name", "country_code", "registration_date"],
+    ],
+    [
+        &["legal_name", "country_code", "address"],
+        &["legal_name", "country_code", "address", "registration_date"],
+    ],
+];
+
+/// `fields_used` as stored in `SnfeiResult`: one exact-size allocation.
+fn owned_fields(fields: &[&str]) -> Vec<String> {
+    fields.iter().map(|f| (*f).to_string()).collect()
+}
+
 /// Generate SNFEI with confidence scoring and tier classification.
 ///
 /// Tier Classification:
@@ -107,11 +122,7 @@ pub fn generate_snfei_with_confidence(
                 canonical,
                 confidence_score: 1.0,
                 tier: 1,
-                fields_used: vec![
-                    "lei".to_string(),
-                    "legal_name".to_string(),
-                    "country_code".to_string(),
-                ],
+                fields_used: owned_fields(TIER1_FIELDS),
             };
         }
     }
@@ -124,11 +135,7 @@ pub fn generate_snfei_with_confidence(
                 canonical,
                 confidence_score: 0.95,
                 tier: 2,
-                fields_used: vec![
-                    "sam_uei".to_string(),
-                    "legal_name".to_string(),
-                    "country_code".to_string(),
-                ],
+                fields_used: owned_fields(TIER2_FIELDS),
             };
         }
     }
@@ -144,13 +151,8 @@ pub fn generate_snfei_with_confidence(
         .as_deref()
         .map_or(false, |s| !s.is_empty());
 
-    let mut fields_used = vec!["legal_name".to_string(), "country_code".to_string()];
-    if has_address {
-        fields_used.push("address".to_string());
-    }
-    if has_registration_date {
-        fields_used.push("registration_date".to_string());
-    }
+    let fields_used =
+        owned_fields(TIER3_FIELDS[has_address as usize][has_registration_date as usize]);
 
     let mut confidence: f64 = 0.5;
     if has_address {
@@ -159,8 +161,13 @@ pub fn generate_snfei_with_confidence(
     if has_registration_date {
         confidence += 0.2;
     }
-    let word_count = canonical.legal_name_normalized.split_whitespace().count();
-    if word_count > 3 {
+    // More than three words; stops scanning at the fourth.
+    if canonical
+        .legal_name_normalized
+        .split_whitespace()
+        .nth(3)
+        .is_some()
+    {
         confidence += 0.1;
     }
     confidence = confidence.min(0.9).max(0.0);
@@ -174,21 +181,200 @@ pub fn generate_snfei_with_confidence(
     }
 }
 
+/// SNFEI together with the canonical input it was hashed from.
+///
+/// The `snfei` and `canonical` of `generate_snfei_with_confidence`, without the
+/// LEI / SAM UEI tiering, for callers that need the normalized fields as well.
+pub fn generate_snfei_full(
+    legal_name: &str,
+    country_code: &str,
+    address: Option<&str>,
+    registration_date: Option<&str>,
+) -> (Snfei, CanonicalInput) {
+    let canonical = build_canonical_input(legal_name, country_code, address, registration_date);
+    (compute_snfei(&canonical), canonical)
+}
+
+/// SNFEI value only: the `snfei` of `generate_snfei_with_confidence`.
+///
+/// The SNFEI does not depend on the LEI / SAM UEI tiering, so callers that
+/// only need the value skip the confidence, tier and fields_used assembly.
+pub fn generate_snfei_value(
+    legal_name: &str,
+    country_code: &str,
+    address: Option<&str>,
+    registration_date: Option<&str>,
+) -> String {
+    generate_snfei_full(legal_name, country_code, address, registration_date)
+        .0
+        .value
+}
+
 /// Simple SNFEI generation without metadata.
 pub fn generate_snfei_simple(
     legal_name: &str,
     country_code: &str,
     address: Option<&str>,
 ) -> String {
-    let result =
-        generate_snfei_with_confidence(legal_name, country_code, address, None, None, None);
-    result.snfei.value
+    generate_snfei_value(legal_name, country_code, address, None)
+}
+
+/// SNFEI values for many raw rows of (legal_name, country_code, address,
+/// registration_date); `generate_snfei_value` per row.
+///
+/// Output order matches input order.
+pub fn generate_snfei_batch<'a, I>(rows: I) -> Vec<String>
+where
+    I: IntoIterator<Item = (&'a str, &'a str, Option<&'a str>, Option<&'a str>)>,
+{
+    rows.into_iter()
+        .map(|(legal_name, country_code, address, registration_date)| {
+            generate_snfei_value(legal_name, country_code, address, registration_date)
+        })
+        .collect()
+}
+
+/// SNFEI of the adapter identity projection for a localized name.
+///
+/// Hashes the same bytes as Python's
+/// `json.dumps({"jurisdictionIso": iso, "legalNameNormalized": name},
+/// sort_keys=True, separators=(",", ":"))`, including its ASCII-only escaping,
+/// so values match `SimpleEntityAdapter.compute_identity` exactly.
+pub fn snfei_for_name_projection(legal_name_normalized: &str, jurisdiction_iso: &str) -> String {
+    let mut canonical =
+        String::with_capacity(48 + legal_name_normalized.len() + jurisdiction_iso.len());
+    canonical.push_str("{\"jurisdictionIso\":");
+    push_json_ascii_string(&mut canonical, jurisdiction_iso);
+    canonical.push_str(",\"legalNameNormalized\":");
+    push_json_ascii_string(&mut canonical, legal_name_normalized);
+    canonical.push('}');
+
+    sha256_hex(canonical.as_bytes())
+}
+
+/// Append `s` as a JSON string literal the way Python's `json.dumps` writes it
+/// by default (`ensure_ascii=True`): short escapes for quote, backslash and
+/// `\n \r \t \b \f`; every other character outside printable ASCII as
+/// lowercase `\uXXXX` (UTF-16 surrogate pairs above U+FFFF).
+fn push_json_ascii_string(out: &mut String, s: &str) {
+    use std::fmt::Write;
+
+    out.push('"');
+    for c in s.chars() {
+        match c {
+            '"' => out.push_str("\\\""),
+            '\\' => out.push_str("\\\\"),
+            '\n' => out.push_str("\\n"),
+            '\r' => out.push_str("\\r"),
+            '\t' => out.push_str("\\t"),
+            '\u{08}' => out.push_str("\\b"),
+            '\u{0c}' => out.push_str("\\f"),
+            ' '..='~' => out.push(c),
+            _ => {
+                let mut units = [0u16; 2];
+                for unit in c.encode_utf16(&mut units) {
+                    let _ = write!(out, "\\u{:04x}", unit);
+                }
+            }
+        }
+    }
+    out.push('"');
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn name_projection_matches_python_json_dumps() {
+        // Reference values from SimpleEntityAdapter.compute_identity (Python).
+        assert_eq!(
+            snfei_for_name_projection("springfield unified school district", "US-IL"),
+            "a661d7d2ce2d563b1cad4c9ec3c570d36f0b1f7e4650a035206c5df55aab2a6a"
+        );
+        assert_eq!(
+            snfei_for_name_projection("\u{e9}cole \"d\" \u{1d11e}\u{7f}", "US-VT"),
+            "535680ddcc8e195ff1aa6c056832c7d0f4a4a681951703818efae1bbbda52955"
+        );
+    }
+
+    #[test]
+    fn tier3_confidence_scoring() {
+        let score = |name: &str, address: Option<&str>, date: Option<&str>| {
+            generate_snfei_with_confidence(name, "US", address, date, None, None).confidence_score
+        };
+        assert_eq!(score("Acme Widgets", None, None), 0.5);
+        assert_eq!(score("Acme Widgets", Some("1 Main St"), None), 0.7);
+        assert_eq!(score("Acme Widgets", Some("1 Main St"), Some("2001")), 0.9);
+        // Long names add 0.1, capped at 0.9 overall.
+        assert_eq!(score("North Star Widget Makers", None, None), 0.6);
+        assert_eq!(
+            score("North Star Widget Makers", Some("1 Main St"), Some("2001")),
+            0.9
+        );
+    }
+
+    #[test]
+    fn fields_used_by_tier() {
+        let fields = |address: Option<&str>, date: Option<&str>, lei: Option<&str>| {
+            generate_snfei_with_confidence("Acme", "US", address, date, lei, None).fields_used
+        };
+        assert_eq!(fields(None, None, None), ["legal_name", "country_code"]);
+        assert_eq!(
+            fields(None, Some("2001"), None),
+            ["legal_name", "country_code", "registration_date"]
+        );
+        assert_eq!(
+            fields(Some("1 Main St"), Some("2001"), None),
+            ["legal_name", "country_code", "address", "registration_date"]
+        );
+        assert_eq!(
+            fields(None, None, Some("5493001KJTIIGC8Y1R12")),
+            ["lei", "legal_name", "country_code"]
+        );
+    }
+
+    #[test]
+    fn batch_matches_single_row_pipeline() {
+        let rows = [
+            (
+                "Springfield USD",
+                "US",
+                Some("123 N. Main St."),
+                Some("03/15/1990"),
+            ),
+            ("Acme Corp", "us", None, None),
+        ];
+        let expected: Vec<String> = rows
+            .iter()
+            .map(|&(name, country, address, date)| {
+                generate_snfei_with_confidence(name, country, address, date, None, None)
+                    .snfei
+                    .value
+            })
+            .collect();
+        assert_eq!(generate_snfei_batch(rows), expected);
+    }
+
+    #[test]
+    fn full_matches_detailed_snfei_and_canonical() {
+        let (snfei, canonical) =
+            generate_snfei_full("Springfield USD", "us", Some("123 N. Main St."), None);
+        let detailed = generate_snfei_with_confidence(
+            "Springfield USD",
+            "us",
+            Some("123 N. Main St."),
+            None,
+            None,
+            None,
+        );
+        assert_eq!(snfei, detailed.snfei);
+        assert_eq!(
+            canonical.to_hash_string(),
+            detailed.canonical.to_hash_string()
+        );
+    }
+
     #[test]
     fn snfei_allows_digits_and_lowercase_hex() {
         let s = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef";
@@ -8,6 +8,7 @@
 use super::identifiers::SNFEI_SCHEME_URI;
 use crate::common::attestations::deserialize_nonempty_vec;
 use crate::common::errors::{CepError, CepResult, map_json_input_error};
+use crate::common::snfei::Snfei;
 use serde::Deserialize;
 
 // Keep entity type URI generation in one place so recordTypeUri stays consistent.
@@ -66,10 +67,27 @@ pub fn build_entity_from_normalized_json(input_json: &str) -> CepResult<String>
     serde_json::to_string(&record).map_err(|e| CepError::BuilderError(e.to_string()))
 }
 
+/// Value-in / value-out variant of `build_entity_from_normalized_json`.
+///
+/// Used by FFI callers that already hold a structured payload (for example a
+/// Python dict converted in place), so no JSON text is produced or parsed.
+/// Validation and error mapping match the JSON entry point.
+pub fn build_entity_from_normalized_value(
+    input: serde_json::Value,
+) -> CepResult<serde_json::Value> {
+    let normalized: NormalizedEntityInput =
+        serde_json::from_value(input).map_err(map_json_input_error)?;
+
+    let record = build_entity_from_normalized(normalized);
+
+    serde_json::to_value(&record).map_err(|e| CepError::BuilderError(e.to_string()))
+}
+
 /// Internal helper: map NormalizedEntityInput to EntityRecord.
 /// Keep wiring in one place.
 fn build_entity_from_normalized(input: NormalizedEntityInput) -> EntityRecord {
     let et_uri = entity_type_uri(&input.entity_type);
+    let verifiable_id = verifiable_id_for_snfei(&input.snfei);
 
     EntityRecord {
         // Envelope-level / structural fields
@@ -78,7 +96,7 @@ fn build_entity_from_normalized(input: NormalizedEntityInput) -> EntityRecord {
         schema_version: "1.0.0".to_string(),
         revision_number: 1,
 
-        verifiable_id: format!("cep-entity:snfei:{}", input.snfei),
+        verifiable_id,
 
         // Keep recordTypeUri consistent by deriving from the same function.
         record_type_uri: et_uri,
@@ -97,7 +115,8 @@ fn build_entity_from_normalized(input: NormalizedEntityInput) -> EntityRecord {
         legal_name_normalized: input.legal_name_normalized,
         short_name: None,
 
-        identifiers: Some(build_identifiers_snfei(&input.snfei)),
+        // Last use of input.snfei: move it into the identifier.
+        identifiers: Some(build_identifiers_snfei(input.snfei)),
 
         // Filled later by upstream systems as desired.
         inception_date: None,
@@ -111,6 +130,15 @@ fn build_entity_from_normalized(input: NormalizedEntityInput) -> EntityRecord {
 
 // ---------- Helpers / defaults ----------
 
+/// Build `cep-entity:snfei:<snfei>` in a single exactly-sized allocation.
+fn verifiable_id_for_snfei(snfei: &str) -> String {
+    let prefix = Snfei::VERIFIABLE_ID_PREFIX;
+    let mut id = String::with_capacity(prefix.len() + snfei.len());
+    id.push_str(prefix);
+    id.push_str(snfei);
+    id
+}
+
 fn entity_record_schema_uri() -> String {
     "https://raw.githubusercontent.com/civic-interconnect/civic-interconnect/main/schemas/core/cep.entity.schema.json"
         .to_string()
@@ -183,10 +211,10 @@ fn default_timestamps() -> Timestamps {
 }
 
 /// Build the identifiers array using the CEP Identifier Scheme vocabulary.
-fn build_identifiers_snfei(snfei: &str) -> Identifiers {
+fn build_identifiers_snfei(snfei: String) -> Identifiers {
     vec![Identifier {
         scheme_uri: SNFEI_SCHEME_URI.to_string(),
-        identifier: snfei.to_string(),
+        identifier: snfei,
         source_reference: None,
     }]
 }
@@ -269,6 +297,27 @@ mod tests {
         assert!(entity["attestations"].as_array().unwrap().len() >= 1);
     }
 
+    #[test]
+    fn value_builder_matches_json_builder() {
+        let input = json!({
+            "jurisdictionIso": "US-MN",
+            "legalName": "Springfield Public Schools",
+            "legalNameNormalized": "springfield public schools",
+            "snfei": "deadbeef".repeat(8),
+            "entityType": "school_district",
+            "attestations": [ one_attestation_json() ]
+        });
+
+        let input_json = serde_json::to_string(&input).expect("to_string should not fail");
+        let from_json: Value = serde_json::from_str(
+            &build_entity_from_normalized_json(&input_json).expect("builder should succeed"),
+        )
+        .expect("output must be valid JSON");
+        let from_value = build_entity_from_normalized_value(input).expect("builder should succeed");
+
+        assert_eq!(from_value, from_json);
+    }
+
     #[test]
     fn missing_attestations_is_rejected() {
         let snfei_64 = "deadbeef".repeat(8);
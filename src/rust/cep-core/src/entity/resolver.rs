@@ -3,7 +3,8 @@
 
 // path: rust/cep-core/src/common/entity/resolver.rs
 
-use sha2::{Digest, Sha256};
+use crate::common::hash::sha256_hex;
+use crate::common::snfei::Snfei as CommonSnfei;
 
 // Import structs and functions from the sibling normalizer module
 use super::normalizer::{CanonicalInput, build_canonical_input};
@@ -19,9 +20,6 @@ pub struct Snfei {
 }
 
 impl Snfei {
-    /// The prefix for a Verifiable ID derived from an SNFEI.
-    const VERIFIABLE_ID_PREFIX: &'static str = "cep-entity:snfei:";
-
     /// Private constructor that performs validation.
     fn new(value: String) -> Result<Self, ValueError> {
         if value.len() != 64 {
@@ -33,8 +31,8 @@ impl Snfei {
 
         // Allow digits 0–9 and lowercase a–f.
         if !value
-            .chars()
-            .all(|c| c.is_ascii_hexdigit() && !c.is_ascii_uppercase())
+            .bytes()
+            .all(|b| matches!(b, b'0'..=b'9' | b'a'..=b'f'))
         {
             return Err(ValueError("SNFEI must be lowercase hex".to_string()));
         }
@@ -44,7 +42,7 @@ impl Snfei {
 
     /// Generates the full Verifiable ID string (e.g., "cep-entity:snfei:a1b2c3d4...").
     pub fn to_verifiable_id(&self) -> String {
-        format!("{}{}", Self::VERIFIABLE_ID_PREFIX, self.value)
+        format!("{}{}", CommonSnfei::VERIFIABLE_ID_PREFIX, self.value)
     }
 
     /// Return string slice of SNFEI.
@@ -88,18 +86,10 @@ pub fn compute_snfei(canonical: &CanonicalInput) -> Result<Snfei, ValueError> {
     // 1. Get the concatenated hash input string (e.g., name|address|country|date)
     let hash_input = canonical.to_hash_string();
 
-    // 2. Encode to bytes (UTF-8)
-    let hash_bytes = hash_input.as_bytes();
-
-    // 3. Compute SHA-256 hash
-    let mut hasher = Sha256::new();
-    hasher.update(hash_bytes);
-    let result = hasher.finalize();
-
-    // 4. Convert the hash result to a 64-character lowercase hex string
-    let hex_digest = format!("{:x}", result);
+    // 2. SHA-256 over the UTF-8 bytes, as a 64-character lowercase hex string
+    let hex_digest = sha256_hex(hash_input.as_bytes());
 
-    // 5. Validate and return Snfei struct
+    // 3. Validate and return Snfei struct
     Snfei::new(hex_digest)
 }
 
@@ -9,15 +9,17 @@
 /// - No business logic here (no normalization logic, no schema logic, no policy).
 /// - Python-visible function names are stable and match the published .pyi surface.
 use pyo3::exceptions::PyValueError;
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::PyAny;
+use pyo3::types::{PyAny, PyBool, PyDict, PyFloat, PyInt, PyList, PyString, PyTuple};
 use pyo3::wrap_pyfunction;
 
 use serde::Serialize;
+use serde_json::{Map, Number, Value};
 
 // CEP builders (JSON-in, JSON-out)
 use cep_core::ctag::build_ctag_from_normalized_json;
-use cep_core::entity::build_entity_from_normalized_json;
+use cep_core::entity::{build_entity_from_normalized_json, build_entity_from_normalized_value};
 use cep_core::exchange::build_exchange_from_normalized_json;
 use cep_core::relationship::build_relationship_from_normalized_json;
 
@@ -50,7 +52,7 @@ impl From<SnfeiResult> for PySnfeiResult {
     fn from(r: SnfeiResult) -> Self {
         Self {
             snfei: PySnfei {
-                value: r.snfei.value().to_string(),
+                value: r.snfei.value,
             },
             canonical: PyCanonicalInput {
                 legal_name_normalized: r.canonical.legal_name_normalized,
@@ -68,22 +70,108 @@ impl From<SnfeiResult> for PySnfeiResult {
 // Core functions (aliased to avoid name collisions with Python-exported wrappers)
 use cep_core::common::localization::{
     apply_localization_name as core_apply_localization_name,
+    apply_localization_name_detailed as core_apply_localization_name_detailed,
     apply_localization_name_detailed_json as core_apply_localization_name_detailed_json,
+    apply_localization_names as core_apply_localization_names,
 };
 use cep_core::common::normalizer::{
     normalize_address as core_normalize_address, normalize_legal_name as core_normalize_legal_name,
-    normalize_registration_date as core_normalize_registration_date,
+    normalize_registration_date as core_normalize_registration_date, CanonicalInput,
+};
+use cep_core::common::snfei::{
+    compute_snfei as core_compute_snfei, generate_snfei_batch as core_generate_snfei_batch,
+    generate_snfei_full as core_generate_snfei_full, generate_snfei_value,
+    generate_snfei_with_confidence, snfei_for_name_projection, SnfeiResult,
 };
-use cep_core::common::snfei::{generate_snfei_with_confidence, SnfeiResult};
 
-/// Helper: parse JSON text into a Python object (dict/list/etc).
+/// Helper: convert a JSON-native Python object into a serde_json value.
 ///
-/// Returns an owned Python object (`Py<PyAny>`), suitable as a PyO3 return type.
-/// This avoids deprecated `PyObject` and avoids calling `.into_py()` on `Bound`.
-fn py_json_loads(py: Python<'_>, json_text: &str) -> PyResult<Py<PyAny>> {
-    let json_mod = py.import("json")?;
-    let obj = json_mod.call_method1("loads", (json_text,))?;
-    Ok(obj.unbind())
+/// Accepts None, bool, int, float, str, list, tuple and dict with str keys;
+/// anything else is rejected (the JSON path would reject it too).
+fn py_to_json_value(obj: &Bound<'_, PyAny>) -> PyResult<Value> {
+    if obj.is_none() {
+        return Ok(Value::Null);
+    }
+    // bool before int: Python bool is an int subclass.
+    if let Ok(b) = obj.cast::<PyBool>() {
+        return Ok(Value::Bool(b.is_true()));
+    }
+    if let Ok(s) = obj.cast::<PyString>() {
+        return Ok(Value::String(s.to_str()?.to_owned()));
+    }
+    if let Ok(i) = obj.cast::<PyInt>() {
+        if let Ok(v) = i.extract::<i64>() {
+            return Ok(Value::from(v));
+        }
+        return Ok(Value::from(i.extract::<u64>()?));
+    }
+    if let Ok(f) = obj.cast::<PyFloat>() {
+        return Number::from_f64(f.value())
+            .map(Value::Number)
+            .ok_or_else(|| PyValueError::new_err("non-finite float is not valid JSON"));
+    }
+    if let Ok(d) = obj.cast::<PyDict>() {
+        let mut map = Map::new();
+        for (k, v) in d.iter() {
+            let key = k
+                .cast::<PyString>()
+                .map_err(|_| PyValueError::new_err("JSON object keys must be str"))?;
+            map.insert(key.to_str()?.to_owned(), py_to_json_value(&v)?);
+        }
+        return Ok(Value::Object(map));
+    }
+    if let Ok(l) = obj.cast::<PyList>() {
+        return l
+            .iter()
+            .map(|x| py_to_json_value(&x))
+            .collect::<PyResult<_>>()
+            .map(Value::Array);
+    }
+    if let Ok(t) = obj.cast::<PyTuple>() {
+        return t
+            .iter()
+            .map(|x| py_to_json_value(&x))
+            .collect::<PyResult<_>>()
+            .map(Value::Array);
+    }
+    Err(PyValueError::new_err(format!(
+        "unsupported type for JSON payload: {}",
+        obj.get_type().name()?
+    )))
+}
+
+/// Helper: convert a serde_json value into the equivalent Python object.
+fn json_value_to_py(py: Python<'_>, value: &Value) -> PyResult<Py<PyAny>> {
+    Ok(match value {
+        Value::Null => py.None(),
+        Value::Bool(b) => PyBool::new(py, *b).to_owned().into_any().unbind(),
+        Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                i.into_pyobject(py)?.into_any().unbind()
+            } else if let Some(u) = n.as_u64() {
+                u.into_pyobject(py)?.into_any().unbind()
+            } else {
+                PyFloat::new(py, n.as_f64().unwrap_or(f64::NAN))
+                    .into_any()
+                    .unbind()
+            }
+        }
+        Value::String(s) => PyString::new(py, s).into_any().unbind(),
+        Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(json_value_to_py(py, item)?)?;
+            }
+            list.into_any().unbind()
+        }
+        Value::Object(map) => {
+            let dict = PyDict::new(py);
+            for (k, v) in map {
+                dict.set_item(k, json_value_to_py(py, v)?)?;
+            }
+            dict.into_any().unbind()
+        }
+    })
 }
 
 /// Python wrapper around the Rust CTag builder.
@@ -104,6 +192,23 @@ fn build_entity_json(input_json: &str) -> PyResult<String> {
     build_entity_from_normalized_json(input_json).map_err(|e| PyValueError::new_err(e.to_string()))
 }
 
+/// Python wrapper around the Rust entity builder (dict-in, dict-out).
+///
+/// Same validation and output as `build_entity_json`, without a JSON text
+/// round-trip on either side of the boundary. serde_json is built with
+/// `preserve_order`, so the returned dict keeps the record's field order
+/// (as `json.loads(build_entity_json(...))` would) rather than sorted keys.
+///
+/// Python signature:
+///   build_entity_dict(raw: dict[str, Any]) -> dict[str, Any]
+#[pyfunction]
+fn build_entity_dict(py: Python<'_>, raw: &Bound<'_, PyDict>) -> PyResult<Py<PyAny>> {
+    let input = py_to_json_value(raw.as_any())?;
+    let output = build_entity_from_normalized_value(input)
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    json_value_to_py(py, &output)
+}
+
 /// Python wrapper around the Rust exchange builder.
 ///
 /// Python signature:
@@ -126,11 +231,77 @@ fn build_relationship_json(input_json: &str) -> PyResult<String> {
 
 /// Apply localization rules to a name (runtime fast path).
 ///
+/// When localization leaves the name unchanged (already-normalized input),
+/// the caller's str object is returned as-is instead of a new copy.
+///
 /// Python signature:
 ///   apply_localization_name(name: str, jurisdiction: str) -> str
 #[pyfunction]
-fn apply_localization_name(name: &str, jurisdiction: &str) -> PyResult<String> {
-    core_apply_localization_name(name, jurisdiction).map_err(PyValueError::new_err)
+fn apply_localization_name<'py>(
+    name: &Bound<'py, PyString>,
+    jurisdiction: &str,
+) -> PyResult<Bound<'py, PyString>> {
+    let raw = name.to_str()?;
+    let localized =
+        core_apply_localization_name(raw, jurisdiction).map_err(PyValueError::new_err)?;
+    if localized == raw {
+        return Ok(name.clone());
+    }
+    Ok(PyString::new(name.py(), &localized))
+}
+
+/// Apply localization rules to many names for one jurisdiction.
+///
+/// One FFI crossing per batch, with the jurisdiction config resolved once.
+/// Output order matches input order. The GIL is released while the batch runs,
+/// and large batches are localized on all available cores.
+///
+/// Python signature:
+///   apply_localization_names(names: list[str], jurisdiction: str) -> list[str]
+#[pyfunction]
+fn apply_localization_names(
+    py: Python<'_>,
+    names: Vec<String>,
+    jurisdiction: &str,
+) -> PyResult<Vec<String>> {
+    py.detach(|| core_apply_localization_names(&names, jurisdiction))
+        .map_err(PyValueError::new_err)
+}
+
+/// Localize a legal name and compute the SNFEI of its identity projection.
+///
+/// One FFI call for the per-record work of the simple entity adapters:
+/// returns (legalNameNormalized, snfei), with the SNFEI hashed over the same
+/// canonical projection JSON the Python adapters use.
+///
+/// Python signature:
+///   localize_name_with_snfei(name: str, jurisdiction: str) -> tuple[str, str]
+#[pyfunction]
+fn localize_name_with_snfei(name: &str, jurisdiction: &str) -> PyResult<(String, String)> {
+    let localized =
+        core_apply_localization_name(name, jurisdiction).map_err(PyValueError::new_err)?;
+    let snfei = snfei_for_name_projection(&localized, jurisdiction);
+    Ok((localized, snfei))
+}
+
+/// Batch form of `localize_name_with_snfei`: one FFI crossing per batch.
+///
+/// Output order matches input order. The GIL is released while the batch
+/// runs, so batches on separate Python threads proceed in parallel.
+///
+/// Python signature:
+///   localize_names_with_snfei(pairs: list[tuple[str, str]]) -> list[tuple[str, str]]
+#[pyfunction]
+fn localize_names_with_snfei(
+    py: Python<'_>,
+    pairs: Vec<(String, String)>,
+) -> PyResult<Vec<(String, String)>> {
+    py.detach(|| {
+        pairs
+            .iter()
+            .map(|(name, jurisdiction)| localize_name_with_snfei(name, jurisdiction))
+            .collect()
+    })
 }
 
 /// Apply localization rules and return output + provenance as JSON.
@@ -147,21 +318,33 @@ fn apply_localization_name_detailed_json(name: &str, jurisdiction: &str) -> PyRe
 
 /// Apply localization rules and return output + provenance as a parsed Python object (dict).
 ///
-/// Thin wrapper around `apply_localization_name_detailed_json`:
-/// - calls core to get JSON
-/// - returns json.loads(JSON)
+/// Same shape as `apply_localization_name_detailed_json`, built directly as
+/// Python objects with interned keys (no serde value or JSON text round-trip).
 ///
 /// Python signature:
 ///   apply_localization_name_detailed(name: str, jurisdiction: str) -> dict[str, Any]
 #[pyfunction]
-fn apply_localization_name_detailed(
-    py: Python<'_>,
+fn apply_localization_name_detailed<'py>(
+    py: Python<'py>,
     name: &str,
     jurisdiction: &str,
-) -> PyResult<Py<PyAny>> {
-    let json_text = core_apply_localization_name_detailed_json(name, jurisdiction)
-        .map_err(PyValueError::new_err)?;
-    py_json_loads(py, &json_text)
+) -> PyResult<Bound<'py, PyDict>> {
+    let result =
+        core_apply_localization_name_detailed(name, jurisdiction).map_err(PyValueError::new_err)?;
+    let prov = result.provenance;
+
+    let provenance = PyDict::new(py);
+    provenance.set_item(intern!(py, "requested_key"), prov.requested_key)?;
+    provenance.set_item(intern!(py, "resolved_keys"), prov.resolved_keys)?;
+    provenance.set_item(
+        intern!(py, "resolved_config_hashes"),
+        prov.resolved_config_hashes,
+    )?;
+
+    let out = PyDict::new(py);
+    out.set_item(intern!(py, "output"), result.output)?;
+    out.set_item(intern!(py, "provenance"), provenance)?;
+    Ok(out)
 }
 
 /// Generate an SNFEI from raw attributes using the Rust core SNFEI pipeline.
@@ -180,15 +363,101 @@ fn generate_snfei(
     address: Option<&str>,
     registration_date: Option<&str>,
 ) -> PyResult<String> {
-    let result = generate_snfei_with_confidence(
+    Ok(generate_snfei_value(
         legal_name,
         country_code,
         address,
         registration_date,
-        None,
-        None,
-    );
-    Ok(result.snfei.value().to_string())
+    ))
+}
+
+/// Batch form of `generate_snfei`: one FFI crossing for many rows.
+///
+/// Each row is (legal_name, country_code, address, registration_date).
+/// Output order matches input order. The GIL is released while the batch
+/// runs, so batches on separate Python threads proceed in parallel.
+///
+/// Python signature:
+///   generate_snfei_batch(
+///       rows: list[tuple[str, str, str | None, str | None]],
+///   ) -> list[str]
+#[pyfunction]
+fn generate_snfei_batch(
+    py: Python<'_>,
+    rows: Vec<(String, String, Option<String>, Option<String>)>,
+) -> PyResult<Vec<String>> {
+    Ok(py.detach(|| {
+        core_generate_snfei_batch(rows.iter().map(
+            |(legal_name, country_code, address, registration_date)| {
+                (
+                    legal_name.as_str(),
+                    country_code.as_str(),
+                    address.as_deref(),
+                    registration_date.as_deref(),
+                )
+            },
+        ))
+    }))
+}
+
+/// Generate an SNFEI and return it with the normalized fields it was hashed from.
+///
+/// One FFI call for normalization + hash; no tiering and no JSON round-trip.
+///
+/// Python signature:
+///   generate_snfei_full(
+///       legal_name: str,
+///       country_code: str,
+///       address: str | None = None,
+///       registration_date: str | None = None,
+///   ) -> tuple[str, str, str | None, str, str | None]
+///
+/// The tuple is (snfei, legal_name_normalized, address_normalized,
+/// country_code, registration_date).
+#[pyfunction(signature = (legal_name, country_code, address=None, registration_date=None))]
+fn generate_snfei_full(
+    legal_name: &str,
+    country_code: &str,
+    address: Option<&str>,
+    registration_date: Option<&str>,
+) -> PyResult<(String, String, Option<String>, String, Option<String>)> {
+    let (snfei, canonical) =
+        core_generate_snfei_full(legal_name, country_code, address, registration_date);
+    Ok((
+        snfei.value,
+        canonical.legal_name_normalized,
+        canonical.address_normalized,
+        canonical.country_code,
+        canonical.registration_date,
+    ))
+}
+
+/// Hash already-normalized canonical fields into an SNFEI.
+///
+/// No normalization is applied: the inputs are taken as the `canonical` block
+/// of a previous pipeline run (e.g. from `generate_snfei_full`).
+///
+/// Python signature:
+///   compute_snfei(
+///       legal_name_normalized: str,
+///       country_code: str,
+///       address_normalized: str | None = None,
+///       registration_date: str | None = None,
+///   ) -> str
+#[pyfunction(signature = (legal_name_normalized, country_code, address_normalized=None, registration_date=None))]
+fn compute_snfei(
+    legal_name_normalized: String,
+    country_code: String,
+    address_normalized: Option<String>,
+    registration_date: Option<String>,
+) -> PyResult<String> {
+    let canonical = CanonicalInput {
+        legal_name_normalized,
+        address_normalized,
+        country_code,
+        registration_date,
+    };
+    Ok(core_compute_snfei(&canonical).value)
 }
 
 /// Generate an SNFEI and return full pipeline metadata as JSON.
@@ -235,9 +504,8 @@ fn generate_snfei_detailed_json(
 
 /// Generate an SNFEI and return full pipeline metadata as a parsed Python object (dict).
 ///
-/// Thin wrapper:
-/// - serializes `SnfeiResult` to JSON
-/// - returns json.loads(JSON)
+/// Same shape as `generate_snfei_detailed_json`, converted straight from the
+/// serde value into Python objects (no JSON text round-trip).
 ///
 /// Python signature:
 ///   generate_snfei_detailed(
@@ -275,9 +543,9 @@ fn generate_snfei_detailed(
     );
 
     let py_result: PySnfeiResult = result.into();
-    let json_text =
-        serde_json::to_string(&py_result).map_err(|e| PyValueError::new_err(e.to_string()))?;
-    py_json_loads(py, &json_text)
+    let value =
+        serde_json::to_value(&py_result).map_err(|e| PyValueError::new_err(e.to_string()))?;
+    json_value_to_py(py, &value)
 }
 
 /// Normalize a legal name via the Rust Normalizing Functor.
@@ -315,14 +583,21 @@ fn normalize_registration_date(value: &str) -> PyResult<Option<String>> {
 fn cep_py(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(build_ctag_json, m)?)?;
     m.add_function(wrap_pyfunction!(build_entity_json, m)?)?;
+    m.add_function(wrap_pyfunction!(build_entity_dict, m)?)?;
     m.add_function(wrap_pyfunction!(build_exchange_json, m)?)?;
     m.add_function(wrap_pyfunction!(build_relationship_json, m)?)?;
 
     m.add_function(wrap_pyfunction!(apply_localization_name, m)?)?;
+    m.add_function(wrap_pyfunction!(apply_localization_names, m)?)?;
     m.add_function(wrap_pyfunction!(apply_localization_name_detailed_json, m)?)?;
     m.add_function(wrap_pyfunction!(apply_localization_name_detailed, m)?)?;
+    m.add_function(wrap_pyfunction!(localize_name_with_snfei, m)?)?;
+    m.add_function(wrap_pyfunction!(localize_names_with_snfei, m)?)?;
 
     m.add_function(wrap_pyfunction!(generate_snfei, m)?)?;
+    m.add_function(wrap_pyfunction!(generate_snfei_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(generate_snfei_full, m)?)?;
+    m.add_function(wrap_pyfunction!(compute_snfei, m)?)?;
     m.add_function(wrap_pyfunction!(generate_snfei_detailed_json, m)?)?;
     m.add_function(wrap_pyfunction!(generate_snfei_detailed, m)?)?;
 
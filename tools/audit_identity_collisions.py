@@ -16,9 +16,11 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+from collections import defaultdict
 import csv
 from dataclasses import dataclass
 import hashlib
+from itertools import islice
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -28,8 +30,14 @@ try:
 except Exception:  # pragma: no cover
     pd = None  # type: ignore[assignment]
 
+try:
+    # Optional accelerator for sorted-key JSON output and trace hashing.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
 
 # ---------------------------------------------------------------------------
@@ -40,11 +48,11 @@ if TYPE_CHECKING:
 def _import_localization() -> tuple[Any, Any]:
     """Return localization callables from the Rust-backed Python API."""
     from civic_interconnect.cep.snfei.localization import (
-        apply_localization_name,
-        apply_localization_name_detailed_json,
+        apply_localization_name_detailed,
+        apply_localization_names,
     )
 
-    return apply_localization_name, apply_localization_name_detailed_json
+    return apply_localization_names, apply_localization_name_detailed
 
 
 # ---------------------------------------------------------------------------
@@ -52,7 +60,7 @@ def _import_localization() -> tuple[Any, Any]:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NameResult:
     """Name normalization result with optional provenance trace."""
 
@@ -82,17 +90,79 @@ def _write_json(path: Path, obj: Any) -> None:
         json.dump(obj, f, indent=2, sort_keys=True)
 
 
-def _write_jsonl(path: Path, rows: Iterable[dict[str, Any]]) -> None:
-    _ensure_parent(path)
-    with path.open("w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, sort_keys=True))
-            f.write("\n")
+def _canonical_json(text: str) -> bytes:
+    """JSON string literal for `text`, as json.dumps writes it.
+
+    Only strings reach this (the trace text), and for a str orjson matches
+    json.dumps except that it writes non-ASCII and DEL (0x7f) raw and rejects
+    lone surrogates; those cases fall back to stdlib. Not valid for numbers, where
+    the two libraries format floats, NaN and big ints differently.
+    """
+    if orjson is not None:
+        try:
+            blob = orjson.dumps(text)
+        except TypeError:
+            pass
+        else:
+            if blob.isascii() and b"\x7f" not in blob:
+                return blob
+    return json.dumps(text).encode("ascii")
+
 
+def _sha256_json(text: str) -> str:
+    return hashlib.sha256(_canonical_json(text)).hexdigest()
 
-def _sha256_json(obj: Any) -> str:
-    blob = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(blob).hexdigest()
+
+def _trace_text(trace: dict[str, Any]) -> str:
+    """Return the detailed trace as the compact JSON text Rust emits for it.
+
+    trace_sha256 has always been the digest of that text (as a JSON string),
+    see apply_localization_name_detailed_json. The detailed dict keeps the
+    Rust field order and holds only strings, so dumping it unsorted and
+    without ASCII escaping reproduces the text exactly.
+    """
+    return json.dumps(trace, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_escape(text: str) -> bytes:
+    """Body of json.dumps(text) without the quotes; escaping is per character."""
+    return json.dumps(text)[1:-1].encode("ascii")
+
+
+class _TraceHasher:
+    """trace_sha256 for a detailed localization trace dict, escaping provenance once.
+
+    A trace is {"output": str, "provenance": {...}}, and every name in a run
+    resolves the same jurisdiction chain, so only the output differs between
+    traces. The digest is sha256(json.dumps(_trace_text(trace))); JSON string
+    escaping is per character, so the escaped provenance suffix is reused
+    while the provenance is unchanged.
+    """
+
+    __slots__ = ("_provenance", "_suffix")
+
+    def __init__(self) -> None:
+        self._provenance: Any = None
+        self._suffix = b""
+
+    def __call__(self, trace: dict[str, Any]) -> str:
+        output = trace.get("output")
+        provenance = trace.get("provenance")
+        if (
+            list(trace) != ["output", "provenance"]
+            or not isinstance(output, str)
+            or not isinstance(provenance, dict)
+        ):
+            return _sha256_json(_trace_text(trace))
+
+        # Compared as items so a reordered provenance (different text) is re-escaped.
+        items = list(provenance.items())
+        if not self._suffix or items != self._provenance:
+            self._provenance = items
+            self._suffix = _json_escape(',"provenance":' + _trace_text(provenance) + "}") + b'"'
+
+        head = _json_escape('{"output":' + json.dumps(output, ensure_ascii=False))
+        return hashlib.sha256(b'"' + head + self._suffix).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -100,22 +170,42 @@ def _sha256_json(obj: Any) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _load_names_from_csv(path: Path, name_column: str, limit: int | None) -> list[str]:
-    if pd is None:
-        raise RuntimeError("pandas is required to read CSV inputs")
+# Rows per pandas chunk when reading a CSV input; a --limit stops the read
+# after the chunk that reaches it.
+_CSV_CHUNK_ROWS = 50_000
 
-    df = pd.read_csv(path, dtype=str)
-    if name_column not in df.columns:
-        raise KeyError(f"Column not found: {name_column}")
 
-    series = df[name_column].dropna().astype(str)
-    if limit is not None:
-        series = series.head(limit)
+def _read_name_values(source: str | Path, name_column: str, limit: int | None) -> list[str]:
+    """Read the non-null values of one CSV column, as strings, in file order.
 
+    Only `name_column` is parsed (the other columns are skipped by the
+    parser), and with a limit the read stops once enough values are in.
+    """
+    reader = pd.read_csv(
+        source,
+        dtype=str,
+        usecols=lambda column: column == name_column,
+        chunksize=_CSV_CHUNK_ROWS,
+    )
+
+    values: list[str] = []
+    with reader:
+        for chunk in reader:
+            if name_column not in chunk.columns:
+                raise KeyError(f"Column not found: {name_column}")
+            values.extend(chunk[name_column].dropna().astype(str).tolist())
+            if limit is not None and len(values) >= limit:
+                break
+
+    return values if limit is None else values[:limit]
+
+
+def _unique_names(values: Iterable[str]) -> list[str]:
+    """Strip values and drop empty or repeated ones, keeping first-seen order."""
     seen: set[str] = set()
     out: list[str] = []
 
-    for value in series.tolist():
+    for value in values:
         v = value.strip()
         if v and v not in seen:
             seen.add(v)
@@ -124,6 +214,53 @@ def _load_names_from_csv(path: Path, name_column: str, limit: int | None) -> lis
     return out
 
 
+# Cell values pandas reads as missing by default; the stdlib file reader skips
+# the same ones so both input paths load the same names.
+_CSV_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
+def _iter_csv_column(path: Path, name_column: str) -> Iterator[str]:
+    """Yield the non-missing values of one column of a local CSV file."""
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None or name_column not in header:
+            raise KeyError(f"Column not found: {name_column}")
+        idx = header.index(name_column)
+
+        for row in reader:
+            if idx < len(row) and (value := row[idx]) not in _CSV_NA_VALUES:
+                yield value
+
+
+def _load_names_from_csv(path: Path, name_column: str, limit: int | None) -> list[str]:
+    # Local files stream through the stdlib csv reader; pandas is only needed
+    # for URL inputs.
+    return _unique_names(islice(_iter_csv_column(path, name_column), limit))
+
+
 def _load_names(
     input_path: str | None,
     input_url: str | None,
@@ -139,24 +276,7 @@ def _load_names(
     if pd is None:
         raise RuntimeError("pandas is required to read URL inputs")
 
-    df = pd.read_csv(str(input_url), dtype=str)  # type: ignore[arg-type]
-    if name_column not in df.columns:
-        raise KeyError(f"Column not found: {name_column}")
-
-    series = df[name_column].dropna().astype(str)
-    if limit is not None:
-        series = series.head(limit)
-
-    seen: set[str] = set()
-    out: list[str] = []
-
-    for value in series.tolist():
-        v = value.strip()
-        if v and v not in seen:
-            seen.add(v)
-            out.append(v)
-
-    return out
+    return _unique_names(_read_name_values(str(input_url), name_column, limit))
 
 
 # ---------------------------------------------------------------------------
@@ -164,49 +284,72 @@ def _load_names(
 # ---------------------------------------------------------------------------
 
 
-def _normalize_names(
-    raws: Sequence[str],
+# Distinct raw names localized per batch; results are streamed out per batch,
+# so peak memory for NameResults (and traces) is bounded by this size.
+_NORMALIZE_BATCH = 10_000
+
+
+def _iter_normalized(
+    raws: Iterable[str],
     jurisdiction_iso: str,
     include_traces: bool,
     allow_missing_ffi: bool,
-) -> list[NameResult]:
-    apply_name, apply_detailed_json = _import_localization()
-
-    results: list[NameResult] = []
-    missing_error: Exception | None = None
-
-    for raw in raws:
-        try:
-            normalized = apply_name(raw, jurisdiction_iso)
-            trace_json = None
-            trace_sha = None
-
-            if include_traces:
-                trace_json = apply_detailed_json(raw, jurisdiction_iso)
-                trace_sha = _sha256_json(trace_json)
-
-            results.append(
-                NameResult(
+) -> Iterator[NameResult]:
+    """Yield one NameResult per raw, in input order, a batch at a time."""
+    apply_names, apply_detailed = _import_localization()
+    hash_trace = _TraceHasher()
+
+    it = iter(raws)
+    while batch := list(islice(it, _NORMALIZE_BATCH)):
+        if not include_traces:
+            # One batched FFI crossing per batch.
+            try:
+                normalized_all = apply_names(batch, jurisdiction_iso)
+            except AttributeError:
+                if not allow_missing_ffi:
+                    raise
+                normalized_all = batch
+            for raw, normalized in zip(batch, normalized_all, strict=True):
+                yield NameResult(raw, normalized, None, None)
+            continue
+
+        # Inputs repeat raw names; each distinct raw in a batch is localized
+        # and traced once. The trace carries the localized output, so the
+        # detailed call is the only one made.
+        by_raw: dict[str, NameResult] = {}
+
+        for raw in dict.fromkeys(batch):
+            try:
+                trace_json = apply_detailed(raw, jurisdiction_iso)
+                by_raw[raw] = NameResult(
                     raw=raw,
-                    normalized=normalized,
+                    normalized=trace_json["output"],
                     trace_json=trace_json,
-                    trace_sha256=trace_sha,
+                    trace_sha256=hash_trace(trace_json),
                 )
-            )
-        except AttributeError as exc:
-            missing_error = exc
-            if allow_missing_ffi:
-                results.append(NameResult(raw, raw, None, None))
-            else:
-                break
+            except AttributeError:
+                if not allow_missing_ffi:
+                    raise
+                by_raw[raw] = NameResult(raw, raw, None, None)
 
-    if missing_error and not allow_missing_ffi:
-        raise missing_error
+        for raw in batch:
+            yield by_raw[raw]
 
-    return results
 
+def _record_mapping(
+    results: Iterable[NameResult],
+    mapping: dict[str, str],
+    trace_sha256_by_raw: dict[str, str],
+) -> Iterator[NameResult]:
+    """Pass results through, recording raw -> normalized and trace digests."""
+    for r in results:
+        mapping[r.raw] = r.normalized
+        if r.trace_sha256 is not None:
+            trace_sha256_by_raw[r.raw] = r.trace_sha256
+        yield r
 
-def _group_collisions(results: Sequence[NameResult]) -> dict[str, list[str]]:
+
+def _group_collisions(results: Iterable[NameResult]) -> dict[str, list[str]]:
     groups: dict[str, list[str]] = {}
     for r in results:
         groups.setdefault(r.normalized, []).append(r.raw)
@@ -214,13 +357,6 @@ def _group_collisions(results: Sequence[NameResult]) -> dict[str, list[str]]:
     return {k: v for k, v in groups.items() if len(v) > 1}
 
 
-def _invert_mapping(mapping: dict[str, str]) -> dict[str, set[str]]:
-    clusters: dict[str, set[str]] = {}
-    for raw, norm in mapping.items():
-        clusters.setdefault(norm, set()).add(raw)
-    return clusters
-
-
 def _diff_vs_baseline(
     current_map: dict[str, str],
     baseline_map: dict[str, str],
@@ -252,30 +388,47 @@ def _detect_merges_splits(
     current_map: dict[str, str],
     baseline_map: dict[str, str],
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    cur_clusters = _invert_mapping(current_map)
-    base_clusters = _invert_mapping(baseline_map)
+    # One pass over the current mapping builds the current clusters and, per
+    # cluster, the baseline norms its raws had (and vice versa).
+    cur_clusters: defaultdict[str, set[str]] = defaultdict(set)
+    base_norms_by_cur: defaultdict[str, set[str]] = defaultdict(set)
+    cur_norms_by_base: defaultdict[str, set[str]] = defaultdict(set)
+
+    for raw, cur_norm in current_map.items():
+        cur_clusters[cur_norm].add(raw)
+        base_norm = baseline_map.get(raw)
+        if base_norm is not None:
+            base_norms_by_cur[cur_norm].add(base_norm)
+            cur_norms_by_base[base_norm].add(cur_norm)
 
     merges: list[dict[str, Any]] = []
-    splits: list[dict[str, Any]] = []
-
     for cur_norm, raws in cur_clusters.items():
-        base_norms = sorted({b for r in raws if (b := baseline_map.get(r)) is not None})
-        if len(base_norms) > 1:
+        base_norms = base_norms_by_cur.get(cur_norm)
+        if base_norms is not None and len(base_norms) > 1:
             merges.append(
                 {
                     "current_normalized": cur_norm,
-                    "baseline_normalized_set": base_norms,
+                    "baseline_normalized_set": sorted(base_norms),
                     "raws": sorted(raws),
                 }
             )
 
-    for base_norm, raws in base_clusters.items():
-        cur_norms = sorted({c for r in raws if (c := current_map.get(r)) is not None})
-        if len(cur_norms) > 1:
+    # Baseline clusters are only materialized for the norms that split.
+    split_raws: dict[str, set[str]] = {
+        base_norm: set() for base_norm, cur_norms in cur_norms_by_base.items() if len(cur_norms) > 1
+    }
+    splits: list[dict[str, Any]] = []
+    if split_raws:
+        base_clusters: dict[str, set[str]] = {}
+        for raw, base_norm in baseline_map.items():
+            members = split_raws.get(base_norm)
+            if members is not None:
+                base_clusters.setdefault(base_norm, members).add(raw)
+        for base_norm, raws in base_clusters.items():
             splits.append(
                 {
                     "baseline_normalized": base_norm,
-                    "current_normalized_set": cur_norms,
+                    "current_normalized_set": sorted(cur_norms_by_base[base_norm]),
                     "raws": sorted(raws),
                 }
             )
@@ -314,9 +467,9 @@ def _write_collisions_csv(path: Path, collisions: dict[str, list[str]]) -> None:
         writer = csv.writer(f)
         writer.writerow(["normalized", "count", "raw_variants_joined"])
 
-        for norm in sorted(collisions):
-            raws = collisions[norm]
-            writer.writerow([norm, str(len(raws)), " || ".join(raws)])
+        writer.writerows(
+            (norm, str(len(raws)), " || ".join(raws)) for norm, raws in sorted(collisions.items())
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -365,15 +518,17 @@ def main(argv: Sequence[str] | None = None) -> int:  # noqa: C901
         args.limit,
     )
 
-    results = _normalize_names(
+    # Results stream straight into the collision groups; only the mapping and
+    # trace digests are kept, not the NameResults themselves.
+    current_map: dict[str, str] = {}
+    trace_sha256_by_raw: dict[str, str] = {}
+    results = _iter_normalized(
         raws,
         args.jurisdiction_iso,
         include_traces=args.include_traces,
         allow_missing_ffi=args.allow_missing_ffi,
     )
-
-    current_map = {r.raw: r.normalized for r in results}
-    collisions = _group_collisions(results)
+    collisions = _group_collisions(_record_mapping(results, current_map, trace_sha256_by_raw))
 
     summary = {
         "jurisdiction_iso": args.jurisdiction_iso,
@@ -393,9 +548,7 @@ def main(argv: Sequence[str] | None = None) -> int:  # noqa: C901
         {
             "jurisdiction_iso": args.jurisdiction_iso,
             "mapping": current_map,
-            "trace_sha256_by_raw": {
-                r.raw: r.trace_sha256 for r in results if r.trace_sha256 is not None
-            },
+            "trace_sha256_by_raw": trace_sha256_by_raw,
         },
     )
     _write_collisions_csv(out_dir / "collisions.csv", collisions)
@@ -7,6 +7,7 @@ Run with:
 uv run python tools/codegen_rust.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from civic_interconnect.cep.codegen.rust_generated import write_generated_rust
@@ -90,25 +91,42 @@ def main() -> None:
 
     print(f"[codegen-rust] Found {len(mapping)} schema(s) to process\n")
 
+    jobs = [
+        (schema_path, schema_name_to_record_name(schema_path), output_path)
+        for schema_path, output_path in sorted(mapping.items())
+    ]
+
+    def run(job: tuple[Path, str, Path]) -> bool | Exception:
+        try:
+            return write_generated_rust(*job)
+        except Exception as e:
+            return e
+
+    # Schemas are independent; overlap their reads and writes. Results are
+    # reported in schema order.
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+        outcomes = list(executor.map(run, jobs))
+
     generated = 0
+    unchanged = 0
     skipped = 0
 
-    for schema_path, output_path in sorted(mapping.items()):
-        record_name = schema_name_to_record_name(schema_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
+    for (schema_path, record_name, output_path), outcome in zip(jobs, outcomes, strict=True):
         print(f"  {schema_path.relative_to(BASE)}")
         print(f"    -> {output_path.relative_to(BASE)} ({record_name})")
 
-        try:
-            write_generated_rust(schema_path, record_name, output_path)
-            generated += 1
-        except Exception as e:
-            print(f"    ERROR: {e}")
+        if isinstance(outcome, Exception):
+            print(f"    ERROR: {outcome}")
             skipped += 1
-            continue
+        elif outcome:
+            generated += 1
+        else:
+            unchanged += 1
 
-    print(f"\n[codegen-rust] Done! Generated {generated} file(s), skipped {skipped}")
+    print(
+        f"\n[codegen-rust] Done! Generated {generated} file(s), "
+        f"unchanged {unchanged}, skipped {skipped}"
+    )
 
 
 if __name__ == "__main__":
@@ -7,6 +7,11 @@ and write it into the repo as a CI-safe fixture.
 Default behavior:
 - Download a year-sized .jsonl.gz (default: 2022) into out/cache/.
 - Stream-decompress and select a deterministic sample of releases by hashing ocid.
+- Record each scanned line's ocid bucket next to the cached .gz, so later runs
+  with other sampling parameters read only candidate lines.
+- With --stage, decompress the .gz once to a .jsonl in the cache and mmap it,
+  so repeat runs skip gunzip entirely.
+- Decompress through pigz when it is on PATH.
 - Write JSONL sample to: src/python/tests/data/procurement/it_anac/ocds_sample.jsonl
 - Write metadata to:      src/python/tests/data/procurement/it_anac/ocds_sample.meta.json
 
@@ -35,18 +40,41 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+from array import array
+import codecs
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
 import datetime as dt
+from functools import partial
 import gzip
 import hashlib
+import io
+from itertools import islice
 import json
+import mmap
 from pathlib import Path
+import re
+import shutil
+import subprocess
 import sys
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, Protocol
 from urllib.parse import urlparse
 import urllib.request
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
+
+_loads: Callable[[bytes], Any]
+
+try:
+    # Optional accelerator: orjson parses bytes lines directly and is much faster.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _loads = json.loads
 
 DEFAULT_URL = "https://data.open-contracting.org/en/publication/117/download?name=2022.jsonl.gz"
 
@@ -54,7 +82,7 @@ DEFAULT_URL = "https://data.open-contracting.org/en/publication/117/download?nam
 class HashLike(Protocol):
     """Update Hash-like object protocol."""
 
-    def update(self, __data: bytes, /) -> None: ...  # noqa: D102
+    def update(self, __data: bytes | memoryview, /) -> None: ...  # noqa: D102
 
 
 def _repo_root() -> Path:
@@ -65,7 +93,7 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
-def _sha256_update(h: HashLike, b: bytes) -> None:
+def _sha256_update(h: HashLike, b: bytes | memoryview) -> None:
     h.update(b)
 
 
@@ -85,22 +113,49 @@ def _validate_url_for_download(url: str) -> None:
         raise ValueError("URL must not contain embedded credentials.")
 
 
+def _digest_sidecar(dest: Path) -> Path:
+    return dest.with_name(dest.name + ".sha256")
+
+
+def _read_digest_sidecar(dest: Path) -> tuple[str, int] | None:
+    """Return the (sha256_hex, size) recorded for dest, if it still matches dest's size."""
+    try:
+        digest, size_text = _digest_sidecar(dest).read_text(encoding="utf-8").split()
+        size = int(size_text)
+    except (OSError, ValueError):
+        return None
+    if len(digest) != 64 or dest.stat().st_size != size:
+        return None
+    return (digest, size)
+
+
+def _write_digest_sidecar(dest: Path, digest: str, size: int) -> None:
+    _digest_sidecar(dest).write_text(f"{digest} {size}\n", encoding="utf-8")
+
+
+# Read size per download step; large reads keep the copy/hash loop in C.
+_DOWNLOAD_CHUNK = 8 * 1024 * 1024
+
+
 def _download_file(url: str, dest: Path, *, force: bool) -> tuple[str, int]:
-    """Download url -> dest (binary). Returns (sha256_hex, bytes_written)."""
+    """Download url -> dest (binary). Returns (sha256_hex, bytes_written).
+
+    The digest is recorded next to dest (dest + ".sha256") as it streams, so
+    a cached file is not re-read on later runs while its size still matches.
+    """
     _validate_url_for_download(url)
 
     if dest.exists() and not force:
-        # If it already exists, compute sha so metadata is correct.
-        h = hashlib.sha256()
-        n = 0
+        recorded = _read_digest_sidecar(dest)
+        if recorded is not None:
+            return recorded
+
+        # No usable sidecar: compute sha so metadata is correct.
         with dest.open("rb") as f:
-            while True:
-                chunk = f.read(1024 * 1024)
-                if not chunk:
-                    break
-                _sha256_update(h, chunk)
-                n += len(chunk)
-        return (h.hexdigest(), n)
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        n = dest.stat().st_size
+        _write_digest_sidecar(dest, digest, n)
+        return (digest, n)
 
     dest.parent.mkdir(parents=True, exist_ok=True)
 
@@ -120,56 +175,438 @@ def _download_file(url: str, dest: Path, *, force: bool) -> tuple[str, int]:
     # NOTE: urlopen is safe here because we validated scheme/netloc above in _validate_url_for_download.
     # The URL is guaranteed to be http/https only, with no credentials or custom schemes.
     # S310 is suppressed because _validate_url_for_download ensures only http/https schemes are allowed.
-    with urllib.request.urlopen(req, timeout=300) as resp, dest.open("wb") as out:  # noqa: S310
-        while True:
-            chunk = resp.read(1024 * 1024)
-            if not chunk:
-                break
+    # Stream into a .part file so an interrupted download is never mistaken
+    # for a cached one; chunks land in one reused buffer (no per-chunk bytes).
+    part = dest.with_name(dest.name + ".part")
+    buf = bytearray(_DOWNLOAD_CHUNK)
+    view = memoryview(buf)
+    with urllib.request.urlopen(req, timeout=300) as resp, part.open("wb") as out:  # noqa: S310
+        while size := resp.readinto(buf):
+            chunk = view[:size]
             out.write(chunk)
             _sha256_update(h, chunk)
-            n += len(chunk)
+            n += size
 
+    part.replace(dest)
+    _write_digest_sidecar(dest, h.hexdigest(), n)
     return (h.hexdigest(), n)
 
 
-def _hash_bucket_0_9999(s: str) -> int:
-    # Stable integer bucket for deterministic sampling.
-    h = hashlib.sha256(s.encode("utf-8")).hexdigest()
-    return int(h[:8], 16) % 10000
+# Empty SHA-256 state; copying it is cheaper than constructing a new hasher
+# for every ~30-byte ocid.
+_BASE_SHA256 = hashlib.sha256()
+
+
+def _hash_bucket_0_9999(data: bytes) -> int:
+    # Stable integer bucket for deterministic sampling: the first 32 bits of
+    # SHA-256 mod 10000 (the same value as int(hexdigest()[:8], 16) % 10000,
+    # without the hex round-trip).
+    h = _BASE_SHA256.copy()
+    h.update(data)
+    return int.from_bytes(h.digest()[:4], "big") % 10000
 
 
 def _select_release(obj: dict[str, Any], threshold_per_10000: int) -> bool:
     ocid = obj.get("ocid")
     if not isinstance(ocid, str) or not ocid.strip():
         return False
-    b = _hash_bucket_0_9999(ocid)
+    b = _hash_bucket_0_9999(ocid.encode("utf-8"))
     return b < threshold_per_10000
 
 
-def _iter_jsonl_gz(path: Path) -> Iterable[dict[str, Any]]:
-    """Yield decoded JSON objects from a .jsonl.gz file (one JSON object per line)."""
-    with gzip.open(path, "rt", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError:
-                # Skip malformed lines.
-                continue
-            if isinstance(obj, dict):
-                yield obj
+# "ocid" members whose value is a plain (escape-free) JSON string. The raw
+# bytes of such a value are exactly its UTF-8 encoding, as hashed above.
+_OCID_KEY = b'"ocid"'
+_OCID_RE = re.compile(rb'"ocid"\s*:\s*"([^"\\]*)"')
 
+# Bucket for lines that are not JSON objects (the largest value an index
+# entry holds); _parse_release would reject them at any threshold.
+_NOT_AN_OBJECT = 0xFFFF
 
-def _write_jsonl(path: Path, rows: Iterable[dict[str, Any]], *, force: bool) -> None:
-    if path.exists() and not force:
-        raise FileExistsError(f"Refusing to overwrite existing file: {path} (use --force-write)")
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for obj in rows:
-            f.write(json.dumps(obj, sort_keys=True))
-            f.write("\n")
+
+def _line_bucket(line: bytes) -> int:
+    """Lowest raw ocid bucket on a line; 0 when the line cannot be bucketed raw.
+
+    A release can only be sampled at threshold t if this is below t. Every
+    "ocid" member on the line (the top-level one among them) must have a plain
+    string value; lines with no ocid members or an escaped value get 0 so they
+    are always left to the full parse. Lines that cannot hold a JSON object
+    get _NOT_AN_OBJECT, above any practical threshold, and are never parsed.
+    """
+    # bytes.find locates each key in C and the pattern is only tried, anchored,
+    # where a key starts, so the line is scanned once rather than twice by
+    # findall and count.
+    pos = line.find(_OCID_KEY)
+    if pos < 0:
+        # Blank lines and trash would only fail in the parser; an object may
+        # still spell its key with escapes, so those are parsed.
+        if not line.lstrip().startswith((b"{", codecs.BOM_UTF8)):
+            return _NOT_AN_OBJECT
+        return 0
+    lowest = 10000
+    while pos >= 0:
+        m = _OCID_RE.match(line, pos)
+        if m is None:
+            return 0
+        lowest = min(lowest, _hash_bucket_0_9999(m.group(1)))
+        pos = line.find(_OCID_KEY, pos + len(_OCID_KEY))
+    return lowest
+
+
+def _parse_release(line: bytes) -> dict[str, Any] | None:
+    """Decode one JSONL line; None for blank, malformed or non-object lines."""
+    # Both parsers decode UTF-8 bytes themselves and ignore surrounding
+    # whitespace; orjson's error subclasses json.JSONDecodeError.
+    try:
+        obj = _loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _fixture_line(obj: dict[str, Any]) -> bytes:
+    """Serialize a sampled release the way the committed fixture stores it."""
+    return json.dumps(obj, sort_keys=True).encode("utf-8") + b"\n"
+
+
+class _ScannedChunk(NamedTuple):
+    """Scan result for one chunk of lines: its bucket index entries and survivors."""
+
+    lengths: array[int]
+    buckets: array[int]
+    selected: list[tuple[int, bytes]]
+
+
+def _sample_lines(lines: list[bytes], threshold_per_10000: int) -> _ScannedChunk:
+    """Bucket a chunk of lines and pick (offset, fixture line) for sampled releases.
+
+    Survivors are serialized here, so pool workers hand back bytes rather than
+    pickled release dicts and the writer only copies them out.
+    """
+    buckets = array("H", map(_line_bucket, lines))
+    selected: list[tuple[int, bytes]] = []
+    for offset, bucket in enumerate(buckets):
+        # Nearly every release is rejected by its raw ocid bucket; parse only
+        # the candidates.
+        if bucket >= threshold_per_10000:
+            continue
+        obj = _parse_release(lines[offset])
+        if obj is not None and _select_release(obj, threshold_per_10000):
+            selected.append((offset, _fixture_line(obj)))
+    return _ScannedChunk(array("Q", map(len, lines)), buckets, selected)
+
+
+# Lines per scan chunk (roughly 1-4 MB of OCDS releases).
+_SCAN_CHUNK_LINES = 2000
+
+
+def _iter_sampled_chunks(
+    lines: Iterable[bytes],
+    threshold_per_10000: int,
+    *,
+    workers: int = 1,
+) -> Iterator[_ScannedChunk]:
+    """Yield _sample_lines results per chunk, in file order.
+
+    With workers > 1, chunks are filtered and parsed in a process pool while
+    this thread keeps decompressing; at most 2 * workers chunks are in flight.
+    """
+    it = iter(lines)
+    chunks = iter(lambda: list(islice(it, _SCAN_CHUNK_LINES)), [])
+    worker = partial(_sample_lines, threshold_per_10000=threshold_per_10000)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield worker(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[_ScannedChunk]] = deque(
+            executor.submit(worker, chunk) for chunk in islice(chunks, 2 * workers)
+        )
+        while pending:
+            future = pending.popleft()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(executor.submit(worker, next_chunk))
+            yield future.result()
+
+
+class _BucketIndex:
+    """Line lengths and raw ocid buckets for a scanned prefix of the download.
+
+    Saved next to the cached .gz and keyed on its sha256, so a later run with a
+    different --threshold-per-10000 or --max-items reads only the candidate
+    lines of that prefix instead of filtering every line again.
+    """
+
+    def __init__(self) -> None:
+        self.lengths = array("Q")
+        self.buckets = array("H")
+        # True once the prefix reaches the end of the file.
+        self.complete = False
+
+    @property
+    def state(self) -> tuple[int, bool]:
+        return (len(self.buckets), self.complete)
+
+    def add(self, chunk: _ScannedChunk) -> None:
+        self.lengths.extend(chunk.lengths)
+        self.buckets.extend(chunk.buckets)
+
+    @classmethod
+    def load(cls, path: Path, gz_sha256: str) -> _BucketIndex:
+        """Return the index saved for this download, or an empty one."""
+        index = cls()
+        try:
+            with path.open("rb") as f:
+                digest, n_text, complete = f.readline().split()
+                if digest.decode("ascii") != gz_sha256:
+                    return index
+                n = int(n_text)
+                lengths, buckets = array("Q"), array("H")
+                lengths.fromfile(f, n)
+                buckets.fromfile(f, n)
+        except (OSError, ValueError, EOFError):
+            return index
+        index.lengths, index.buckets, index.complete = lengths, buckets, complete == b"1"
+        return index
+
+    def save(self, path: Path, gz_sha256: str) -> None:
+        part = path.with_name(path.name + ".part")
+        with part.open("wb") as f:
+            f.write(f"{gz_sha256} {len(self.buckets)} {int(self.complete)}\n".encode("ascii"))
+            self.lengths.tofile(f)
+            self.buckets.tofile(f)
+        part.replace(path)
+
+
+def _bucket_index_path(gz_path: Path) -> Path:
+    return gz_path.with_name(gz_path.name + ".buckets")
+
+
+# Read buffer over the decompressed stream. GzipFile inflates in 8 KiB steps
+# behind a default-sized buffer; a larger one cuts per-line call overhead on
+# year-sized files.
+_GZ_READ_BUFFER = 1 << 20
+
+
+class _LineSource(Protocol):
+    """Byte-offset access to the decompressed JSONL stream."""
+
+    def read_at(self, offset: int, length: int) -> bytes: ...  # noqa: D102
+
+    def lines_from(self, offset: int) -> Iterable[bytes]: ...  # noqa: D102
+
+
+def _pigz() -> str | None:
+    # pigz inflates in its own process (with separate read, write and check
+    # threads), taking decompression off the scanning thread.
+    return shutil.which("pigz")
+
+
+class _GzipLines:
+    """Forward-only access to a .gz file; skipped bytes are inflated and discarded.
+
+    Reads from a pigz -dc subprocess when pigz is on PATH, else from gzip.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._gz: gzip.GzipFile | None = None
+        self._f: io.BufferedReader[Any]
+        pigz = _pigz()
+        if pigz is not None:
+            self._proc = subprocess.Popen(  # noqa: S603
+                [pigz, "-dc", str(path)], stdout=subprocess.PIPE, bufsize=0
+            )
+            # bufsize=0 hands back the raw pipe; buffer it here like the gzip path.
+            assert isinstance(self._proc.stdout, io.FileIO)
+            self._f = io.BufferedReader(self._proc.stdout, buffer_size=_GZ_READ_BUFFER)
+        else:
+            self._gz = gzip.GzipFile(path, "rb")
+            self._f = io.BufferedReader(self._gz, buffer_size=_GZ_READ_BUFFER)
+        self._pos = 0
+        self._eof = False
+        self._view = memoryview(bytearray(_GZ_READ_BUFFER))
+
+    def close(self) -> None:
+        proc = self._proc
+        # Only a reader that stopped short of EOF may kill pigz. poll() alone can't
+        # tell: pigz closes stdout before it exits, so it may still be running
+        # after the last line was read, and its exit status must still be checked.
+        killed = False
+        if proc is not None and not self._eof and proc.poll() is None:
+            proc.kill()
+            killed = True
+        self._f.close()
+        if self._gz is not None:
+            self._gz.close()
+        if proc is not None:
+            code = proc.wait()
+            if code and not killed:
+                raise RuntimeError(f"pigz -dc exited with status {code}")
+
+    def _seek(self, offset: int) -> None:
+        n = offset - self._pos
+        if n < 0:
+            raise ValueError("gzip stream cannot seek backwards")
+        while n > 0:
+            size = self._f.readinto(self._view[: min(n, len(self._view))])
+            if not size:
+                raise EOFError("cached download is shorter than its bucket index")
+            n -= size
+        self._pos = offset
+
+    def read_at(self, offset: int, length: int) -> bytes:
+        self._seek(offset)
+        data = self._f.read(length)
+        self._pos += len(data)
+        if len(data) < length:
+            self._eof = True
+        return data
+
+    def lines_from(self, offset: int) -> Iterable[bytes]:
+        self._seek(offset)
+        yield from self._f
+        self._eof = True
+
+
+class _MappedLines:
+    """Random access to a staged (decompressed) .jsonl through a read-only mmap."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def read_at(self, offset: int, length: int) -> bytes:
+        return self._mm[offset : offset + length]
+
+    def lines_from(self, offset: int) -> Iterable[bytes]:
+        mm = self._mm
+        size = len(mm)
+        while offset < size:
+            end = mm.find(b"\n", offset)
+            end = size if end < 0 else end + 1
+            yield mm[offset:end]
+            offset = end
+
+
+def _staged_path(gz_path: Path) -> Path:
+    # anac_ocds_<hash>.jsonl.gz -> anac_ocds_<hash>.jsonl
+    return gz_path.with_suffix("")
+
+
+def _ensure_decompressed(gz_path: Path, gz_sha256: str) -> Path:
+    """Decompress gz_path once next to itself and return the .jsonl path.
+
+    The staged copy is tagged with the source digest (+ ".source"), so it is
+    rebuilt when the cached download changes.
+    """
+    staged = _staged_path(gz_path)
+    tag = staged.with_name(staged.name + ".source")
+    try:
+        digest, size_text = tag.read_text(encoding="utf-8").split()
+        if digest == gz_sha256 and staged.stat().st_size == int(size_text):
+            return staged
+    except (OSError, ValueError):
+        pass
+
+    part = staged.with_name(staged.name + ".part")
+    pigz = _pigz()
+    with part.open("wb") as out:
+        if pigz is not None:
+            subprocess.run([pigz, "-dc", str(gz_path)], stdout=out, check=True)  # noqa: S603
+        else:
+            with gzip.open(gz_path, "rb") as gz:
+                shutil.copyfileobj(gz, out, _GZ_READ_BUFFER)
+    part.replace(staged)
+    tag.write_text(f"{gz_sha256} {staged.stat().st_size}\n", encoding="utf-8")
+    return staged
+
+
+# Output buffer for the sample file.
+_WRITE_BUFFER = 1 << 20
+
+
+class _JsonlWriter:
+    """Write JSONL lines to a .part file and move it over the target on success.
+
+    The target is only replaced when the with-block exits cleanly, so a failed
+    or interrupted scan leaves any existing fixture untouched.
+    """
+
+    def __init__(self, path: Path, *, force: bool) -> None:
+        if path.exists() and not force:
+            raise FileExistsError(
+                f"Refusing to overwrite existing file: {path} (use --force-write)"
+            )
+        self.path = path
+        self.part = path.with_name(path.name + ".part")
+        self.written = 0
+        self._f: BinaryIO | None = None
+
+    def __enter__(self) -> _JsonlWriter:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Lines are already encoded; a large buffer turns the per-line write
+        # calls into one OS write per megabyte.
+        self._f = self.part.open("wb", buffering=_WRITE_BUFFER)
+        return self
+
+    def write(self, line: bytes) -> None:
+        assert self._f is not None
+        self._f.write(line)
+        self.written += 1
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        assert self._f is not None
+        self._f.close()
+        self._f = None
+        if exc_type is None:
+            self.part.replace(self.path)
+        else:
+            self.part.unlink(missing_ok=True)
+
+
+def _collect_sample(
+    source: _LineSource,
+    index: _BucketIndex,
+    threshold_per_10000: int,
+    max_items: int,
+    out: _JsonlWriter,
+    *,
+    workers: int = 1,
+) -> int:
+    """Write fixture lines in file order until max_items; return lines scanned.
+
+    Lines covered by the bucket index are read only when their bucket is below
+    the threshold; the rest of the file is then scanned and added to the index.
+    """
+    offset = 0
+    for i, (length, bucket) in enumerate(zip(index.lengths, index.buckets, strict=True)):
+        if bucket < threshold_per_10000:
+            obj = _parse_release(source.read_at(offset, length))
+            if obj is not None and _select_release(obj, threshold_per_10000):
+                out.write(_fixture_line(obj))
+                if out.written >= max_items:
+                    return i + 1
+        offset += length
+    if index.complete:
+        return len(index.buckets)
+
+    lines = source.lines_from(offset)
+    for chunk in _iter_sampled_chunks(lines, threshold_per_10000, workers=workers):
+        scanned = len(index.buckets)
+        index.add(chunk)
+        for line_offset, line in chunk.selected:
+            out.write(line)
+            if out.written >= max_items:
+                return scanned + line_offset + 1
+    index.complete = True
+    return len(index.buckets)
 
 
 def _write_json(path: Path, obj: Any, *, force: bool) -> None:
@@ -231,6 +668,17 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=25,
         help="Sampling rate: include release if hash(ocid) mod 10000 < threshold. 25 ~= 0.25%.",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes that filter and parse lines while the archive is decompressed.",
+    )
+    p.add_argument(
+        "--stage",
+        action="store_true",
+        help="Decompress the cached .gz once to a .jsonl beside it and scan that on later runs.",
+    )
     p.add_argument(
         "--force-download", action="store_true", help="Redownload even if cached file exists."
     )
@@ -258,38 +706,52 @@ def main(argv: list[str] | None = None) -> int:
         print(f"ERROR: download failed: {e}", file=sys.stderr)
         return 1
 
-    picked: list[dict[str, Any]] = []
-    scanned = 0
+    out_sample = root / Path(args.out_sample)
+    out_meta = root / Path(args.out_meta)
 
     try:
-        for obj in _iter_jsonl_gz(gz_path):
-            scanned += 1
-
-            if not _select_release(obj, int(args.threshold_per_10000)):
-                continue
+        writer = _JsonlWriter(out_sample, force=bool(args.force_write))
+    except Exception as e:
+        print(f"ERROR: failed to write outputs: {e}", file=sys.stderr)
+        return 1
 
-            picked.append(obj)
-            if len(picked) >= int(args.max_items):
-                break
+    index_path = _bucket_index_path(gz_path)
+    index = _BucketIndex.load(index_path, gz_sha256)
+    index_state = index.state
 
+    try:
+        # Survivors go straight to disk; only the count is kept in memory.
+        if args.stage:
+            source: _GzipLines | _MappedLines = _MappedLines(
+                _ensure_decompressed(gz_path, gz_sha256)
+            )
+        else:
+            source = _GzipLines(gz_path)
+        with writer, closing(source):
+            scanned = _collect_sample(
+                source,
+                index,
+                int(args.threshold_per_10000),
+                int(args.max_items),
+                writer,
+                workers=int(args.workers),
+            )
+        if index.state != index_state:
+            index.save(index_path, gz_sha256)
     except Exception as e:
-        print(f"ERROR: failed to parse gz JSONL: {e}", file=sys.stderr)
+        print(f"ERROR: failed to sample gz JSONL: {e}", file=sys.stderr)
         return 1
 
-    out_sample = root / Path(args.out_sample)
-    out_meta = root / Path(args.out_meta)
-
     try:
-        _write_jsonl(out_sample, picked, force=bool(args.force_write))
         meta = {
             "source_url": args.url,
-            "fetched_at_utc": dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+            "fetched_at_utc": dt.datetime.now(dt.UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "cached_gz_path": str(gz_path.relative_to(root)),
             "cached_gz_sha256": gz_sha256,
             "cached_gz_bytes": gz_bytes,
             "sample_max_items": int(args.max_items),
             "sample_threshold_per_10000": int(args.threshold_per_10000),
-            "sample_items_written": len(picked),
+            "sample_items_written": writer.written,
             "lines_scanned_until_stop": scanned,
             "notes": "Sample selection is deterministic by hash(ocid).",
         }
@@ -300,7 +762,7 @@ def main(argv: list[str] | None = None) -> int:
 
     print(
         json.dumps(
-            {"ok": True, "sample_items_written": len(picked), "out_sample": str(out_sample)},
+            {"ok": True, "sample_items_written": writer.written, "out_sample": str(out_sample)},
             indent=2,
         )
     )
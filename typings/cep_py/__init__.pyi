@@ -15,6 +15,7 @@ from typing import Any, Final
 # ---- CEP builders (JSON-in, JSON-out) ----------------------------------------
 
 def build_entity_json(input_json: str) -> str: ...
+def build_entity_dict(raw: dict[str, Any]) -> dict[str, Any]: ...
 def build_exchange_json(input_json: str) -> str: ...
 def build_relationship_json(input_json: str) -> str: ...
 def build_ctag_json(input_json: str) -> str: ...
@@ -27,6 +28,12 @@ def apply_localization_name_detailed_json_py(*args: Any, **kwargs: Any) -> Any:
 def normalize_legal_name_py(*args: Any, **kwargs: Any) -> str: ...
 def normalize_address_py(*args: Any, **kwargs: Any) -> str: ...
 def normalize_registration_date_py(*args: Any, **kwargs: Any) -> str: ...
+def apply_localization_name(name: str, jurisdiction: str) -> str: ...
+def apply_localization_name_detailed_json(name: str, jurisdiction: str) -> str: ...
+def apply_localization_name_detailed(name: str, jurisdiction: str) -> dict[str, Any]: ...
+def apply_localization_names(names: list[str], jurisdiction: str) -> list[str]: ...
+def localize_name_with_snfei(name: str, jurisdiction: str) -> tuple[str, str]: ...
+def localize_names_with_snfei(pairs: list[tuple[str, str]]) -> list[tuple[str, str]]: ...
 
 # ---- SNFEI (core pipeline) ---------------------------------------------------
 
@@ -36,6 +43,21 @@ def generate_snfei(
     address: str | None = ...,
     registration_date: str | None = ...,
 ) -> str: ...
+def generate_snfei_batch(
+    rows: list[tuple[str, str, str | None, str | None]],
+) -> list[str]: ...
+def generate_snfei_full(
+    legal_name: str,
+    country_code: str,
+    address: str | None = ...,
+    registration_date: str | None = ...,
+) -> tuple[str, str, str | None, str, str | None]: ...
+def compute_snfei(
+    legal_name_normalized: str,
+    country_code: str,
+    address_normalized: str | None = ...,
+    registration_date: str | None = ...,
+) -> str: ...
 def generate_snfei_detailed_json(
     legal_name: str,
     country_code: str,
@@ -67,6 +89,7 @@ def normalize_registration_date(value: str) -> str | None: ...
 __all__: Final[list[str]] = [
     # builders
     "build_entity_json",
+    "build_entity_dict",
     "build_exchange_json",
     "build_relationship_json",
     "build_ctag_json",
@@ -74,12 +97,21 @@ __all__: Final[list[str]] = [
     "apply_localization_name_py",
     "apply_localization_name_detailed_py",
     "apply_localization_name_detailed_json_py",
+    "apply_localization_name",
+    "apply_localization_name_detailed_json",
+    "apply_localization_name_detailed",
+    "apply_localization_names",
+    "localize_name_with_snfei",
+    "localize_names_with_snfei",
     # normalizers
     "normalize_legal_name",
     "normalize_address",
     "normalize_registration_date",
     # snfei
     "generate_snfei",
+    "generate_snfei_batch",
+    "generate_snfei_full",
+    "compute_snfei",
     "generate_snfei_detailed",
     "generate_snfei_detailed_json",
 ]